@@ -0,0 +1,113 @@
+"""캐시 코덱의 페이로드 크기와 인코딩/디코딩 시간을 비교하는 벤치마크입니다.
+
+사용법:
+    python scripts/bench_cache_codec.py [--messages 40] [--repeat 200]
+
+설치되지 않은 직렬화/압축 방식은 건너뜁니다.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.cache.codec import CacheCodec  # noqa: E402
+
+WORDS = (
+    "에이전트 검색 문서 요약 응답 모델 토큰 컨텍스트 사용자 질문 답변 결과 "
+    "the agent retrieved documents and summarized context for the user query "
+    "with citations from the knowledge base and follow up suggestions"
+).split()
+
+
+def make_conversation(messages: int, seed: int = 0) -> Dict[str, Any]:
+    """실제 대화 목록과 비슷한 페이로드를 만듭니다.
+
+    Args:
+        messages: 메시지 수
+        seed: 난수 시드
+
+    Returns:
+        대화 페이로드
+    """
+    rng = random.Random(seed)
+    items: List[Dict[str, Any]] = []
+    for index in range(messages):
+        role = "user" if index % 2 == 0 else "assistant"
+        length = rng.randint(10, 40) if role == "user" else rng.randint(120, 600)
+        items.append(
+            {
+                "id": f"msg-{index:06d}",
+                "role": role,
+                "content": " ".join(rng.choice(WORDS) for _ in range(length)),
+                "created_at": f"2024-03-20T00:{index % 60:02d}:00Z",
+                "metadata": {
+                    "model": "gpt-4o-mini",
+                    "prompt_tokens": rng.randint(100, 4000),
+                    "completion_tokens": rng.randint(10, 800),
+                    "sources": [f"doc-{rng.randint(1, 9999)}" for _ in range(3)],
+                },
+            }
+        )
+    return {"conversation_id": "conv-0001", "user_id": "user-0001", "messages": items}
+
+
+def bench(codec: CacheCodec, payload: Any, repeat: int) -> Dict[str, float]:
+    """코덱 하나의 크기와 평균 처리 시간을 측정합니다.
+
+    Args:
+        codec: 측정할 코덱
+        payload: 인코딩할 값
+        repeat: 반복 횟수
+
+    Returns:
+        크기(바이트)와 평균 인코딩/디코딩 시간(마이크로초)
+    """
+    encoded = codec.encode(payload)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        encoded = codec.encode(payload)
+    encode_us = (time.perf_counter() - started) / repeat * 1e6
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        codec.decode(encoded)
+    decode_us = (time.perf_counter() - started) / repeat * 1e6
+    return {"size": len(encoded), "encode_us": encode_us, "decode_us": decode_us}
+
+
+def main() -> None:
+    """벤치마크를 실행하고 결과 표를 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--messages", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = make_conversation(args.messages)
+    baseline = len(json.dumps(payload).encode())
+    print(f"대화 메시지 {args.messages}개, 기존 json.dumps 크기 {baseline} 바이트\n")
+    print(f"{'codec':<18}{'size':>10}{'ratio':>8}{'encode µs':>12}{'decode µs':>12}")
+
+    for serializer in ("json", "msgpack"):
+        for compression in ("none", "zlib", "zstd", "lz4"):
+            try:
+                codec = CacheCodec(serializer, compression, compress_threshold=1024)
+            except ValueError:
+                continue
+            result = bench(codec, payload, args.repeat)
+            print(
+                f"{serializer + '+' + compression:<18}"
+                f"{result['size']:>10}"
+                f"{result['size'] / baseline:>8.2f}"
+                f"{result['encode_us']:>12.1f}"
+                f"{result['decode_us']:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
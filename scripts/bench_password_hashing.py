@@ -0,0 +1,111 @@
+"""비밀번호 검증이 이벤트 루프 지연에 주는 영향을 비교하는 벤치마크입니다.
+
+10ms마다 깨어나는 작업으로 이벤트 루프 지연(예정보다 늦게 깨어난 시간)을 측정하면서
+동시 로그인 ``--logins``개를 처리합니다. 이벤트 루프에서 직접 bcrypt를 실행하는
+경우와 ``PasswordHasher``로 작업자 풀에서 실행하는 경우를 비교합니다.
+
+사용법:
+    python scripts/bench_password_hashing.py [--logins 20] [--rounds 12] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+TICK = 0.01
+
+
+async def measure(
+    verify: Callable[[str, str], Awaitable[bool]],
+    hashed: str,
+    logins: int,
+) -> Dict[str, float]:
+    """동시 로그인을 처리하는 동안의 이벤트 루프 지연을 측정합니다.
+
+    Args:
+        verify: 비밀번호 검증 함수
+        hashed: 검증할 해시
+        logins: 동시 로그인 수
+
+    Returns:
+        초당 로그인 수와 이벤트 루프 지연 p50/p99/최대값(밀리초)
+    """
+    lags: List[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            expected = time.perf_counter() + TICK
+            await asyncio.sleep(TICK)
+            lags.append(max(time.perf_counter() - expected, 0.0))
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK * 2)
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(verify("correct horse", hashed) for _ in range(logins))
+    )
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticking
+    assert all(results)
+
+    lags.sort()
+    return {
+        "rate": logins / elapsed,
+        "p50": lags[len(lags) // 2] * 1000,
+        "p99": lags[min(int(len(lags) * 0.99), len(lags) - 1)] * 1000,
+        "max": lags[-1] * 1000,
+    }
+
+
+async def main() -> None:
+    """벤치마크를 실행하고 결과 표를 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    # 설정은 가져올 때 읽히므로 모듈을 가져오기 전에 라운드를 지정합니다.
+    os.environ["PASSWORD_BCRYPT_ROUNDS"] = str(args.rounds)
+    from src.security.password import PasswordHasher, pwd_context
+
+    hashed = pwd_context.hash("correct horse")
+
+    async def blocking(password: str, hashed: str) -> bool:
+        return pwd_context.verify(password, hashed)
+
+    print(f"bcrypt 라운드 {args.rounds}, 동시 로그인 {args.logins}개\n")
+    print(
+        f"{'mode':<18}{'logins/s':>10}{'lag p50 ms':>12}{'lag p99 ms':>12}{'lag max ms':>12}"
+    )
+    modes = [("event loop", blocking, None)]
+    for executor in ("thread", "process"):
+        hasher = PasswordHasher(
+            max_workers=args.workers,
+            max_pending=args.logins,
+            executor=executor,
+        )
+        modes.append((f"{executor} x{args.workers}", hasher.verify, hasher))
+
+    for name, verify, hasher in modes:
+        if hasher is not None:
+            # 작업자 시작 비용이 결과에 섞이지 않도록 먼저 한 번 실행합니다.
+            await hasher.verify("correct horse", hashed)
+        result = await measure(verify, hashed, args.logins)
+        if hasher is not None:
+            hasher.shutdown()
+        print(
+            f"{name:<18}{result['rate']:>10.1f}{result['p50']:>12.1f}"
+            f"{result['p99']:>12.1f}{result['max']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
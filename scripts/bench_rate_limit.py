@@ -0,0 +1,189 @@
+"""요청 제한 알고리즘의 처리량, 결정 지연 시간, 초과 허용 오차를 비교하는 벤치마크입니다.
+
+가상 시계를 사용하여 ``--clients``개 클라이언트가 한도의 ``--load``배로 요청하는
+상황을 만들고, 매 시점의 요청 ``--concurrency``개를 동시에 보냅니다. 초과 허용 오차는 클라이언트마다 길이가 한 기간인 임의의 구간에서
+허용된 요청 수가 한도를 넘은 최대 비율입니다.
+
+``--redis-url``을 지정하면 같은 부하를 실제 Redis 구현에도 보냅니다. 이때는 실제
+시각을 사용하므로 부하를 보내는 데 걸리는 시간만큼 실행됩니다.
+
+사용법:
+    python scripts/bench_rate_limit.py [--requests 20000] [--concurrency 200]
+    python scripts/bench_rate_limit.py --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from bisect import bisect_left
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.security.rate_limit.algorithms import RATE_LIMIT_SCRIPTS  # noqa: E402
+from src.security.rate_limit.base import RateLimiter, rate_limit_key  # noqa: E402
+from src.security.rate_limit.memory import InMemoryRateLimiter  # noqa: E402
+
+
+class VirtualClock:
+    """벤치마크가 직접 진행시키는 시계입니다."""
+
+    def __init__(self):
+        """시계를 0초에서 시작합니다."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """현재 시각(초)을 반환합니다."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """시계를 진행시킵니다."""
+        self.now += seconds
+
+
+def client_hosts(clients: int) -> List[str]:
+    """시뮬레이션할 클라이언트 IP 목록을 만듭니다."""
+    return [f"10.0.{index // 256}.{index % 256}" for index in range(clients)]
+
+
+def over_admission(timestamps: List[float], limit: int, period: float) -> float:
+    """길이가 한 기간인 임의의 구간에서 한도를 초과해 허용된 최대 비율을 구합니다.
+
+    Args:
+        timestamps: 허용된 요청 시각(초, 오름차순)
+        limit: 기간당 허용 요청 수
+        period: 제한 기간(초)
+
+    Returns:
+        초과 허용 비율 (0이면 한도를 지킴)
+    """
+    worst = 0
+    for index, started in enumerate(timestamps):
+        count = bisect_left(timestamps, started + period) - index
+        worst = max(worst, count)
+    return max(worst - limit, 0) / limit
+
+
+def percentile(values: List[float], ratio: float) -> float:
+    """정렬된 값 목록의 백분위수를 반환합니다."""
+    return values[min(int(len(values) * ratio), len(values) - 1)]
+
+
+async def run(
+    limiter: RateLimiter,
+    clock: Callable[[], float],
+    advance: Optional[Callable[[float], None]],
+    args: argparse.Namespace,
+) -> Dict[str, float]:
+    """요청 제한 구현 하나에 부하를 보내고 결과를 측정합니다.
+
+    Args:
+        limiter: 측정할 요청 제한 구현
+        clock: 요청 시각(초)을 읽는 함수
+        advance: 가상 시계를 진행시키는 함수 (실제 시각이면 None)
+        args: 명령행 인자
+
+    Returns:
+        초당 결정 수, p50/p99 결정 지연 시간(마이크로초), 허용 비율, 최대 초과 허용 오차
+    """
+    requests = [
+        SimpleNamespace(client=SimpleNamespace(host=host))
+        for host in client_hosts(args.clients)
+    ]
+    batches = max(args.requests // args.concurrency, 1)
+    duration = args.requests / args.clients / (args.limit * args.load) * args.period
+    interval = duration / batches
+    latencies: List[float] = []
+    admitted: Dict[str, List[float]] = {request.client.host: [] for request in requests}
+
+    async def decide(request: SimpleNamespace) -> None:
+        started = time.perf_counter()
+        result = await limiter.check(request)
+        latencies.append(time.perf_counter() - started)
+        if result.allowed:
+            admitted[request.client.host].append(clock())
+
+    total_started = time.perf_counter()
+    for batch in range(batches):
+        batch_started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                decide(requests[(batch * args.concurrency + index) % args.clients])
+                for index in range(args.concurrency)
+            )
+        )
+        if advance is not None:
+            advance(interval)
+        else:
+            await asyncio.sleep(
+                max(interval - (time.perf_counter() - batch_started), 0)
+            )
+    elapsed = time.perf_counter() - total_started
+
+    latencies.sort()
+    allowed = sum(len(timestamps) for timestamps in admitted.values())
+    error = max(
+        over_admission(timestamps, args.limit, args.period)
+        for timestamps in admitted.values()
+    )
+    return {
+        "rate": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.50) * 1e6,
+        "p99": percentile(latencies, 0.99) * 1e6,
+        "allowed": allowed / len(latencies),
+        "error": error,
+    }
+
+
+async def main() -> None:
+    """벤치마크를 실행하고 결과 표를 출력합니다."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--period", type=int, default=1)
+    parser.add_argument("--load", type=float, default=3.0, help="한도 대비 요청 비율")
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+    print(
+        f"요청 {args.requests}개, 동시 {args.concurrency}개, 클라이언트 {args.clients}개, "
+        f"한도 {args.limit}/{args.period}s, 부하 {args.load:.1f}배\n"
+    )
+    print(
+        f"{'backend':<9}{'algorithm':<16}{'decisions/s':>13}{'p50 µs':>10}"
+        f"{'p99 µs':>10}{'allowed':>9}{'over-admit':>12}"
+    )
+
+    for algorithm in RATE_LIMIT_SCRIPTS:
+        clock = VirtualClock()
+        memory = InMemoryRateLimiter(args.limit, args.period, algorithm, clock=clock)
+        results = [("memory", await run(memory, clock, clock.advance, args))]
+        if args.redis_url:
+            from src.security.rate_limit.redis import RedisRateLimiter
+
+            limiter = RedisRateLimiter(
+                args.redis_url, args.limit, args.period, algorithm
+            )
+            client = await limiter._get_redis()
+            await client.delete(
+                *(
+                    rate_limit_key(host, algorithm)
+                    for host in client_hosts(args.clients)
+                )
+            )
+            results.append(("redis", await run(limiter, time.time, None, args)))
+            await client.aclose()
+
+        for name, result in results:
+            print(
+                f"{name:<9}{algorithm:<16}{result['rate']:>13,.0f}{result['p50']:>10.1f}"
+                f"{result['p99']:>10.1f}{result['allowed']:>9.1%}{result['error']:>12.1%}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
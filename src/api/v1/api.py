@@ -1,8 +1,9 @@
 """API 라우터를 통합하는 모듈입니다."""
 
 from fastapi import APIRouter
-from .endpoints import chat
+from .endpoints import admin, chat
 
 api_router = APIRouter()
 
-api_router.include_router(chat.router, prefix="/v1", tags=["chat"]) 
\ No newline at end of file
+api_router.include_router(chat.router, prefix="/v1", tags=["chat"])
+api_router.include_router(admin.router, prefix="/v1/admin", tags=["admin"])
@@ -0,0 +1,31 @@
+"""관리자용 엔드포인트 모듈입니다."""
+
+from typing import Annotated, Any, Dict
+
+from fastapi import APIRouter, Depends, Query
+
+from ....cache.metrics import key_usage_report
+from ....core.dependencies import get_current_admin_user
+from ....core.types import TokenData
+from ....security.routes import route_policy
+
+router = APIRouter()
+
+
+@router.get("/cache/top-keys")
+@route_policy(scopes=["admin"], cache_ttl=0)
+async def cache_top_keys(
+    _: Annotated[TokenData, Depends(get_current_admin_user)],
+    limit: int = Query(20, ge=1, le=500),
+) -> Dict[str, Any]:
+    """캐시별로 적중 횟수와 메모리 사용량이 가장 큰 키 목록을 반환합니다.
+
+    값은 이 워커 프로세스가 관찰한 근사치입니다.
+
+    Args:
+        limit: 캐시별 최대 키 수
+
+    Returns:
+        Dict[str, Any]: 캐시 이름별 ``by_hits``, ``by_memory`` 목록
+    """
+    return key_usage_report(limit)
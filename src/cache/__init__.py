@@ -1,7 +1,26 @@
 """캐시 시스템을 제공하는 패키지입니다."""
 
-from .base import BaseCache
+from .base import BaseCache, CacheStats
+from .codec import CacheCodec
+from .keys import CacheKeyBuilder
 from .memory import MemoryCache
-from .redis import RedisCache
+from .redis import RedisCache, close_connection_pools, get_connection_pool
+from .shm import SharedMemoryCache
+from .singleflight import SingleFlight
+from .tiered import TieredCache
+from .warmup import CacheWarmer
 
-__all__ = ["BaseCache", "MemoryCache", "RedisCache"]
+__all__ = [
+    "BaseCache",
+    "CacheCodec",
+    "CacheKeyBuilder",
+    "CacheStats",
+    "CacheWarmer",
+    "MemoryCache",
+    "RedisCache",
+    "SharedMemoryCache",
+    "SingleFlight",
+    "TieredCache",
+    "close_connection_pools",
+    "get_connection_pool",
+]
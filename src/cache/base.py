@@ -1,7 +1,29 @@
 """캐시 시스템의 기본 인터페이스를 정의하는 모듈입니다."""
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats(BaseModel):
+    """캐시 인스턴스의 통계 모델입니다."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """캐시 적중률을 반환합니다."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
 
 
 class BaseCache(ABC):
@@ -13,8 +35,21 @@ class BaseCache(ABC):
         pass
 
     @abstractmethod
-    async def set(self, key: str, value: Any, expire: int = 300) -> None:
-        """데이터를 캐시에 저장합니다."""
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """데이터를 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            expire: 캐시 만료 시간 (초)
+            tags: 항목을 등록할 태그 목록 (예: ``user:{id}``, ``route:/documents``)
+        """
         pass
 
     @abstractmethod
@@ -22,9 +57,76 @@ class BaseCache(ABC):
         """캐시에서 데이터를 삭제합니다."""
         pass
 
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키의 데이터를 한 번에 조회합니다.
+
+        기본 구현은 키마다 ``get``을 호출하므로, 왕복을 줄일 수 있는 캐시는
+        이 메서드를 재정의해야 합니다.
+
+        Args:
+            keys: 조회할 키 목록
+
+        Returns:
+            캐시에 있는 키와 값의 딕셔너리 (없는 키는 제외)
+        """
+        result = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """여러 데이터를 한 번에 캐시에 저장합니다.
+
+        Args:
+            mapping: 저장할 키와 값의 딕셔너리
+            expire: 캐시 만료 시간 (초)
+            tags: 모든 항목을 등록할 태그 목록
+        """
+        tags = list(tags or ())
+        for key, value in mapping.items():
+            await self.set(key, value, expire=expire, tags=tags)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """여러 키의 데이터를 한 번에 삭제합니다.
+
+        Args:
+            keys: 삭제할 키 목록
+        """
+        for key in keys:
+            await self.delete(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그에 등록된 항목을 모두 삭제합니다.
+
+        기본 구현은 태그 색인이 없으므로 아무것도 삭제하지 않고 경고만 남기며,
+        항목은 만료 시간이 지나면 사라집니다. 태그를 색인하는 캐시는 이 메서드를
+        재정의해야 합니다.
+
+        Args:
+            tags: 무효화할 태그 목록
+
+        Returns:
+            삭제한 키 목록
+        """
+        tags = list(tags)
+        if tags:
+            logger.warning(
+                "%s은 태그 무효화를 지원하지 않아 만료 시간까지 항목이 남습니다: %s",
+                type(self).__name__,
+                tags,
+            )
+        return []
+
     @abstractmethod
     async def clear(self) -> None:
-        """캐시를 모두 삭제합니다."""
+        """이 캐시 네임스페이스의 항목을 모두 삭제합니다."""
         pass
 
     @abstractmethod
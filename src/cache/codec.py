@@ -0,0 +1,219 @@
+"""캐시 값의 직렬화와 압축을 담당하는 모듈입니다.
+
+인코딩된 값의 첫 바이트는 직렬화 방식과 압축 방식을 나타내는 헤더입니다.
+헤더 값은 제어 문자 구간(0x04~0x0B)을 사용합니다. 이전 항목은 ``json.dumps``
+출력이므로 공백이나 제어 문자로 시작하지 않아, 헤더가 없는 이전 JSON 항목도
+그대로 읽을 수 있습니다.
+"""
+
+import json
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from ..core.settings import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - 선택 의존성
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - 선택 의존성
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - 선택 의존성
+    lz4_frame = None
+
+_SERIALIZERS = {"json": 1, "msgpack": 2}
+_COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2, "lz4": 3}
+# 사용 중인 헤더 바이트 범위 (직렬화 방식 x 4 + 압축 방식)
+_MIN_HEADER = min(_SERIALIZERS.values()) * 4
+_MAX_HEADER = max(_SERIALIZERS.values()) * 4 + max(_COMPRESSIONS.values())
+
+_Serializer = Tuple[Callable[[Any], bytes], Callable[[bytes], Any]]
+_Compressor = Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]
+
+
+def _json_serializer() -> _Serializer:
+    """JSON 직렬화 함수를 반환합니다. orjson이 있으면 우선 사용합니다."""
+    if orjson is not None:
+        return orjson.dumps, orjson.loads
+    return (
+        lambda value: json.dumps(value, separators=(",", ":")).encode(),
+        # 공유 메모리 캐시는 memoryview를 넘기므로 bytes로 바꿔 읽습니다.
+        lambda data: json.loads(bytes(data)),
+    )
+
+
+def _msgpack_serializer() -> _Serializer:
+    """직렬화 함수(MessagePack)를 반환합니다."""
+    if msgpack is None:
+        raise ValueError("msgpack 직렬화를 사용하려면 msgpack 패키지가 필요합니다.")
+    return (
+        lambda value: msgpack.packb(value, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False),
+    )
+
+
+def _zstd_compressor() -> _Compressor:
+    """압축 함수(zstd)를 반환합니다."""
+    if zstandard is None:
+        raise ValueError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다.")
+    compressor = zstandard.ZstdCompressor(level=3)
+    decompressor = zstandard.ZstdDecompressor()
+    return compressor.compress, decompressor.decompress
+
+
+def _lz4_compressor() -> _Compressor:
+    """lz4 압축 함수를 반환합니다."""
+    if lz4_frame is None:
+        raise ValueError("lz4 압축을 사용하려면 lz4 패키지가 필요합니다.")
+    return lz4_frame.compress, lz4_frame.decompress
+
+
+_SERIALIZER_FACTORIES: Dict[int, Callable[[], _Serializer]] = {
+    1: _json_serializer,
+    2: _msgpack_serializer,
+}
+
+_COMPRESSOR_FACTORIES: Dict[int, Callable[[], _Compressor]] = {
+    0: lambda: (bytes, bytes),
+    1: lambda: (lambda data: zlib.compress(data, 6), zlib.decompress),
+    2: _zstd_compressor,
+    3: _lz4_compressor,
+}
+
+
+class CacheCodec:
+    """캐시 값을 바이트로 인코딩/디코딩하는 클래스입니다."""
+
+    def __init__(
+        self,
+        serializer: Optional[str] = None,
+        compression: Optional[str] = None,
+        compress_threshold: Optional[int] = None,
+    ):
+        """코덱을 초기화합니다.
+
+        Args:
+            serializer: 직렬화 방식 (json, msgpack)
+            compression: 압축 방식 (none, zlib, zstd, lz4)
+            compress_threshold: 압축을 적용할 최소 크기 (바이트)
+
+        Raises:
+            ValueError: 지원하지 않거나 설치되지 않은 방식인 경우
+        """
+        settings = get_settings()
+        serializer = serializer or settings.CACHE_SERIALIZER
+        compression = compression or settings.CACHE_COMPRESSION
+        if serializer not in _SERIALIZERS:
+            raise ValueError(f"지원하지 않는 직렬화 방식입니다: {serializer}")
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+
+        self.serializer = serializer
+        self.compression = compression
+        self.compress_threshold = (
+            settings.CACHE_COMPRESS_THRESHOLD
+            if compress_threshold is None
+            else compress_threshold
+        )
+
+        self._serializer_id = _SERIALIZERS[serializer]
+        self._compression_id = _COMPRESSIONS[compression]
+        self._dumps, _ = _SERIALIZER_FACTORIES[self._serializer_id]()
+        self._compress, _ = _COMPRESSOR_FACTORIES[self._compression_id]()
+        # 디코딩용 함수는 다른 설정으로 저장된 항목을 위해 필요할 때 만듭니다.
+        self._loads: Dict[int, Callable[[bytes], Any]] = {}
+        self._decompress: Dict[int, Callable[[bytes], bytes]] = {}
+
+    def encode(self, value: Any) -> bytes:
+        """값을 헤더가 붙은 바이트로 인코딩합니다.
+
+        Args:
+            value: 인코딩할 값
+
+        Returns:
+            인코딩된 바이트
+        """
+        payload = self._dumps(value)
+        compression_id = 0
+        if self._compression_id and len(payload) >= self.compress_threshold:
+            compressed = self._compress(payload)
+            # 압축 효과가 없으면 원본을 저장합니다.
+            if len(compressed) < len(payload):
+                payload = compressed
+                compression_id = self._compression_id
+        return bytes((_header(self._serializer_id, compression_id),)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """인코딩된 바이트를 값으로 디코딩합니다.
+
+        Args:
+            data: 인코딩된 바이트 (헤더가 없으면 JSON 텍스트로 간주)
+
+        Returns:
+            디코딩된 값
+        """
+        if isinstance(data, str):
+            return json.loads(data)
+        if not data or not _MIN_HEADER <= data[0] <= _MAX_HEADER:
+            # 헤더가 없는 이전 형식의 JSON 항목
+            return json.loads(data)
+
+        serializer_id, compression_id = divmod(data[0], 4)
+        payload = data[1:]
+        if compression_id:
+            payload = self._get_decompressor(compression_id)(payload)
+        return self._get_loads(serializer_id)(payload)
+
+    def _get_loads(self, serializer_id: int) -> Callable[[bytes], Any]:
+        """직렬화 방식에 맞는 역직렬화 함수를 가져옵니다.
+
+        Args:
+            serializer_id: 직렬화 방식 번호
+
+        Returns:
+            역직렬화 함수
+        """
+        loads = self._loads.get(serializer_id)
+        if loads is None:
+            _, loads = _SERIALIZER_FACTORIES[serializer_id]()
+            self._loads[serializer_id] = loads
+        return loads
+
+    def _get_decompressor(self, compression_id: int) -> Callable[[bytes], bytes]:
+        """압축 방식에 맞는 압축 해제 함수를 가져옵니다.
+
+        Args:
+            compression_id: 압축 방식 번호
+
+        Returns:
+            압축 해제 함수
+        """
+        decompress = self._decompress.get(compression_id)
+        if decompress is None:
+            _, decompress = _COMPRESSOR_FACTORIES[compression_id]()
+            self._decompress[compression_id] = decompress
+        return decompress
+
+
+def _header(serializer_id: int, compression_id: int) -> int:
+    """헤더 바이트를 계산합니다.
+
+    Args:
+        serializer_id: 직렬화 방식 번호 (1~2)
+        compression_id: 압축 방식 번호 (0~3)
+
+    Returns:
+        헤더 바이트 값 (4~11)
+    """
+    return serializer_id * 4 + compression_id
@@ -0,0 +1,235 @@
+"""정규화된 캐시 키를 만드는 모듈입니다."""
+
+import hashlib
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from starlette.requests import Request
+
+from ..core.settings import get_settings
+
+# 보안 패키지가 코어 패키지를 거쳐 이 모듈을 다시 가져오므로, 순환 참조가 되지
+# 않도록 모듈 단위로 가져와 호출 시점에 등록부를 찾습니다.
+from ..security import routes as route_policies
+
+
+def canonical_query(
+    items: Iterable[Tuple[str, str]],
+    ignore_params: Iterable[str] = (),
+) -> str:
+    """쿼리 파라미터를 순서와 무관한 문자열로 정규화합니다.
+
+    Args:
+        items: (이름, 값) 쌍 목록 (같은 이름이 여러 번 나올 수 있음)
+        ignore_params: 키에서 제외할 파라미터 이름
+
+    Returns:
+        정렬된 쿼리 문자열 (예: ``?b=2&a=1`` → ``a=1&b=2``)
+    """
+    ignored = set(ignore_params)
+    normalized = sorted(
+        (name.strip(), value.strip()) for name, value in items if name not in ignored
+    )
+    return urlencode(normalized)
+
+
+def digest(value: str) -> str:
+    """문자열의 고정 길이 해시를 반환합니다.
+
+    Args:
+        value: 해시할 문자열
+
+    Returns:
+        32자리 16진수 해시
+    """
+    return hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+
+def route_tag(path: str) -> str:
+    """경로 단위 무효화에 사용하는 태그를 반환합니다.
+
+    Args:
+        path: 요청 경로
+
+    Returns:
+        ``route:{path}`` 형식의 태그
+    """
+    return f"route:{path}"
+
+
+def key_namespace(key: str) -> str:
+    """메트릭 레이블로 사용할 키 네임스페이스를 반환합니다.
+
+    전체 키나 원래 경로를 레이블로 쓰면 시계열 수가 끝없이 늘어나므로, 요청 키는
+    일치하는 라우트의 경로 템플릿을, 일반 키는 첫 ``:`` 앞부분만 사용합니다.
+
+    Args:
+        key: 캐시 키
+
+    Returns:
+        키 네임스페이스 (예: ``GET:/api/v1/documents/1:`` → ``/api/v1/documents/{document_id}``,
+        일치하는 라우트가 없으면 ``unmatched``)
+    """
+    head = key.split("#", 1)[0]
+    method, separator, rest = head.partition(":")
+    if separator and method.isupper() and rest.startswith("/"):
+        head = rest.split(":", 1)[0]
+    if head.startswith("/"):
+        return route_policies.route_registry.template(head) or "unmatched"
+    if separator:
+        return method
+    return "default"
+
+
+class CacheKeyBuilder:
+    """요청으로부터 정규화된 캐시 키를 만드는 클래스입니다.
+
+    키는 ``{method}:{path}:{query}[:{vary}]`` 형식이며, 쿼리 파라미터는 정렬되고
+    ``max_length``를 넘는 키는 경로를 남긴 채 나머지를 해시로 줄입니다.
+    인증된 요청은 기본적으로 사용자(또는 토큰) 단위로 키가 나뉘며,
+    ``shared_prefixes``에 속한 경로만 사용자 간에 캐시를 공유합니다.
+    """
+
+    def __init__(
+        self,
+        vary_headers: Optional[Sequence[str]] = None,
+        route_vary_headers: Optional[Mapping[str, Sequence[str]]] = None,
+        shared_prefixes: Optional[Sequence[str]] = None,
+        ignore_params: Optional[Sequence[str]] = None,
+        max_length: Optional[int] = None,
+    ):
+        """캐시 키 생성기를 초기화합니다.
+
+        Args:
+            vary_headers: 모든 경로에서 키에 포함할 요청 헤더
+            route_vary_headers: 경로 접두사별로 추가로 키에 포함할 요청 헤더
+            shared_prefixes: 인증 주체와 무관하게 캐시를 공유할 경로 접두사
+            ignore_params: 키에서 제외할 쿼리 파라미터 (캐시 버스터 등)
+            max_length: 해시로 줄이기 전 키의 최대 길이
+        """
+        settings = get_settings()
+        self.vary_headers = [
+            header.lower()
+            for header in (
+                settings.CACHE_VARY_HEADERS if vary_headers is None else vary_headers
+            )
+        ]
+        self.route_vary_headers: Dict[str, List[str]] = {
+            prefix: [header.lower() for header in headers]
+            for prefix, headers in (route_vary_headers or {}).items()
+        }
+        self.shared_prefixes = list(shared_prefixes or ())
+        self.ignore_params = (
+            settings.CACHE_IGNORED_QUERY_PARAMS
+            if ignore_params is None
+            else ignore_params
+        )
+        self.max_length = max_length or settings.CACHE_KEY_MAX_LENGTH
+
+    def build(self, request: Request) -> str:
+        """요청의 캐시 키를 만듭니다.
+
+        Args:
+            request: 요청 객체
+
+        Returns:
+            캐시 키
+        """
+        path = request.url.path
+        parts = [
+            request.method,
+            path,
+            canonical_query(request.query_params.multi_items(), self.ignore_params),
+        ]
+
+        vary = [
+            f"{header}={request.headers.get(header, '')}"
+            for header in self._headers_for(path)
+        ]
+        if self.is_private(request):
+            vary.append(f"sub={self._subject(request)}")
+        if vary:
+            parts.append("&".join(vary))
+
+        return self.shorten(":".join(parts), path)
+
+    def is_private(self, request: Request) -> bool:
+        """요청의 응답이 인증 주체별로 캐시되는지 확인합니다.
+
+        Args:
+            request: 요청 객체
+
+        Returns:
+            키에 인증 주체가 포함되면 True
+        """
+        return self._subject(request) is not None and not self._is_shared(
+            request.url.path
+        )
+
+    def shorten(self, key: str, path: str) -> str:
+        """너무 긴 키를 경로 접두사와 해시로 줄입니다.
+
+        경로를 남겨 두어 키 네임스페이스별 집계와 경로 단위 무효화를 유지합니다.
+
+        Args:
+            key: 원래 키
+            path: 요청 경로
+
+        Returns:
+            ``max_length`` 이하의 키
+        """
+        if len(key) <= self.max_length:
+            return key
+        head = path[: max(self.max_length - 40, 0)]
+        return f"{head}#{digest(key)}"
+
+    def _headers_for(self, path: str) -> List[str]:
+        """경로에 적용할 vary 헤더 목록을 반환합니다.
+
+        Args:
+            path: 요청 경로
+
+        Returns:
+            헤더 이름 목록
+        """
+        headers = list(self.vary_headers)
+        for prefix, extra in self.route_vary_headers.items():
+            if path.startswith(prefix):
+                headers.extend(extra)
+        return sorted(set(headers))
+
+    def _is_shared(self, path: str) -> bool:
+        """사용자 간에 캐시를 공유하는 경로인지 확인합니다.
+
+        Args:
+            path: 요청 경로
+
+        Returns:
+            공유 경로이면 True
+        """
+        return any(path.startswith(prefix) for prefix in self.shared_prefixes)
+
+    @staticmethod
+    def _subject(request: Request) -> Optional[str]:
+        """요청의 인증 주체를 키에 쓸 수 있는 형태로 반환합니다.
+
+        인증 미들웨어가 검증한 사용자 ID나 API 키 ID를 우선 사용합니다. 검증 정보가 없으면
+        Authorization 헤더의 해시를 사용하여, 검증되지 않은 토큰의 주장만으로
+        다른 사용자의 캐시에 접근할 수 없게 합니다.
+
+        Args:
+            request: 요청 객체
+
+        Returns:
+            인증 주체, 인증 정보가 없으면 None
+        """
+        user_id = getattr(request.state, "user_id", None)
+        if user_id is not None:
+            return digest(str(user_id))
+        api_key_id = getattr(request.state, "api_key_id", None)
+        if api_key_id is not None:
+            return digest(f"key:{api_key_id}")
+        authorization = request.headers.get("authorization")
+        if authorization:
+            return digest(authorization)
+        return None
@@ -1,44 +1,358 @@
 """메모리 캐시를 제공하는 모듈입니다."""
 
+import asyncio
+import heapq
+import sys
 import time
-from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from .base import BaseCache
+from ..core.settings import get_settings
+from .base import BaseCache, CacheStats
+from .keys import key_namespace
+from .metrics import batch_namespace, get_key_usage, record_lookup, record_write, timed
+
+# (값, 만료 시각, 추정 크기)
+_Entry = Tuple[Any, float, int]
+
+
+def _estimate_size(value: Any, depth: int = 0) -> int:
+    """값이 차지하는 메모리 크기를 추정합니다.
+
+    Args:
+        value: 크기를 추정할 값
+        depth: 현재 재귀 깊이
+
+    Returns:
+        추정 크기 (바이트)
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    size = sys.getsizeof(value)
+    if depth >= 3:
+        return size
+    if isinstance(value, dict):
+        size += sum(
+            _estimate_size(k, depth + 1) + _estimate_size(v, depth + 1)
+            for k, v in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_estimate_size(item, depth + 1) for item in value)
+    return size
 
 
 class MemoryCache(BaseCache):
-    """메모리 캐시 클래스입니다."""
+    """메모리 캐시 클래스입니다.
 
-    def __init__(self):
-        """메모리 캐시를 초기화합니다."""
-        self._cache: Dict[str, Tuple[Any, float]] = {}
+    항목 수와 바이트 예산을 넘으면 가장 오래 사용되지 않은 항목(LRU)부터
+    제거하며, 백그라운드 스위퍼가 만료된 항목을 작은 배치로 정리합니다.
+    """
 
-    async def get(self, key: str) -> Optional[Any]:
-        """캐시에서 데이터를 조회합니다."""
-        if key not in self._cache:
-            return None
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        sweep_interval: Optional[float] = None,
+        sweep_batch_size: Optional[int] = None,
+        name: str = "memory",
+    ):
+        """메모리 캐시를 초기화합니다.
 
-        value, expire_time = self._cache[key]
-        if expire_time > 0 and time.time() > expire_time:
-            await self.delete(key)
-            return None
+        Args:
+            max_entries: 최대 항목 수 (0이면 무제한)
+            max_bytes: 최대 메모리 사용량 (바이트, 0이면 무제한)
+            sweep_interval: 만료 항목 정리 주기 (초, 0이면 비활성화)
+            sweep_batch_size: 한 번에 정리할 최대 항목 수
+            name: 메트릭의 ``cache`` 레이블로 사용할 이름
+        """
+        settings = get_settings()
+        self.max_entries = (
+            settings.CACHE_MEMORY_MAX_ENTRIES if max_entries is None else max_entries
+        )
+        self.max_bytes = (
+            settings.CACHE_MEMORY_MAX_BYTES if max_bytes is None else max_bytes
+        )
+        self.sweep_interval = (
+            settings.CACHE_SWEEP_INTERVAL if sweep_interval is None else sweep_interval
+        )
+        self.sweep_batch_size = sweep_batch_size or settings.CACHE_SWEEP_BATCH_SIZE
+        self.name = name
+        self._usage = get_key_usage(name)
 
-        return value
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._size_bytes = 0
+        self._sweeper: Optional[asyncio.Task] = None
+        # 태그별 키 집합과 키별 태그 목록
+        self._tags: Dict[str, Set[str]] = {}
+        self._key_tags: Dict[str, Tuple[str, ...]] = {}
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
 
-    async def set(self, key: str, value: Any, expire: int = 300) -> None:
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시에서 데이터를 조회합니다."""
+        with timed(self.name, "get", key_namespace(key)):
+            return self._lookup(key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
         """데이터를 캐시에 저장합니다."""
-        expire_time = time.time() + expire if expire > 0 else 0
-        self._cache[key] = (value, expire_time)
+        with timed(self.name, "set", key_namespace(key)):
+            self._ensure_sweeper()
+            self._store(key, value, expire, tuple(tags or ()))
+            self._evict()
 
     async def delete(self, key: str) -> None:
         """캐시에서 데이터를 삭제합니다."""
-        if key in self._cache:
-            del self._cache[key]
+        with timed(self.name, "delete", key_namespace(key)):
+            self._remove(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키의 데이터를 한 번에 조회합니다."""
+        keys = list(keys)
+        result = {}
+        with timed(self.name, "get_many", batch_namespace(keys)):
+            for key in keys:
+                value = self._lookup(key, operation="get_many")
+                if value is not None:
+                    result[key] = value
+        return result
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """여러 데이터를 한 번에 캐시에 저장합니다."""
+        with timed(self.name, "set_many", batch_namespace(mapping)):
+            self._ensure_sweeper()
+            tags = tuple(tags or ())
+            for key, value in mapping.items():
+                self._store(key, value, expire, tags)
+            self._evict()
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """여러 키의 데이터를 한 번에 삭제합니다."""
+        keys = list(keys)
+        with timed(self.name, "delete_many", batch_namespace(keys)):
+            for key in keys:
+                self._remove(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그에 등록된 항목을 모두 삭제합니다."""
+        removed = []
+        with timed(self.name, "invalidate_tags", "tags"):
+            for tag in tags:
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed.append(key)
+        return removed
 
     async def clear(self) -> None:
         """캐시를 모두 삭제합니다."""
         self._cache.clear()
+        self._expiry_heap.clear()
+        self._tags.clear()
+        self._key_tags.clear()
+        self._size_bytes = 0
+        self._usage.clear()
 
     def close(self) -> None:
         """메모리 캐시를 정리합니다."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
         self._cache.clear()
+        self._expiry_heap.clear()
+        self._tags.clear()
+        self._key_tags.clear()
+        self._size_bytes = 0
+        self._usage.clear()
+
+    def stats(self) -> CacheStats:
+        """캐시 통계를 반환합니다.
+
+        Returns:
+            적중/실패/제거 카운터와 현재 사용량
+        """
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            entries=len(self._cache),
+            size_bytes=self._size_bytes,
+        )
+
+    def _lookup(self, key: str, operation: str = "get") -> Optional[Any]:
+        """항목을 조회하고 LRU 순서와 통계를 갱신합니다.
+
+        Args:
+            key: 조회할 키
+            operation: 메트릭에 기록할 연산 이름
+
+        Returns:
+            저장된 값, 없거나 만료되었으면 None
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            record_lookup(self.name, key, False, operation=operation)
+            return None
+
+        value, expire_time, size = entry
+        if expire_time > 0 and time.monotonic() > expire_time:
+            self._remove(key)
+            self._expirations += 1
+            self._misses += 1
+            record_lookup(self.name, key, False, operation=operation)
+            return None
+
+        self._cache.move_to_end(key)
+        self._hits += 1
+        record_lookup(self.name, key, True, size, operation=operation)
+        return value
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        expire: int,
+        tags: Tuple[str, ...] = (),
+    ) -> None:
+        """항목을 저장합니다. 예산 초과 처리는 호출자가 담당합니다.
+
+        Args:
+            key: 저장할 키
+            value: 저장할 값
+            expire: 만료 시간 (초)
+            tags: 항목을 등록할 태그 목록
+        """
+        self._remove(key)
+
+        size = _estimate_size(key) + _estimate_size(value)
+        if self.max_bytes and size > self.max_bytes:
+            # 예산보다 큰 값은 저장하지 않습니다.
+            return
+
+        expire_time = time.monotonic() + expire if expire > 0 else 0
+        self._cache[key] = (value, expire_time, size)
+        self._size_bytes += size
+        record_write(self.name, key, size)
+        if expire_time:
+            heapq.heappush(self._expiry_heap, (expire_time, key))
+            # 정리 태스크가 꺼져 있어도(``sweep_interval`` 0) 힙이 계속 커지지 않게 합니다.
+            self._compact_heap()
+        if tags:
+            self._key_tags[key] = tags
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+    def _remove(self, key: str) -> None:
+        """항목을 제거하고 사용량을 갱신합니다.
+
+        Args:
+            key: 제거할 키
+        """
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[2]
+            self._untag(key)
+            self._usage.forget(key)
+
+    def _untag(self, key: str) -> None:
+        """키를 등록된 태그 집합에서 제거합니다.
+
+        Args:
+            key: 제거할 키
+        """
+        for tag in self._key_tags.pop(key, ()):
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _evict(self) -> None:
+        """예산을 초과한 만큼 LRU 항목을 제거합니다."""
+        while self._cache and (
+            (self.max_entries and len(self._cache) > self.max_entries)
+            or (self.max_bytes and self._size_bytes > self.max_bytes)
+        ):
+            key, (_, _, size) = self._cache.popitem(last=False)
+            self._size_bytes -= size
+            self._untag(key)
+            self._usage.forget(key)
+            self._evictions += 1
+
+    def _ensure_sweeper(self) -> None:
+        """실행 중인 이벤트 루프에서 스위퍼 태스크를 시작합니다."""
+        if self.sweep_interval <= 0:
+            return
+        if self._sweeper is not None and not self._sweeper.done():
+            return
+        self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+
+    async def _sweep_loop(self) -> None:
+        """주기적으로 만료된 항목을 정리합니다."""
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            await self.sweep_expired()
+
+    async def sweep_expired(self) -> int:
+        """만료된 항목을 배치 단위로 정리합니다.
+
+        배치 사이마다 이벤트 루프에 제어를 양보하므로 대량 만료가 있어도
+        다른 요청의 처리를 오래 막지 않습니다.
+
+        Returns:
+            정리된 항목 수
+        """
+        removed = 0
+        while True:
+            now = time.monotonic()
+            processed = 0
+            while (
+                self._expiry_heap
+                and self._expiry_heap[0][0] <= now
+                and processed < self.sweep_batch_size
+            ):
+                expire_time, key = heapq.heappop(self._expiry_heap)
+                processed += 1
+                entry = self._cache.get(key)
+                # 덮어쓰기로 만료 시각이 바뀐 항목은 건너뜁니다.
+                if entry is not None and entry[1] == expire_time:
+                    self._remove(key)
+                    self._expirations += 1
+                    removed += 1
+
+            if processed < self.sweep_batch_size:
+                break
+            await asyncio.sleep(0)
+
+        self._compact_heap()
+        return removed
+
+    def _compact_heap(self) -> None:
+        """덮어쓰기/삭제로 남은 오래된 힙 항목을 정리합니다.
+
+        힙이 항목 수의 두 배를 넘을 때만 다시 만들므로, 저장마다 호출해도 평균 비용은
+        상수입니다.
+        """
+        if len(self._expiry_heap) <= 2 * len(self._cache) + 1024:
+            return
+        self._expiry_heap = [
+            (expire_time, key)
+            for key, (_, expire_time, _) in self._cache.items()
+            if expire_time
+        ]
+        heapq.heapify(self._expiry_heap)
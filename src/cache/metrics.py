@@ -0,0 +1,232 @@
+"""캐시 연산의 메트릭과 키별 사용량을 기록하는 모듈입니다."""
+
+import heapq
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ..core.settings import get_settings
+from ..monitoring.metrics import (
+    CACHE_OPERATION_DURATION,
+    CACHE_OPERATIONS_TOTAL,
+    CACHE_VALUE_SIZE,
+)
+from .keys import key_namespace
+
+
+class KeyUsage:
+    """키별 적중 횟수와 값 크기를 제한된 메모리로 추적하는 클래스입니다.
+
+    추적하는 키가 ``max_keys``를 넘으면 적중 횟수는 상위 키만, 크기는 큰 키만
+    절반 남기므로 결과는 근사치입니다.
+    """
+
+    def __init__(self, max_keys: Optional[int] = None):
+        """키 사용량 추적기를 초기화합니다.
+
+        Args:
+            max_keys: 추적할 최대 키 수 (없으면 설정값 사용)
+        """
+        self.max_keys = max_keys or get_settings().CACHE_METRICS_TRACKED_KEYS
+        self._hits: Counter = Counter()
+        self._sizes: Dict[str, int] = {}
+
+    def record_hit(self, key: str) -> None:
+        """키의 적중을 기록합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        self._hits[key] += 1
+        if len(self._hits) > self.max_keys:
+            self._hits = Counter(dict(self._hits.most_common(self.max_keys // 2)))
+
+    def record_size(self, key: str, size: int) -> None:
+        """키의 값 크기를 기록합니다.
+
+        Args:
+            key: 캐시 키
+            size: 값 크기 (바이트)
+        """
+        self._sizes[key] = size
+        if len(self._sizes) > self.max_keys:
+            self._sizes = dict(
+                heapq.nlargest(
+                    self.max_keys // 2, self._sizes.items(), key=lambda item: item[1]
+                )
+            )
+
+    def forget(self, key: str) -> None:
+        """삭제된 키의 크기 기록을 제거합니다.
+
+        Args:
+            key: 캐시 키
+        """
+        self._sizes.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 기록을 제거합니다."""
+        self._hits.clear()
+        self._sizes.clear()
+
+    def top_by_hits(self, limit: int) -> List[Dict[str, Any]]:
+        """적중 횟수가 많은 키 목록을 반환합니다.
+
+        Args:
+            limit: 최대 키 수
+
+        Returns:
+            ``{"key", "hits"}`` 목록
+        """
+        return [
+            {"key": key, "hits": hits} for key, hits in self._hits.most_common(limit)
+        ]
+
+    def top_by_size(self, limit: int) -> List[Dict[str, Any]]:
+        """값 크기가 큰 키 목록을 반환합니다.
+
+        Args:
+            limit: 최대 키 수
+
+        Returns:
+            ``{"key", "size_bytes"}`` 목록
+        """
+        largest = heapq.nlargest(limit, self._sizes.items(), key=lambda item: item[1])
+        return [{"key": key, "size_bytes": size} for key, size in largest]
+
+
+# 캐시 이름별 키 사용량
+_key_usage: Dict[str, KeyUsage] = {}
+
+
+def get_key_usage(cache: str) -> KeyUsage:
+    """캐시 이름에 해당하는 키 사용량 추적기를 가져옵니다.
+
+    Args:
+        cache: 캐시 이름 (메트릭의 ``cache`` 레이블)
+
+    Returns:
+        키 사용량 추적기
+    """
+    usage = _key_usage.get(cache)
+    if usage is None:
+        usage = _key_usage[cache] = KeyUsage()
+    return usage
+
+
+def key_usage_report(limit: int = 20) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """모든 캐시의 상위 키 목록을 반환합니다.
+
+    Args:
+        limit: 캐시별 최대 키 수
+
+    Returns:
+        캐시 이름별 ``by_hits``, ``by_memory`` 목록
+    """
+    return {
+        cache: {
+            "by_hits": usage.top_by_hits(limit),
+            "by_memory": usage.top_by_size(limit),
+        }
+        for cache, usage in _key_usage.items()
+    }
+
+
+def batch_namespace(keys: Iterable[str]) -> str:
+    """여러 키에 대한 연산의 네임스페이스를 반환합니다.
+
+    Args:
+        keys: 캐시 키 목록
+
+    Returns:
+        모든 키의 네임스페이스가 같으면 그 값, 다르면 ``mixed``
+    """
+    namespaces = {key_namespace(key) for key in keys}
+    if len(namespaces) == 1:
+        return namespaces.pop()
+    return "mixed" if namespaces else "default"
+
+
+def record_lookup(
+    cache: str,
+    key: str,
+    hit: bool,
+    size: Optional[int] = None,
+    operation: str = "get",
+) -> None:
+    """조회 결과를 기록합니다.
+
+    Args:
+        cache: 캐시 이름
+        key: 캐시 키
+        hit: 적중 여부
+        size: 적중한 값의 크기 (바이트)
+        operation: 연산 이름
+    """
+    namespace = key_namespace(key)
+    CACHE_OPERATIONS_TOTAL.labels(
+        cache=cache,
+        operation=operation,
+        namespace=namespace,
+        result="hit" if hit else "miss",
+    ).inc()
+    if not hit:
+        return
+    usage = get_key_usage(cache)
+    usage.record_hit(key)
+    if size is not None:
+        usage.record_size(key, size)
+        CACHE_VALUE_SIZE.labels(cache=cache, namespace=namespace).observe(size)
+
+
+def record_write(cache: str, key: str, size: int) -> None:
+    """저장한 값의 크기를 기록합니다.
+
+    Args:
+        cache: 캐시 이름
+        key: 캐시 키
+        size: 값 크기 (바이트)
+    """
+    get_key_usage(cache).record_size(key, size)
+    CACHE_VALUE_SIZE.labels(cache=cache, namespace=key_namespace(key)).observe(size)
+
+
+def record_result(cache: str, operation: str, namespace: str, result: str) -> None:
+    """연산 결과 수를 기록합니다.
+
+    Args:
+        cache: 캐시 이름
+        operation: 연산 이름
+        namespace: 키 네임스페이스
+        result: 결과 (hit, miss, stale, error, ok)
+    """
+    CACHE_OPERATIONS_TOTAL.labels(
+        cache=cache,
+        operation=operation,
+        namespace=namespace,
+        result=result,
+    ).inc()
+
+
+@contextmanager
+def timed(cache: str, operation: str, namespace: str) -> Iterator[None]:
+    """연산 지연 시간을 기록하고, 예외가 발생하면 오류 수를 기록합니다.
+
+    Args:
+        cache: 캐시 이름
+        operation: 연산 이름
+        namespace: 키 네임스페이스
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        record_result(cache, operation, namespace, "error")
+        raise
+    finally:
+        CACHE_OPERATION_DURATION.labels(
+            cache=cache,
+            operation=operation,
+            namespace=namespace,
+        ).observe(time.perf_counter() - started)
@@ -1,19 +1,101 @@
 """캐시를 위한 미들웨어 모듈입니다."""
 
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import redis.asyncio as redis
 from fastapi import Request
+from redis.exceptions import LockError
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
+from starlette.types import Message, Scope
+
+from ..core.settings import get_settings
+from ..security.routes import RouteRegistry, route_registry
+from .base import BaseCache
+from .keys import CacheKeyBuilder, key_namespace, route_tag
+from .metrics import record_result
+from .singleflight import SingleFlight
+from .swr import is_stale, should_refresh
+from .warmup import CacheWarmer
 
-from .redis import RedisCache
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 class CacheMiddleware(BaseHTTPMiddleware):
-    """캐시를 위한 미들웨어입니다."""
+    """캐시를 위한 미들웨어입니다.
+
+    같은 키에 대한 캐시 미스가 동시에 발생하면 첫 번째 요청만 핸들러를
+    실행하고 나머지 요청은 그 결과를 함께 사용합니다. ``lock_client``를
+    지정하면 짧은 Redis 락으로 노드 간에도 계산을 한 번만 수행합니다.
+
+    신선도 기한이 지난 항목은 ``stale_ttl`` 동안 그대로 응답하고 백그라운드에서
+    갱신합니다(stale-while-revalidate). ``xfetch_beta``가 0보다 크면 기한 전에도
+    확률적으로 미리 갱신합니다.
+
+    404 응답과 빈 결과(빈 본문, ``[]``, ``{}``, ``null``)는 ``negative_ttl`` 동안만
+    짧게 캐시하여, 존재하지 않는 문서를 반복 조회해도 매번 저장소에 접근하지
+    않게 합니다.
+
+    경로 정책의 ``cache_ttl``이 있으면 그 경로의 신선도 유지 시간으로 사용하고,
+    0이면 그 경로의 응답을 캐시하지 않습니다.
+    """
+
+    # 빈 결과로 간주하는 응답 본문
+    _EMPTY_BODIES = frozenset({"", "[]", "{}", "null"})
+
+    def __init__(
+        self,
+        app,
+        cache: BaseCache,
+        expire: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        xfetch_beta: Optional[float] = None,
+        lock_client: Optional[redis.Redis] = None,
+        lock_timeout: Optional[float] = None,
+        key_builder: Optional[CacheKeyBuilder] = None,
+        negative_ttl: Optional[int] = None,
+        warmer: Optional[CacheWarmer] = None,
+        routes: Optional[RouteRegistry] = None,
+    ):
+        """캐시 미들웨어를 초기화합니다.
 
-    def __init__(self, app, cache: RedisCache):
-        """캐시 미들웨어를 초기화합니다."""
+        Args:
+            app: ASGI 애플리케이션
+            cache: 응답을 저장할 캐시
+            expire: 캐시 신선도 유지 시간 (초)
+            stale_ttl: 기한이 지난 응답을 계속 제공할 시간 (초)
+            xfetch_beta: 확률적 조기 갱신 강도 (0이면 비활성화)
+            lock_client: 노드 간 계산 중복 방지에 사용할 Redis 클라이언트
+            lock_timeout: Redis 락 유지 시간 (초)
+            key_builder: 캐시 키 생성기 (없으면 기본 설정으로 생성)
+            negative_ttl: 404/빈 결과를 캐시할 시간 (초, 0이면 비활성화)
+            warmer: 키별 접근 횟수를 기록할 캐시 워머
+            routes: 경로 정책 등록부 (없으면 공유 등록부)
+        """
         super().__init__(app)
         self.cache = cache
+        self.expire = expire or settings.CACHE_TTL
+        self.stale_ttl = settings.CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+        self.xfetch_beta = (
+            settings.CACHE_XFETCH_BETA if xfetch_beta is None else xfetch_beta
+        )
+        self.lock_client = lock_client
+        self.lock_timeout = lock_timeout or settings.CACHE_LOCK_TIMEOUT
+        self.key_builder = key_builder or CacheKeyBuilder()
+        self.negative_ttl = (
+            settings.CACHE_NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        )
+        self.warmer = warmer
+        self.routes = routes or route_registry
+        self._inflight = SingleFlight()
+        self._locks: Dict[str, Any] = {}
+        self._refreshing: Set[str] = set()
+        self._background_tasks: Set[asyncio.Task] = set()
 
     async def dispatch(self, request: Request, call_next) -> Response:
         """요청을 처리하고 캐시를 적용합니다."""
@@ -21,19 +103,416 @@ class CacheMiddleware(BaseHTTPMiddleware):
         if request.method != "GET":
             return await call_next(request)
 
+        # 인증 미들웨어가 조회한 경로 정책이 있으면 다시 조회하지 않음
+        policy = getattr(request.state, "route_policy", None)
+        expire = self._route_expire(request.url.path, policy)
+        if expire == 0:
+            return await call_next(request)
+
         # 캐시 키 생성
-        cache_key = f"{request.method}:{request.url.path}:{request.query_params}"
+        cache_key = self.key_builder.build(request)
+        # 사용자별 응답은 디스크의 스냅샷에 남기지 않도록 기록하지 않습니다.
+        if self.warmer is not None and not self.key_builder.is_private(request):
+            self.warmer.record(cache_key, request.url.path)
 
         # 캐시에서 응답 확인
+        namespace = key_namespace(cache_key)
         cached_response = await self.cache.get(cache_key)
-        if cached_response:
-            return Response(content=cached_response, media_type="application/json")
+        if cached_response and self._is_servable(cached_response):
+            record_result(
+                "response", "lookup", namespace, self._freshness(cached_response)
+            )
+            self._maybe_refresh(cache_key, cached_response, request.scope)
+            return self._build_response(cached_response, request)
+        record_result("response", "lookup", namespace, "miss")
+
+        # 캐시가 없는 경우 같은 키의 요청 중 하나만 핸들러를 실행
+        leader_response: Dict[str, Response] = {}
+
+        async def compute() -> Dict[str, Any]:
+            """핸들러를 실행하고 캐시 항목을 만듭니다."""
+            if self.lock_client is not None:
+                entry = await self._wait_for_peer(cache_key)
+                if entry is not None:
+                    return entry
+            try:
+                started = time.monotonic()
+                response = await call_next(request)
+                body = b"".join([chunk async for chunk in response.body_iterator])
+                buffered = Response(content=body, status_code=response.status_code)
+                buffered.raw_headers = response.raw_headers
+                leader_response["response"] = buffered
+                entry = self._build_entry(
+                    response.status_code,
+                    response.headers.get("content-type"),
+                    body,
+                    time.monotonic() - started,
+                    expire,
+                )
+                await self._store(cache_key, entry, request.url.path, expire)
+                return entry or {}
+            finally:
+                await self._release_lock(cache_key)
+
+        entry, _ = await self._inflight.do(cache_key, compute)
+        if "response" in leader_response:
+            response = leader_response["response"]
+            if entry and entry["status_code"] == 200:
+                if self._is_not_modified(request, entry["etag"]):
+                    return self._not_modified_response(entry["etag"])
+                response.headers["ETag"] = entry["etag"]
+            return response
+        if not entry:
+            # 대기자에게 공유할 수 없는 응답이면 직접 처리합니다.
+            return await call_next(request)
+        return self._build_response(entry, request)
+
+    def _route_expire(self, path: str, policy: Any = None) -> int:
+        """경로의 캐시 신선도 유지 시간을 구합니다.
+
+        Args:
+            path: 요청 경로
+            policy: 이미 조회한 경로 정책
+
+        Returns:
+            신선도 유지 시간 (초, 0이면 캐시하지 않음)
+        """
+        if policy is None:
+            policy = self.routes.resolve(path, "GET")
+        return self.expire if policy.cache_ttl is None else policy.cache_ttl
+
+    def _is_servable(self, entry: Any) -> bool:
+        """캐시 항목을 응답으로 사용할 수 있는지 확인합니다.
+
+        Args:
+            entry: 캐시 항목
+
+        Returns:
+            신선하거나 stale 허용 구간 안이면 True
+        """
+        if not isinstance(entry, dict) or "expires_at" not in entry:
+            return True
+        return not is_stale(entry["expires_at"] + self.stale_ttl)
+
+    @staticmethod
+    def _freshness(entry: Any) -> str:
+        """응답으로 사용할 캐시 항목의 신선도를 메트릭 결과 이름으로 반환합니다.
+
+        Args:
+            entry: 캐시 항목
+
+        Returns:
+            기한이 지났으면 ``stale``, 아니면 ``hit``
+        """
+        if (
+            isinstance(entry, dict)
+            and "expires_at" in entry
+            and is_stale(entry["expires_at"])
+        ):
+            return "stale"
+        return "hit"
+
+    def _maybe_refresh(self, cache_key: str, entry: Any, scope: Scope) -> None:
+        """기한이 지났거나 조기 갱신 대상이면 백그라운드 갱신을 시작합니다.
+
+        Args:
+            cache_key: 캐시 키
+            entry: 캐시 항목
+            scope: 원본 요청의 ASGI 스코프
+        """
+        if not isinstance(entry, dict) or "expires_at" not in entry:
+            return
+        if cache_key in self._refreshing:
+            return
+        if not should_refresh(
+            entry["expires_at"], entry.get("delta", 0.0), self.xfetch_beta
+        ):
+            return
+
+        self._refreshing.add(cache_key)
+        task = asyncio.get_running_loop().create_task(self._refresh(cache_key, scope))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh(self, cache_key: str, scope: Scope) -> None:
+        """하위 애플리케이션을 직접 호출하여 캐시 항목을 갱신합니다.
+
+        원본 요청의 ``call_next``는 응답 전송 후 사용할 수 없으므로, 스코프를
+        복사해 새 요청처럼 실행합니다.
+
+        Args:
+            cache_key: 캐시 키
+            scope: 원본 요청의 ASGI 스코프
+        """
+        try:
+            started = time.monotonic()
+            status_code, content_type, body = await self._render(scope)
+            expire = self._route_expire(
+                scope["path"], scope.get("state", {}).get("route_policy")
+            )
+            entry = self._build_entry(
+                status_code,
+                content_type,
+                body,
+                time.monotonic() - started,
+                expire,
+            )
+            await self._store(cache_key, entry, scope["path"], expire)
+        except Exception:
+            # 갱신에 실패하면 기존 항목을 stale 허용 구간까지 계속 사용합니다.
+            record_result("response", "refresh", key_namespace(cache_key), "error")
+            logger.exception("캐시 백그라운드 갱신 실패: %s", cache_key)
+        finally:
+            self._refreshing.discard(cache_key)
+
+    async def _render(self, scope: Scope) -> Tuple[int, Optional[str], bytes]:
+        """하위 애플리케이션을 실행하고 응답을 모읍니다.
+
+        Args:
+            scope: 실행할 요청의 ASGI 스코프
+
+        Returns:
+            (상태 코드, Content-Type, 본문)
+        """
+        scope = dict(scope)
+        # 인증 미들웨어가 남긴 요청 상태는 유지하되 원본과 공유하지 않습니다.
+        scope["state"] = dict(scope.get("state", {}))
+        request_sent = False
+        status_code = 500
+        headers: List[Tuple[bytes, bytes]] = []
+        chunks: List[bytes] = []
+
+        async def receive() -> Message:
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            # 클라이언트가 없으므로 연결 종료 메시지를 보내지 않습니다.
+            await asyncio.Event().wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: Message) -> None:
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        content_type = next(
+            (
+                value.decode("latin-1")
+                for name, value in headers
+                if name.lower() == b"content-type"
+            ),
+            None,
+        )
+        return status_code, content_type, b"".join(chunks)
+
+    async def _store(
+        self,
+        cache_key: str,
+        entry: Optional[Dict[str, Any]],
+        path: str,
+        expire: Optional[int] = None,
+    ) -> None:
+        """성공한 응답 항목을 캐시에 저장합니다.
+
+        항목은 ``route:{path}`` 태그로 등록되어 경로 단위로 무효화할 수 있습니다.
+        부정 캐시 항목은 stale 허용 구간 없이 ``negative_ttl`` 동안만 유지합니다.
+
+        Args:
+            cache_key: 캐시 키
+            entry: 캐시 항목
+            path: 요청 경로
+            expire: 신선도 유지 시간 (초, 없으면 기본값)
+        """
+        if entry is None:
+            return
+        if entry.get("negative"):
+            expire = self.negative_ttl
+        elif entry["status_code"] == 200:
+            expire = (expire or self.expire) + self.stale_ttl
+        else:
+            return
+        await self.cache.set(cache_key, entry, expire=expire, tags=[route_tag(path)])
+
+    def _build_entry(
+        self,
+        status_code: int,
+        content_type: Optional[str],
+        body: bytes,
+        delta: float,
+        expire: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """응답으로부터 캐시 항목을 만듭니다.
+
+        Args:
+            status_code: 응답 상태 코드
+            content_type: 응답 Content-Type
+            body: 응답 본문
+            delta: 응답 생성에 걸린 시간 (초)
+            expire: 신선도 유지 시간 (초, 없으면 기본값)
+
+        Returns:
+            캐시 항목, 텍스트가 아닌 본문이면 None
+        """
+        try:
+            text = body.decode()
+        except UnicodeDecodeError:
+            return None
+        negative = self.negative_ttl > 0 and self._is_negative(status_code, text)
+        return {
+            "status_code": status_code,
+            "body": text,
+            "media_type": content_type or "application/json",
+            "etag": f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+            "expires_at": time.time()
+            + (self.negative_ttl if negative else expire or self.expire),
+            "delta": delta,
+            "negative": negative,
+        }
+
+    @classmethod
+    def _is_negative(cls, status_code: int, text: str) -> bool:
+        """404 응답이나 빈 결과인지 확인합니다.
+
+        Args:
+            status_code: 응답 상태 코드
+            text: 응답 본문
+
+        Returns:
+            부정 캐시 대상이면 True
+        """
+        if status_code == 404:
+            return True
+        return status_code == 200 and text.strip() in cls._EMPTY_BODIES
+
+    @staticmethod
+    def prepare_snapshot_entry(entry: Any) -> Optional[Dict[str, Any]]:
+        """스냅샷에서 읽은 항목을 캐시에 다시 적재할 수 있게 변환합니다.
+
+        스냅샷 값은 오래되었을 수 있으므로 기한이 지난 항목으로 표시합니다.
+        적재 직후에는 stale 허용 구간 동안 바로 응답하면서 첫 요청에서
+        백그라운드 갱신이 시작됩니다. 부정 캐시 항목은 적재하지 않습니다.
+
+        Args:
+            entry: 스냅샷 항목
+
+        Returns:
+            적재할 항목, 적재하지 않을 항목이면 None
+        """
+        if not isinstance(entry, dict) or entry.get("negative"):
+            return None
+        if entry.get("status_code") != 200 or "expires_at" not in entry:
+            return None
+        return {**entry, "expires_at": min(entry["expires_at"], time.time())}
+
+    def _build_response(self, entry: Any, request: Request) -> Response:
+        """캐시 항목으로부터 응답을 만듭니다.
+
+        클라이언트가 같은 ETag를 ``If-None-Match``로 보내면 본문 없이
+        ``304 Not Modified``를 반환합니다.
+
+        Args:
+            entry: 캐시 항목
+            request: FastAPI 요청
+
+        Returns:
+            FastAPI 응답
+        """
+        if not isinstance(entry, dict):
+            # 이전 형식(본문만 저장)의 항목
+            return Response(content=entry, media_type="application/json")
+
+        etag = entry.get("etag")
+        if etag is None or entry["status_code"] != 200:
+            return Response(
+                content=entry["body"],
+                status_code=entry["status_code"],
+                media_type=entry["media_type"],
+            )
+        if self._is_not_modified(request, etag):
+            return self._not_modified_response(etag)
+        return Response(
+            content=entry["body"],
+            status_code=entry["status_code"],
+            media_type=entry["media_type"],
+            headers={"ETag": etag},
+        )
+
+    @staticmethod
+    def _is_not_modified(request: Request, etag: str) -> bool:
+        """``If-None-Match`` 헤더가 ETag와 일치하는지 확인합니다.
+
+        Args:
+            request: FastAPI 요청
+            etag: 캐시 항목의 ETag
+
+        Returns:
+            클라이언트가 이미 같은 본문을 가지고 있으면 True
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        # GET 요청은 약한 비교를 사용합니다 (RFC 9110 13.1.2).
+        candidates = (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        )
+        return etag in candidates
+
+    @staticmethod
+    def _not_modified_response(etag: str) -> Response:
+        """본문 없는 304 응답을 만듭니다.
+
+        Args:
+            etag: 캐시 항목의 ETag
+
+        Returns:
+            304 Not Modified 응답
+        """
+        return Response(status_code=304, headers={"ETag": etag})
+
+    async def _wait_for_peer(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """다른 노드가 계산 중이면 캐시에 결과가 저장될 때까지 기다립니다.
+
+        Args:
+            cache_key: 캐시 키
+
+        Returns:
+            다른 노드가 저장한 캐시 항목, 락을 얻었거나 대기 시간이 지나면 None
+        """
+        lock = self.lock_client.lock(
+            f"lock:{cache_key}",
+            timeout=self.lock_timeout,
+            blocking=False,
+        )
+        if await lock.acquire():
+            self._locks[cache_key] = lock
+            return None
 
-        # 캐시가 없는 경우 요청 처리
-        response = await call_next(request)
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.CACHE_LOCK_POLL_INTERVAL)
+            entry = await self.cache.get(cache_key)
+            if entry and self._is_servable(entry):
+                return entry
+        return None
 
-        # 응답을 캐시에 저장
-        if response.status_code == 200:
-            await self.cache.set(cache_key, response.body, expire=300)  # 5분
+    async def _release_lock(self, cache_key: str) -> None:
+        """이 노드가 잡은 Redis 락을 해제합니다.
 
-        return response
+        Args:
+            cache_key: 캐시 키
+        """
+        lock = self._locks.pop(cache_key, None)
+        if lock is None:
+            return
+        try:
+            await lock.release()
+        except LockError:
+            # 락이 이미 만료된 경우
+            pass
@@ -1,41 +1,273 @@
 """Redis 캐시를 제공하는 모듈입니다."""
 
-import json
-from typing import Any, Optional
-from redis import Redis
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+import redis.asyncio as redis
 
 from .base import BaseCache
+from .codec import CacheCodec
+from .keys import key_namespace
+from .metrics import batch_namespace, get_key_usage, record_lookup, record_write, timed
 from ..core.settings import get_settings
 
+# 태그 무효화 시 한 번의 DEL로 삭제할 최대 키 수
+_DELETE_BATCH_SIZE = 500
+
+# Redis URL별로 공유되는 연결 풀
+_connection_pools: Dict[str, redis.BlockingConnectionPool] = {}
+
+
+def get_connection_pool(
+    redis_url: Optional[str] = None,
+) -> redis.BlockingConnectionPool:
+    """프로세스 전체에서 공유되는 Redis 연결 풀을 가져옵니다.
+
+    연결이 ``REDIS_MAX_CONNECTIONS``개 모두 사용 중이면 예외를 내는 대신
+    ``REDIS_POOL_TIMEOUT``초까지 연결이 반환되기를 기다립니다.
+
+    Args:
+        redis_url: Redis URL (없으면 설정값 사용)
+
+    Returns:
+        Redis 연결 풀
+    """
+    settings = get_settings()
+    url = redis_url or settings.REDIS_URL
+    pool = _connection_pools.get(url)
+    if pool is None:
+        pool = redis.BlockingConnectionPool.from_url(
+            url,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+            health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            retry_on_timeout=True,
+        )
+        _connection_pools[url] = pool
+    return pool
+
+
+async def close_connection_pools() -> None:
+    """공유 연결 풀의 모든 연결을 종료합니다."""
+    for pool in _connection_pools.values():
+        await pool.disconnect()
+    _connection_pools.clear()
+
 
 class RedisCache(BaseCache):
-    """Redis 캐시 클래스입니다."""
+    """Redis 캐시 클래스입니다.
+
+    모든 키는 ``{namespace}:v{version}:`` 접두사 아래에 저장됩니다. ``clear``는
+    FLUSHDB 대신 버전을 올려 이전 항목을 보이지 않게 만들고, 이전 항목은 TTL로
+    자연스럽게 사라집니다. 같은 DB의 요청 제한 카운터나 이벤트 상태는 건드리지
+    않습니다. 태그를 지정해 저장한 항목은 ``invalidate_tags``로 태그 크기에
+    비례하는 비용으로 삭제할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        connection_pool: Optional[redis.ConnectionPool] = None,
+        codec: Optional[CacheCodec] = None,
+        namespace: Optional[str] = None,
+        name: str = "redis",
+    ):
+        """Redis 캐시를 초기화합니다.
 
-    def __init__(self):
-        """Redis 캐시를 초기화합니다."""
+        Args:
+            redis_url: Redis URL (없으면 설정값 사용)
+            connection_pool: 사용할 연결 풀 (없으면 공유 풀 사용)
+            codec: 값 인코딩에 사용할 코덱 (없으면 설정값으로 생성)
+            namespace: 키 네임스페이스 (없으면 설정값 사용)
+            name: 메트릭의 ``cache`` 레이블로 사용할 이름
+        """
         settings = get_settings()
-        self.redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        pool = connection_pool or get_connection_pool(redis_url)
+        self.redis = redis.Redis(connection_pool=pool)
+        self.codec = codec or CacheCodec()
+        self.namespace = namespace or settings.CACHE_NAMESPACE
+        self.tag_ttl = settings.CACHE_TAG_TTL
+        self.version_check_interval = settings.CACHE_VERSION_CHECK_INTERVAL
+        self.name = name
+        self._usage = get_key_usage(name)
+
+        self._version_key = f"{self.namespace}:version"
+        self._version = 0
+        self._version_checked_at = float("-inf")
 
     async def get(self, key: str) -> Optional[Any]:
         """캐시에서 데이터를 조회합니다."""
-        data = self.redis.get(key)
-        if data:
-            return json.loads(data)
-        return None
+        with timed(self.name, "get", key_namespace(key)):
+            prefix = await self._get_prefix()
+            data = await self.redis.get(prefix + key)
+            record_lookup(self.name, key, bool(data), len(data) if data else None)
+            if data:
+                return self.codec.decode(data)
+            return None
 
-    async def set(self, key: str, value: Any, expire: int = 300) -> None:
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
         """데이터를 캐시에 저장합니다."""
-        data = json.dumps(value)
-        self.redis.set(key, data, ex=expire)
+        await self.set_many({key: value}, expire=expire, tags=tags)
 
     async def delete(self, key: str) -> None:
         """캐시에서 데이터를 삭제합니다."""
-        self.redis.delete(key)
+        with timed(self.name, "delete", key_namespace(key)):
+            prefix = await self._get_prefix()
+            await self.redis.delete(prefix + key)
+        self._usage.forget(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키의 데이터를 MGET 한 번으로 조회합니다."""
+        keys = list(keys)
+        if not keys:
+            return {}
+        with timed(self.name, "get_many", batch_namespace(keys)):
+            prefix = await self._get_prefix()
+            values = await self.redis.mget([prefix + key for key in keys])
+            result = {}
+            for key, data in zip(keys, values):
+                record_lookup(
+                    self.name,
+                    key,
+                    bool(data),
+                    len(data) if data else None,
+                    operation="get_many",
+                )
+                if data:
+                    result[key] = self.codec.decode(data)
+            return result
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """여러 데이터와 태그 등록을 파이프라인으로 한 번에 저장합니다."""
+        if not mapping:
+            return
+        operation = "set" if len(mapping) == 1 else "set_many"
+        with timed(self.name, operation, batch_namespace(mapping)):
+            prefix = await self._get_prefix()
+            full_keys = [prefix + key for key in mapping]
+            now = time.time()
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, full_key, value in zip(mapping, full_keys, mapping.values()):
+                    data = self.codec.encode(value)
+                    record_write(self.name, key, len(data))
+                    pipe.set(full_key, data, ex=expire)
+                for tag in tags or ():
+                    # 태그 집합은 만료 시각을 점수로 두고, 쓸 때마다 이미 만료된
+                    # 항목을 잘라내 살아 있는 항목 수 이상으로 커지지 않게 합니다.
+                    tag_key = self._tag_key(tag)
+                    pipe.zadd(tag_key, dict.fromkeys(full_keys, now + expire))
+                    pipe.zremrangebyscore(tag_key, "-inf", now)
+                    pipe.expire(tag_key, max(expire, self.tag_ttl))
+                await pipe.execute()
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """여러 키의 데이터를 DEL 한 번으로 삭제합니다."""
+        keys = list(keys)
+        if keys:
+            with timed(self.name, "delete_many", batch_namespace(keys)):
+                prefix = await self._get_prefix()
+                await self.redis.delete(*[prefix + key for key in keys])
+            for key in keys:
+                self._usage.forget(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그에 등록된 항목을 삭제하고 삭제한 키 목록을 반환합니다.
+
+        태그 집합을 읽는 왕복과 항목을 삭제하는 왕복, 두 번의 파이프라인으로
+        처리합니다. 모든 명령이 다루는 키를 직접 지정하므로 클러스터에서도
+        동작합니다. 태그 집합은 통째로 지우지 않고 읽은 항목만 빼므로, 그 사이에
+        새로 등록된 항목은 남습니다.
+        """
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return []
+        with timed(self.name, "invalidate_tags", "tags"):
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for tag_key in tag_keys:
+                    pipe.zrange(tag_key, 0, -1)
+                members_by_tag = await pipe.execute()
+
+            full_keys = list(
+                dict.fromkeys(m for members in members_by_tag for m in members)
+            )
+            if not full_keys:
+                return []
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for start in range(0, len(full_keys), _DELETE_BATCH_SIZE):
+                    pipe.delete(*full_keys[start : start + _DELETE_BATCH_SIZE])
+                for tag_key, members in zip(tag_keys, members_by_tag):
+                    if members:
+                        pipe.zrem(tag_key, *members)
+                await pipe.execute()
+
+        keys = [self._strip_prefix(full_key) for full_key in full_keys]
+        for key in keys:
+            self._usage.forget(key)
+        return keys
 
     async def clear(self) -> None:
-        """캐시를 모두 삭제합니다."""
-        self.redis.flushdb()
+        """네임스페이스 버전을 올려 이 캐시의 항목을 모두 무효화합니다."""
+        with timed(self.name, "clear", "all"):
+            self._version = await self.redis.incr(self._version_key)
+        self._version_checked_at = time.monotonic()
+        self._usage.clear()
 
     def close(self) -> None:
-        """Redis 연결을 종료합니다."""
-        self.redis.close()
+        """Redis 연결을 종료합니다.
+
+        연결 풀은 여러 인스턴스가 공유하므로 여기서 닫지 않으며, 클라이언트도
+        그대로 두어 이후 호출은 풀에서 다시 연결합니다. 애플리케이션 종료 시
+        ``close_connection_pools``를 호출하세요.
+        """
+
+    def _tag_key(self, tag: str) -> str:
+        """태그 집합의 Redis 키를 만듭니다.
+
+        Args:
+            tag: 태그 이름
+
+        Returns:
+            태그 집합 키
+        """
+        return f"{self.namespace}:tag:{tag}"
+
+    def _strip_prefix(self, full_key: bytes) -> str:
+        """저장된 키에서 네임스페이스와 버전 접두사를 떼어 냅니다.
+
+        Args:
+            full_key: ``{namespace}:v{version}:{key}`` 형식의 Redis 키
+
+        Returns:
+            캐시 키
+        """
+        if isinstance(full_key, bytes):
+            full_key = full_key.decode()
+        return full_key[len(self.namespace) + 1 :].partition(":")[2]
+
+    async def _get_prefix(self) -> str:
+        """현재 네임스페이스 버전의 키 접두사를 가져옵니다.
+
+        다른 노드의 ``clear``를 반영하기 위해 버전은 일정 주기마다 다시 읽습니다.
+
+        Returns:
+            키 접두사
+        """
+        now = time.monotonic()
+        if now - self._version_checked_at >= self.version_check_interval:
+            version = await self.redis.get(self._version_key)
+            self._version = int(version or 0)
+            self._version_checked_at = now
+        return f"{self.namespace}:v{self._version}:"
@@ -0,0 +1,666 @@
+"""같은 호스트의 워커 프로세스가 공유하는 메모리 캐시를 제공하는 모듈입니다.
+
+캐시는 ``/dev/shm`` 등의 파일을 메모리 매핑한 고정 크기 세그먼트에 저장됩니다.
+세그먼트는 샤드로 나뉘고, 각 샤드는 해시 색인과 원형 로그 데이터 영역을 가집니다.
+
+    [세그먼트 헤더 64B][샤드 0][샤드 1]...
+    샤드: [샤드 헤더 64B][색인 슬롯 32B x N][데이터 영역 (원형 로그)]
+
+값은 데이터 영역의 쓰기 위치에 이어 붙여지며, 영역이 가득 차면 가장 오래된
+기록부터 덮어씁니다(FIFO). 따라서 전체 메모리 사용량은 세그먼트 크기로 고정됩니다.
+샤드마다 프로세스 간 fcntl 바이트 범위 락과 스레드 락을 사용합니다. 비동기
+메서드는 락을 기다리며 이벤트 루프를 막지 않도록, 락을 바로 잡지 못하면 잠시
+양보한 뒤 다시 시도합니다.
+"""
+
+import asyncio
+import errno
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..core.settings import get_settings
+from .base import BaseCache, CacheStats
+from .codec import CacheCodec
+from .keys import key_namespace
+from .metrics import batch_namespace, get_key_usage, record_lookup, record_write, timed
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - POSIX 전용
+    fcntl = None
+
+_MAGIC = b"LLMSHMC1"
+_LAYOUT_VERSION = 1
+
+# 세그먼트 헤더: 매직, 레이아웃 버전, 샤드 수, 샤드별 슬롯 수, 샤드별 데이터 크기
+_SEGMENT_HEADER = struct.Struct("<8sIIIQ")
+_SEGMENT_HEADER_SIZE = 64
+# 샤드 헤더: 다음 쓰기 위치 (계속 증가하는 논리 위치)
+_SHARD_HEADER = struct.Struct("<Q")
+_SHARD_HEADER_SIZE = 64
+# 색인 슬롯: 키 해시 (0이면 빈 슬롯), 기록 위치, 만료 시각, 기록 길이
+_SLOT = struct.Struct("<QQdI4x")
+# 기록 헤더: 키 길이, 값 형식, 값 길이
+_RECORD = struct.Struct("<HBxI")
+
+# 값 형식
+_FLAG_ENCODED = 0
+_FLAG_BYTES = 1
+
+# 키 하나가 들어갈 수 있는 연속 슬롯 수
+_PROBES = 8
+# 슬롯 수 계산에 사용하는 평균 기록 크기 (바이트)
+_AVERAGE_RECORD_SIZE = 256
+
+# 샤드 락을 바로 잡지 못했을 때 다시 시도하기까지 기다리는 시간 (초, 두 배씩 증가)
+_LOCK_RETRY_DELAY = 0.0005
+_LOCK_RETRY_MAX_DELAY = 0.01
+
+
+def _hash_key(key: bytes) -> int:
+    """키의 0이 아닌 64비트 해시를 계산합니다.
+
+    Args:
+        key: 인코딩된 키
+
+    Returns:
+        키 해시
+    """
+    value = int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+    return value or 1
+
+
+class SharedMemoryCache(BaseCache):
+    """여러 워커 프로세스가 하나의 메모리 세그먼트를 공유하는 캐시 클래스입니다.
+
+    ``bytes`` 값은 그대로, 그 밖의 값은 ``codec``으로 인코딩해 저장합니다.
+    ``get``은 공유 메모리에서 직접 디코딩하며, ``bytes`` 값은 락 해제 후 덮어써질
+    수 있으므로 한 번 복사해 반환합니다. 복사 없이 읽으려면 ``view``를 사용하세요.
+
+    태그 색인은 공유 메모리에 두지 않으므로 ``invalidate_tags``는 캐시 전체를
+    비웁니다. L1처럼 수명이 짧은 캐시에서는 이것으로 충분합니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        size_bytes: Optional[int] = None,
+        shards: Optional[int] = None,
+        codec: Optional[CacheCodec] = None,
+        name: str = "shm",
+    ):
+        """공유 메모리 캐시를 초기화합니다.
+
+        세그먼트는 첫 사용 시 열리므로 워커 프로세스를 만들기 전에 생성해도 됩니다.
+
+        세그먼트 파일 이름에는 레이아웃 버전, 샤드 수, 크기가 붙습니다. 설정이 다른
+        프로세스는 서로 다른 세그먼트를 쓰므로, 실행 중인 프로세스가 매핑한 세그먼트의
+        크기나 배치를 바꾸지 않습니다.
+
+        Args:
+            path: 세그먼트 파일 경로 접두사 (없으면 설정값 사용)
+            size_bytes: 세그먼트 크기 (바이트, 없으면 설정값 사용)
+            shards: 샤드 수 (없으면 설정값 사용)
+            codec: ``bytes``가 아닌 값의 인코딩에 사용할 코덱
+            name: 메트릭의 ``cache`` 레이블로 사용할 이름
+
+        Raises:
+            RuntimeError: fcntl을 지원하지 않는 환경인 경우
+        """
+        if fcntl is None:
+            raise RuntimeError(
+                "공유 메모리 캐시는 POSIX 환경에서만 사용할 수 있습니다."
+            )
+        settings = get_settings()
+        self.size_bytes = size_bytes or settings.CACHE_SHM_SIZE
+        self.shards = shards or settings.CACHE_SHM_SHARDS
+        prefix = path or settings.CACHE_SHM_PATH
+        self.path = f"{prefix}.v{_LAYOUT_VERSION}.{self.shards}x{self.size_bytes}"
+        self.codec = codec or CacheCodec()
+        self.name = name
+        self._usage = get_key_usage(name)
+
+        shard_size = (self.size_bytes - _SEGMENT_HEADER_SIZE) // self.shards
+        self.slots = max(shard_size // _AVERAGE_RECORD_SIZE, _PROBES)
+        self.data_size = shard_size - _SHARD_HEADER_SIZE - self.slots * _SLOT.size
+        if self.data_size <= 0:
+            raise ValueError(f"공유 메모리 크기가 너무 작습니다: {self.size_bytes}")
+        self._shard_size = shard_size
+        # 원형 로그를 몇 바퀴 돌지 않고도 담을 수 있는 최대 기록 크기
+        self.max_record_size = self.data_size // 4
+
+        self._pid: Optional[int] = None
+        self._fd: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._thread_locks = [threading.Lock() for _ in range(self.shards)]
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """캐시에서 데이터를 조회합니다."""
+        with timed(self.name, "get", key_namespace(key)):
+            return await self._lookup(key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """데이터를 캐시에 저장합니다. 태그는 색인하지 않습니다."""
+        with timed(self.name, "set", key_namespace(key)):
+            await self._store(key, value, expire)
+
+    async def delete(self, key: str) -> None:
+        """캐시에서 데이터를 삭제합니다."""
+        with timed(self.name, "delete", key_namespace(key)):
+            await self._remove(key)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키의 데이터를 한 번에 조회합니다."""
+        keys = list(keys)
+        result = {}
+        with timed(self.name, "get_many", batch_namespace(keys)):
+            for key in keys:
+                value = await self._lookup(key, operation="get_many")
+                if value is not None:
+                    result[key] = value
+        return result
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """여러 데이터를 한 번에 캐시에 저장합니다. 태그는 색인하지 않습니다."""
+        with timed(self.name, "set_many", batch_namespace(mapping)):
+            for key, value in mapping.items():
+                await self._store(key, value, expire)
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """여러 키의 데이터를 한 번에 삭제합니다."""
+        keys = list(keys)
+        with timed(self.name, "delete_many", batch_namespace(keys)):
+            for key in keys:
+                await self._remove(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그 색인이 없으므로 캐시 전체를 비웁니다. 삭제한 키는 알 수 없습니다.
+
+        세그먼트는 호스트의 모든 워커가 공유하므로, 어느 노드에서든 태그를
+        무효화하면 이 호스트의 L1 전체가 비워집니다.
+        """
+        if list(tags):
+            await self.clear()
+        return []
+
+    async def clear(self) -> None:
+        """모든 워커 프로세스가 공유하는 항목을 모두 삭제합니다."""
+        with timed(self.name, "clear", "all"):
+            self._ensure_open()
+            empty = bytes(self.slots * _SLOT.size)
+            for shard in range(self.shards):
+                async with self._async_locked(shard):
+                    base = self._shard_offset(shard)
+                    _SHARD_HEADER.pack_into(self._mmap, base, 0)
+                    index = base + _SHARD_HEADER_SIZE
+                    self._mmap[index : index + len(empty)] = empty
+        self._usage.clear()
+
+    def close(self) -> None:
+        """이 프로세스의 매핑을 해제합니다. 세그먼트 파일은 유지됩니다."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._pid = None
+
+    def stats(self) -> CacheStats:
+        """캐시 통계를 반환합니다.
+
+        적중/실패/제거 카운터는 이 프로세스의 값이고, 항목 수와 사용량은
+        세그먼트 전체의 값입니다.
+
+        Returns:
+            캐시 통계
+        """
+        self._ensure_open()
+        now = time.time()
+        entries = 0
+        size_bytes = 0
+        for shard in range(self.shards):
+            with self._locked(shard):
+                write_pos = self._write_pos(shard)
+                for slot in range(self.slots):
+                    key_hash, pos, expire_at, length = self._read_slot(shard, slot)
+                    if key_hash and self._is_live(write_pos, pos, expire_at, now):
+                        entries += 1
+                        size_bytes += length
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            entries=entries,
+            size_bytes=size_bytes,
+        )
+
+    @contextmanager
+    def view(self, key: str) -> Iterator[Optional[memoryview]]:
+        """``bytes`` 값을 복사하지 않고 공유 메모리에서 직접 읽습니다.
+
+        블록 안에서는 샤드 락을 잡고 있으므로 ``await`` 하지 말고, 블록을 벗어난
+        뒤에는 메모리 뷰를 사용하면 안 됩니다.
+
+        Args:
+            key: 조회할 키
+
+        Yields:
+            값의 메모리 뷰, 없거나 ``bytes`` 값이 아니면 None
+        """
+        self._ensure_open()
+        encoded_key = key.encode()
+        key_hash = _hash_key(encoded_key)
+        shard = key_hash % self.shards
+        with self._locked(shard):
+            found = self._find(shard, key_hash, encoded_key)
+            if found is None or found[1] != _FLAG_BYTES:
+                yield None
+                return
+            start, _, length = found
+            with memoryview(self._mmap)[start : start + length] as value:
+                yield value
+
+    async def _lookup(self, key: str, operation: str = "get") -> Optional[Any]:
+        """항목을 조회하고 통계를 갱신합니다.
+
+        Args:
+            key: 조회할 키
+            operation: 메트릭에 기록할 연산 이름
+
+        Returns:
+            저장된 값, 없거나 만료되었으면 None
+        """
+        self._ensure_open()
+        encoded_key = key.encode()
+        key_hash = _hash_key(encoded_key)
+        shard = key_hash % self.shards
+        async with self._async_locked(shard):
+            found = self._find(shard, key_hash, encoded_key)
+            if found is None:
+                value = None
+            else:
+                start, flag, length = found
+                with memoryview(self._mmap)[start : start + length] as data:
+                    # 락을 잡은 동안 공유 메모리에서 바로 디코딩합니다.
+                    value = (
+                        bytes(data) if flag == _FLAG_BYTES else self.codec.decode(data)
+                    )
+
+        if value is None:
+            self._misses += 1
+            record_lookup(self.name, key, False, operation=operation)
+            return None
+        self._hits += 1
+        record_lookup(self.name, key, True, found[2], operation=operation)
+        return value
+
+    def _find(
+        self,
+        shard: int,
+        key_hash: int,
+        encoded_key: bytes,
+    ) -> Optional[Tuple[int, int, int]]:
+        """샤드 락을 잡은 상태에서 살아 있는 기록을 찾습니다.
+
+        만료된 기록을 만나면 슬롯을 비웁니다.
+
+        Args:
+            shard: 샤드 번호
+            key_hash: 키 해시
+            encoded_key: 인코딩된 키
+
+        Returns:
+            (값 시작 오프셋, 값 형식, 값 길이), 없으면 None
+        """
+        write_pos = self._write_pos(shard)
+        now = time.time()
+        for slot in self._probe(key_hash):
+            slot_hash, pos, expire_at, _ = self._read_slot(shard, slot)
+            if slot_hash != key_hash or not self._is_live(write_pos, pos, 0, now):
+                continue
+            record = self._record_offset(shard, pos)
+            key_length, flag, value_length = _RECORD.unpack_from(self._mmap, record)
+            key_start = record + _RECORD.size
+            if self._mmap[key_start : key_start + key_length] != encoded_key:
+                continue
+            if expire_at and expire_at <= now:
+                self._clear_slot(shard, slot)
+                self._expirations += 1
+                return None
+            return key_start + key_length, flag, value_length
+        return None
+
+    async def _store(self, key: str, value: Any, expire: int) -> None:
+        """항목을 데이터 영역에 추가하고 색인을 갱신합니다.
+
+        Args:
+            key: 저장할 키
+            value: 저장할 값
+            expire: 만료 시간 (초, 0 이하이면 만료 없음)
+        """
+        self._ensure_open()
+        encoded_key = key.encode()
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            flag, data = _FLAG_BYTES, value
+        else:
+            flag, data = _FLAG_ENCODED, self.codec.encode(value)
+        length = _RECORD.size + len(encoded_key) + len(data)
+        if len(encoded_key) > 0xFFFF or length > self.max_record_size:
+            # 예산에 비해 너무 큰 값은 저장하지 않습니다.
+            await self._remove(key)
+            return
+
+        key_hash = _hash_key(encoded_key)
+        shard = key_hash % self.shards
+        expire_at = time.time() + expire if expire > 0 else 0.0
+        async with self._async_locked(shard):
+            slot = self._choose_slot(shard, key_hash, encoded_key)
+            pos = self._append(shard, length)
+            record = self._record_offset(shard, pos)
+            _RECORD.pack_into(self._mmap, record, len(encoded_key), flag, len(data))
+            key_start = record + _RECORD.size
+            self._mmap[key_start : key_start + len(encoded_key)] = encoded_key
+            value_start = key_start + len(encoded_key)
+            self._mmap[value_start : value_start + len(data)] = data
+            _SLOT.pack_into(
+                self._mmap,
+                self._slot_offset(shard, slot),
+                key_hash,
+                pos,
+                expire_at,
+                length,
+            )
+        record_write(self.name, key, len(data))
+
+    async def _remove(self, key: str) -> None:
+        """항목의 색인 슬롯을 비웁니다.
+
+        Args:
+            key: 제거할 키
+        """
+        self._ensure_open()
+        encoded_key = key.encode()
+        key_hash = _hash_key(encoded_key)
+        shard = key_hash % self.shards
+        async with self._async_locked(shard):
+            for slot in self._probe(key_hash):
+                slot_hash, pos, _, _ = self._read_slot(shard, slot)
+                if slot_hash != key_hash:
+                    continue
+                record = self._record_offset(shard, pos)
+                key_length = _RECORD.unpack_from(self._mmap, record)[0]
+                key_start = record + _RECORD.size
+                if self._mmap[key_start : key_start + key_length] == encoded_key:
+                    self._clear_slot(shard, slot)
+        self._usage.forget(key)
+
+    def _choose_slot(self, shard: int, key_hash: int, encoded_key: bytes) -> int:
+        """새 기록을 가리킬 슬롯을 고릅니다.
+
+        같은 키의 슬롯, 비었거나 죽은 슬롯, 가장 오래된 슬롯 순서로 고르며,
+        마지막 경우는 그 항목을 제거합니다.
+
+        Args:
+            shard: 샤드 번호
+            key_hash: 키 해시
+            encoded_key: 인코딩된 키
+
+        Returns:
+            슬롯 번호
+        """
+        write_pos = self._write_pos(shard)
+        now = time.time()
+        free: Optional[int] = None
+        oldest: Optional[Tuple[int, int]] = None
+        for slot in self._probe(key_hash):
+            slot_hash, pos, expire_at, _ = self._read_slot(shard, slot)
+            if not slot_hash or not self._is_live(write_pos, pos, expire_at, now):
+                if free is None:
+                    free = slot
+                continue
+            if slot_hash == key_hash:
+                record = self._record_offset(shard, pos)
+                key_length = _RECORD.unpack_from(self._mmap, record)[0]
+                key_start = record + _RECORD.size
+                if self._mmap[key_start : key_start + key_length] == encoded_key:
+                    return slot
+            if oldest is None or pos < oldest[1]:
+                oldest = (slot, pos)
+        if free is not None:
+            return free
+        self._evictions += 1
+        return oldest[0]
+
+    def _append(self, shard: int, length: int) -> int:
+        """데이터 영역에 기록할 논리 위치를 예약합니다.
+
+        기록이 영역 끝을 넘으면 다음 바퀴의 처음으로 건너뛰어, 하나의 기록이
+        항상 연속된 메모리에 놓이게 합니다.
+
+        Args:
+            shard: 샤드 번호
+            length: 기록 길이
+
+        Returns:
+            기록의 논리 위치
+        """
+        pos = self._write_pos(shard)
+        offset = pos % self.data_size
+        if offset + length > self.data_size:
+            pos += self.data_size - offset
+        _SHARD_HEADER.pack_into(self._mmap, self._shard_offset(shard), pos + length)
+        return pos
+
+    def _is_live(self, write_pos: int, pos: int, expire_at: float, now: float) -> bool:
+        """기록이 덮어써지지 않았고 만료되지 않았는지 확인합니다.
+
+        Args:
+            write_pos: 샤드의 현재 쓰기 위치
+            pos: 기록의 논리 위치
+            expire_at: 만료 시각 (0이면 만료 없음)
+            now: 현재 시각
+
+        Returns:
+            살아 있는 기록이면 True
+        """
+        if pos < write_pos - self.data_size:
+            return False
+        return not expire_at or expire_at > now
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        """키가 들어갈 수 있는 슬롯 번호를 차례로 반환합니다.
+
+        Args:
+            key_hash: 키 해시
+
+        Returns:
+            슬롯 번호 이터레이터
+        """
+        start = (key_hash // self.shards) % self.slots
+        return ((start + i) % self.slots for i in range(_PROBES))
+
+    def _read_slot(self, shard: int, slot: int) -> Tuple[int, int, float, int]:
+        """색인 슬롯을 읽습니다.
+
+        Args:
+            shard: 샤드 번호
+            slot: 슬롯 번호
+
+        Returns:
+            (키 해시, 기록 위치, 만료 시각, 기록 길이)
+        """
+        return _SLOT.unpack_from(self._mmap, self._slot_offset(shard, slot))
+
+    def _clear_slot(self, shard: int, slot: int) -> None:
+        """색인 슬롯을 비웁니다.
+
+        Args:
+            shard: 샤드 번호
+            slot: 슬롯 번호
+        """
+        _SLOT.pack_into(self._mmap, self._slot_offset(shard, slot), 0, 0, 0.0, 0)
+
+    def _write_pos(self, shard: int) -> int:
+        """샤드의 현재 쓰기 위치를 읽습니다.
+
+        Args:
+            shard: 샤드 번호
+
+        Returns:
+            논리 쓰기 위치
+        """
+        return _SHARD_HEADER.unpack_from(self._mmap, self._shard_offset(shard))[0]
+
+    def _shard_offset(self, shard: int) -> int:
+        """샤드의 시작 오프셋을 계산합니다."""
+        return _SEGMENT_HEADER_SIZE + shard * self._shard_size
+
+    def _slot_offset(self, shard: int, slot: int) -> int:
+        """색인 슬롯의 오프셋을 계산합니다."""
+        return self._shard_offset(shard) + _SHARD_HEADER_SIZE + slot * _SLOT.size
+
+    def _record_offset(self, shard: int, pos: int) -> int:
+        """논리 위치에 해당하는 기록의 오프셋을 계산합니다."""
+        return (
+            self._shard_offset(shard)
+            + _SHARD_HEADER_SIZE
+            + self.slots * _SLOT.size
+            + pos % self.data_size
+        )
+
+    @contextmanager
+    def _locked(self, shard: int) -> Iterator[None]:
+        """샤드의 스레드 락과 프로세스 간 락을 잡습니다.
+
+        Args:
+            shard: 샤드 번호
+        """
+        with self._thread_locks[shard]:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, shard)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, shard)
+
+    @asynccontextmanager
+    async def _async_locked(self, shard: int) -> AsyncIterator[None]:
+        """이벤트 루프를 막지 않고 샤드의 스레드 락과 프로세스 간 락을 잡습니다.
+
+        다른 프로세스나 스레드가 락을 잡고 있으면 잠시 양보한 뒤 다시 시도합니다.
+        블록 안에서는 ``await`` 하지 않아야 합니다.
+
+        Args:
+            shard: 샤드 번호
+        """
+        delay = _LOCK_RETRY_DELAY
+        while not self._try_lock(shard):
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _LOCK_RETRY_MAX_DELAY)
+        try:
+            yield
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, shard)
+            self._thread_locks[shard].release()
+
+    def _try_lock(self, shard: int) -> bool:
+        """샤드의 스레드 락과 프로세스 간 락을 기다리지 않고 잡습니다.
+
+        Args:
+            shard: 샤드 번호
+
+        Returns:
+            두 락을 모두 잡았으면 True
+        """
+        thread_lock = self._thread_locks[shard]
+        if not thread_lock.acquire(blocking=False):
+            return False
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, shard)
+        except OSError as e:
+            thread_lock.release()
+            if e.errno in (errno.EACCES, errno.EAGAIN):
+                return False
+            raise
+        return True
+
+    def _ensure_open(self) -> None:
+        """이 프로세스에서 세그먼트를 열고, 처음 만든 경우 초기화합니다.
+
+        fork로 만들어진 프로세스는 부모의 매핑 대신 새로 엽니다. 이미 있는 세그먼트의
+        크기를 바꾸거나 내용을 지우면 그 세그먼트를 매핑한 다른 프로세스가 SIGBUS로
+        종료되거나 깨진 값을 읽을 수 있으므로, 크기나 헤더가 다른 세그먼트에는
+        연결하지 않습니다.
+
+        Raises:
+            RuntimeError: 같은 경로에 크기나 배치가 다른 세그먼트가 있는 경우
+        """
+        if self._mmap is not None and self._pid == os.getpid():
+            return
+        self._mmap = None
+        self._fd = None
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # 여러 워커가 동시에 시작해도 한 프로세스만 초기화합니다.
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                size = os.fstat(fd).st_size
+                if size == 0:
+                    # 방금 만든 파일이므로 아직 아무도 매핑하지 않았습니다.
+                    os.ftruncate(fd, self.size_bytes)
+                elif size != self.size_bytes:
+                    raise RuntimeError(
+                        f"공유 메모리 세그먼트 크기가 다릅니다: {self.path} ({size}바이트)"
+                    )
+                segment = mmap.mmap(fd, self.size_bytes)
+                expected = _SEGMENT_HEADER.pack(
+                    _MAGIC,
+                    _LAYOUT_VERSION,
+                    self.shards,
+                    self.slots,
+                    self.data_size,
+                )
+                header = segment[: _SEGMENT_HEADER.size]
+                if header != expected:
+                    if any(header):
+                        segment.close()
+                        raise RuntimeError(
+                            f"공유 메모리 세그먼트의 배치가 다릅니다: {self.path}"
+                        )
+                    # 새 세그먼트는 0으로 채워져 있으므로 헤더만 씁니다.
+                    segment[: _SEGMENT_HEADER.size] = expected
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        self._fd = fd
+        self._mmap = segment
+        self._pid = os.getpid()
@@ -0,0 +1,77 @@
+"""동일 키에 대한 동시 계산을 하나로 합치는 모듈입니다."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class _LeaderCancelled(Exception):
+    """계산을 맡은 호출자가 취소되었음을 대기자에게 알리는 예외입니다."""
+
+
+class SingleFlight:
+    """키별로 진행 중인 계산을 하나만 실행하는 클래스입니다.
+
+    같은 키로 동시에 들어온 호출 중 첫 번째 호출만 함수를 실행하고,
+    나머지 호출은 그 결과(또는 예외)를 함께 받습니다.
+    """
+
+    def __init__(self):
+        """SingleFlight를 초기화합니다."""
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        """진행 중인 계산 수를 반환합니다."""
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Any, bool]:
+        """키에 대한 계산을 실행하거나 진행 중인 계산의 결과를 기다립니다.
+
+        Args:
+            key: 계산을 식별하는 키
+            func: 결과를 계산하는 코루틴 함수
+
+        Returns:
+            (결과, 이 호출이 직접 계산했는지 여부)
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future), False
+            except _LeaderCancelled:
+                # 계산하던 호출이 취소되면 대기자 중 하나가 다시 계산합니다.
+                continue
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            self._fail(future, _LeaderCancelled())
+            raise
+        except Exception as exc:
+            self._fail(future, exc)
+            raise
+        else:
+            future.set_result(result)
+            return result, True
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    @staticmethod
+    def _fail(future: asyncio.Future, exc: Exception) -> None:
+        """대기자에게 예외를 전달합니다.
+
+        Args:
+            future: 대기자가 기다리는 Future
+            exc: 전달할 예외
+        """
+        future.set_exception(exc)
+        # 대기자가 없어도 "exception was never retrieved" 경고가 남지 않게 합니다.
+        future.exception()
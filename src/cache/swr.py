@@ -0,0 +1,50 @@
+"""stale-while-revalidate와 확률적 조기 갱신(XFetch) 판단을 제공하는 모듈입니다."""
+
+import math
+import random
+import time
+from typing import Optional
+
+
+def is_stale(expires_at: float, now: Optional[float] = None) -> bool:
+    """항목의 신선도 기한이 지났는지 확인합니다.
+
+    Args:
+        expires_at: 신선도 기한 (유닉스 시간)
+        now: 현재 시각 (없으면 현재 시간 사용)
+
+    Returns:
+        기한이 지났으면 True
+    """
+    now = time.time() if now is None else now
+    return now >= expires_at
+
+
+def should_refresh(
+    expires_at: float,
+    delta: float,
+    beta: float,
+    now: Optional[float] = None,
+) -> bool:
+    """항목을 지금 갱신해야 하는지 판단합니다.
+
+    기한이 지난 항목은 항상 갱신합니다. 기한 전이라도 XFetch 알고리즘에 따라
+    계산 시간(``delta``)이 길고 기한이 가까울수록 높은 확률로 미리 갱신하여,
+    인기 키가 한꺼번에 만료되는 것을 막습니다.
+
+    Args:
+        expires_at: 신선도 기한 (유닉스 시간)
+        delta: 값을 다시 계산하는 데 걸린 시간 (초)
+        beta: 조기 갱신 강도 (0이면 비활성화, 1이 기본값)
+        now: 현재 시각 (없으면 현재 시간 사용)
+
+    Returns:
+        갱신해야 하면 True
+    """
+    now = time.time() if now is None else now
+    if now >= expires_at:
+        return True
+    if beta <= 0 or delta <= 0:
+        return False
+    # random()은 0을 반환할 수 있으므로 (0, 1] 구간으로 바꿉니다.
+    return now - delta * beta * math.log(1.0 - random.random()) >= expires_at
@@ -0,0 +1,290 @@
+"""L1(프로세스 내) + L2(Redis) 2단계 캐시를 제공하는 모듈입니다."""
+
+import asyncio
+import json
+import logging
+import socket
+import time
+import uuid
+from typing import Any, Dict, Iterable, List, Optional
+
+import redis.asyncio as redis
+
+from ..core.settings import get_settings
+from .base import BaseCache, CacheStats
+from .memory import MemoryCache
+from .shm import SharedMemoryCache
+
+logger = logging.getLogger(__name__)
+
+
+class TieredCache(BaseCache):
+    """L1 메모리 캐시를 L2 캐시 앞에 두는 2단계 캐시입니다.
+
+    쓰기와 삭제는 Redis pub/sub으로 무효화 메시지를 발행하고, 다른 워커와
+    노드는 이를 받아 자신의 L1 항목을 즉시 제거합니다. 메시지가 유실되더라도
+    L1 항목은 ``l1_ttl`` 이후에 만료되므로 오래된 값이 남는 시간이 제한됩니다.
+    """
+
+    def __init__(
+        self,
+        l2: BaseCache,
+        l1: Optional[BaseCache] = None,
+        l1_ttl: Optional[int] = None,
+        redis_url: Optional[str] = None,
+        channel: Optional[str] = None,
+    ):
+        """2단계 캐시를 초기화합니다.
+
+        Args:
+            l2: 공유 캐시 (보통 RedisCache)
+            l1: 프로세스 내 캐시 (없으면 ``CACHE_L1_BACKEND`` 설정으로 생성)
+            l1_ttl: L1 항목의 최대 유지 시간 (초)
+            redis_url: 무효화 메시지용 Redis URL
+            channel: 무효화 채널 이름
+        """
+        settings = get_settings()
+        self.l2 = l2
+        if l1 is None:
+            if settings.CACHE_L1_BACKEND == "shm":
+                # 같은 호스트의 워커 프로세스가 하나의 L1을 공유합니다.
+                l1 = SharedMemoryCache(name="l1")
+            else:
+                l1 = MemoryCache(max_entries=settings.CACHE_L1_MAX_ENTRIES, name="l1")
+        self.l1 = l1
+        self.l1_ttl = l1_ttl or settings.CACHE_L1_TTL
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.channel = channel or settings.CACHE_INVALIDATION_CHANNEL
+        self.reconnect_interval = settings.CACHE_INVALIDATION_RECONNECT_INTERVAL
+
+        # 무효화 메시지를 보낸 프로세스와, 보낸 쪽의 L1을 식별합니다. 공유 메모리 L1은
+        # 같은 호스트의 워커가 함께 쓰므로 보낸 쪽이 이미 반영한 변경을 다시 지우지
+        # 않도록 호스트와 세그먼트로 식별합니다.
+        self._sender = uuid.uuid4().hex
+        if isinstance(l1, SharedMemoryCache):
+            self._origin = f"{socket.gethostname()}:{l1.path}"
+        else:
+            self._origin = self._sender
+        self._redis: Optional[redis.Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        # 구독이 끊기면 이 시각(monotonic)까지 다시 구독하지 않습니다.
+        self._reconnect_at = 0.0
+        # 끊긴 동안 요청마다 L1을 비우지 않도록 끊김을 한 번만 처리합니다.
+        self._disconnected = False
+        # 무효화가 일어날 때마다 증가합니다. L2 조회 중 무효화가 끼어들면
+        # 조회한 값을 L1에 채우지 않기 위해 사용합니다.
+        self._epoch = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """L1, L2 순서로 데이터를 조회합니다."""
+        self._ensure_listener()
+        value = await self.l1.get(key)
+        if value is not None:
+            return value
+
+        epoch = self._epoch
+        value = await self.l2.get(key)
+        if value is not None and epoch == self._epoch:
+            await self.l1.set(key, value, expire=self.l1_ttl)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """데이터를 두 단계 모두에 저장하고 다른 노드에 무효화를 알립니다."""
+        self._ensure_listener()
+        self._epoch += 1
+        tags = list(tags or ())
+        await self.l2.set(key, value, expire=expire, tags=tags)
+        await self.l1.set(key, value, expire=self._l1_expire(expire), tags=tags)
+        await self._publish({"keys": [key]})
+
+    async def delete(self, key: str) -> None:
+        """데이터를 두 단계 모두에서 삭제하고 다른 노드에 무효화를 알립니다."""
+        self._ensure_listener()
+        self._epoch += 1
+        await self.l1.delete(key)
+        await self.l2.delete(key)
+        await self._publish({"keys": [key]})
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """L1에 없는 키만 L2에서 한 번에 조회합니다."""
+        self._ensure_listener()
+        keys = list(keys)
+        result = await self.l1.get_many(keys)
+        missing = [key for key in keys if key not in result]
+        if not missing:
+            return result
+
+        epoch = self._epoch
+        found = await self.l2.get_many(missing)
+        if found and epoch == self._epoch:
+            await self.l1.set_many(found, expire=self.l1_ttl)
+        result.update(found)
+        return result
+
+    async def set_many(
+        self,
+        mapping: Dict[str, Any],
+        expire: int = 300,
+        tags: Optional[Iterable[str]] = None,
+    ) -> None:
+        """여러 데이터를 두 단계 모두에 저장하고 무효화를 한 번에 알립니다."""
+        if not mapping:
+            return
+        self._ensure_listener()
+        self._epoch += 1
+        tags = list(tags or ())
+        await self.l2.set_many(mapping, expire=expire, tags=tags)
+        await self.l1.set_many(mapping, expire=self._l1_expire(expire), tags=tags)
+        await self._publish({"keys": list(mapping)})
+
+    async def delete_many(self, keys: Iterable[str]) -> None:
+        """여러 키를 두 단계 모두에서 삭제하고 무효화를 한 번에 알립니다."""
+        keys = list(keys)
+        if not keys:
+            return
+        self._ensure_listener()
+        self._epoch += 1
+        await self.l1.delete_many(keys)
+        await self.l2.delete_many(keys)
+        await self._publish({"keys": keys})
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """태그에 등록된 항목을 두 단계 모두에서 삭제하고 다른 노드에 알립니다.
+
+        L2에서 읽어 L1에 채운 항목에는 태그가 없으므로, L2가 삭제한 키를 L1에서도
+        키 단위로 지우고 다른 노드에도 태그와 함께 키 목록을 보냅니다.
+        """
+        tags = list(tags)
+        if not tags:
+            return []
+        self._ensure_listener()
+        self._epoch += 1
+        keys = await self.l2.invalidate_tags(tags)
+        removed = await self.l1.invalidate_tags(tags)
+        await self.l1.delete_many(keys)
+        await self._publish({"keys": keys, "tags": tags})
+        return list(dict.fromkeys(keys + removed))
+
+    async def clear(self) -> None:
+        """캐시를 모두 삭제하고 다른 노드의 L1도 비웁니다."""
+        self._ensure_listener()
+        self._epoch += 1
+        await self.l1.clear()
+        await self.l2.clear()
+        await self._publish({"clear": True})
+
+    def close(self) -> None:
+        """무효화 구독을 종료하고 캐시 연결을 정리합니다."""
+        if self._listener is not None:
+            self._listener.cancel()
+            self._listener = None
+        self.l1.close()
+        self.l2.close()
+
+    def stats(self) -> CacheStats:
+        """L1 캐시 통계를 반환합니다.
+
+        Returns:
+            L1 적중/실패/제거 카운터
+        """
+        return self.l1.stats()
+
+    def _l1_expire(self, expire: int) -> int:
+        """L1 만료 시간을 계산합니다.
+
+        Args:
+            expire: L2 만료 시간 (초)
+
+        Returns:
+            L1 만료 시간 (초)
+        """
+        if expire <= 0:
+            return self.l1_ttl
+        return min(expire, self.l1_ttl)
+
+    async def _get_redis(self) -> redis.Redis:
+        """무효화 메시지용 Redis 클라이언트를 가져옵니다.
+
+        Returns:
+            Redis 클라이언트
+        """
+        if not self._redis:
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def _publish(self, message: dict) -> None:
+        """무효화 메시지를 발행합니다.
+
+        Args:
+            message: 발행할 메시지
+        """
+        message["origin"] = self._origin
+        message["sender"] = self._sender
+        try:
+            redis_client = await self._get_redis()
+            await redis_client.publish(self.channel, json.dumps(message))
+        except redis.RedisError:
+            # 발행에 실패해도 다른 노드의 L1은 l1_ttl 이후 만료됩니다.
+            logger.warning("캐시 무효화 메시지 발행 실패: %s", message)
+
+    def _ensure_listener(self) -> None:
+        """실행 중인 이벤트 루프에서 무효화 구독 태스크를 시작합니다.
+
+        구독이 끊긴 뒤에는 ``reconnect_interval``이 지날 때까지 다시 시작하지 않습니다.
+        """
+        if self._listener is not None and not self._listener.done():
+            return
+        if time.monotonic() < self._reconnect_at:
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """무효화 메시지를 구독하고 L1 항목을 제거합니다."""
+        redis_client = await self._get_redis()
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.channel)
+            self._disconnected = False
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                await self._apply_invalidation(message["data"])
+        except redis.RedisError:
+            # 연결이 끊기면 잠시 뒤의 캐시 호출에서 구독을 다시 시작합니다.
+            self._reconnect_at = time.monotonic() + self.reconnect_interval
+            if not self._disconnected:
+                # 놓친 무효화가 있을 수 있으므로 끊길 때 한 번만 L1을 비웁니다.
+                self._disconnected = True
+                logger.warning("캐시 무효화 구독이 중단되었습니다.")
+                await self.l1.clear()
+        finally:
+            await pubsub.reset()
+
+    async def _apply_invalidation(self, data: str) -> None:
+        """수신한 무효화 메시지를 L1에 반영합니다.
+
+        Args:
+            data: JSON 형식의 무효화 메시지
+        """
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return
+        if message.get("sender") == self._sender:
+            return
+
+        # 같은 L1을 쓰는 워커의 변경이라도 진행 중인 L2 조회 결과는 채우지 않습니다.
+        self._epoch += 1
+        if message.get("origin") == self._origin:
+            return
+        if message.get("clear"):
+            await self.l1.clear()
+            return
+        await self.l1.delete_many(message.get("keys", []))
+        await self.l1.invalidate_tags(message.get("tags", []))
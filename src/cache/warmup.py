@@ -0,0 +1,299 @@
+"""자주 사용되는 캐시 항목을 스냅샷으로 저장하고 시작 시 미리 적재하는 모듈입니다."""
+
+import asyncio
+import glob
+import json
+import logging
+import os
+import stat
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.settings import get_settings
+
+# 보안 패키지가 코어 패키지를 거쳐 이 패키지를 다시 가져오므로, 순환 참조가 되지
+# 않도록 모듈 단위로 가져옵니다.
+from ..security import routes as route_policies
+from .base import BaseCache
+from .keys import route_tag
+
+logger = logging.getLogger(__name__)
+
+# 워커별 스냅샷 파일 이름 (워커마다 자신의 접근 횟수만 저장)
+_SNAPSHOT_PATTERN = "snapshot-*.json"
+
+
+class CacheWarmer:
+    """키별 접근 횟수를 추적하고 상위 항목의 스냅샷을 관리하는 클래스입니다.
+
+    배포 직후 빈 캐시로 인해 데이터베이스와 검색 엔진에 요청이 몰리지 않도록,
+    종료 시(그리고 주기적으로) 가장 많이 사용된 항목을 로컬 파일에 저장하고
+    다음 시작 시 캐시에 없는 항목만 다시 채웁니다.
+
+    워커마다 스냅샷 디렉터리에 자신의 파일을 쓰고, 적재할 때 모든 워커의 접근
+    횟수를 합쳐 상위 항목을 고릅니다. 적재한 항목은 공유 캐시에 들어가므로,
+    디렉터리는 0700 권한으로 만들고 다른 사용자가 소유했거나 다른 사용자가 쓸 수
+    있으면 사용하지 않습니다.
+
+    적재한 항목은 ``CacheMiddleware``가 저장할 때와 같이 ``route:{path}`` 태그로
+    등록하고, 경로 정책의 ``cache_ttl``에 stale 허용 구간을 더한 시간 동안 유지합니다.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        top_n: Optional[int] = None,
+        max_age: Optional[int] = None,
+        expire: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        routes: Optional["route_policies.RouteRegistry"] = None,
+    ):
+        """캐시 워머를 초기화합니다.
+
+        Args:
+            directory: 스냅샷 디렉터리
+            top_n: 스냅샷에 저장할 최대 항목 수
+            max_age: 적재를 허용하는 스냅샷의 최대 나이 (초)
+            expire: 경로 정책에 ``cache_ttl``이 없을 때의 신선도 유지 시간 (초)
+            stale_ttl: 기한이 지난 응답을 계속 제공할 시간 (초)
+            routes: 경로 정책 등록부 (없으면 공유 등록부)
+        """
+        settings = get_settings()
+        self.directory = os.path.abspath(directory or settings.CACHE_SNAPSHOT_DIR)
+        self.top_n = top_n or settings.CACHE_SNAPSHOT_TOP_N
+        self.max_age = max_age or settings.CACHE_SNAPSHOT_MAX_AGE
+        self.expire = expire or settings.CACHE_TTL
+        self.stale_ttl = settings.CACHE_STALE_TTL if stale_ttl is None else stale_ttl
+        self.routes = routes or route_policies.route_registry
+        self._counts: Counter = Counter()
+        # 키별 요청 경로 (적재 시 태그와 만료 시간을 정하는 데 사용)
+        self._paths: Dict[str, str] = {}
+        self._max_tracked = self.top_n * 10
+        self._dumper: Optional[asyncio.Task] = None
+
+    @property
+    def path(self) -> str:
+        """이 워커의 스냅샷 파일 경로입니다. (포크된 워커마다 다름)"""
+        return os.path.join(self.directory, f"snapshot-{os.getpid()}.json")
+
+    def record(self, key: str, path: str) -> None:
+        """키의 접근 횟수를 기록합니다.
+
+        추적하는 키가 너무 많아지면 상위 키만 남겨 메모리 사용량을 제한합니다.
+
+        Args:
+            key: 접근한 캐시 키
+            path: 요청 경로
+        """
+        self._counts[key] += 1
+        self._paths[key] = path
+        if len(self._counts) > self._max_tracked:
+            self._counts = Counter(dict(self._counts.most_common(self.top_n * 5)))
+            self._forget_untracked()
+
+    async def dump(self, cache: BaseCache) -> int:
+        """가장 많이 사용된 항목을 스냅샷 파일에 저장합니다.
+
+        Args:
+            cache: 값을 읽을 캐시
+
+        Returns:
+            저장한 항목 수
+        """
+        keys = [key for key, _ in self._counts.most_common(self.top_n)]
+        if not keys:
+            return 0
+        entries = await cache.get_many(keys)
+        snapshot = {
+            "created_at": time.time(),
+            "entries": [
+                {
+                    "key": key,
+                    "path": self._paths[key],
+                    "count": self._counts[key],
+                    "value": entries[key],
+                }
+                for key in keys
+                if key in entries and key in self._paths
+            ],
+        }
+
+        self._ensure_directory()
+        # 저장 도중 종료되어도 깨진 파일이 남지 않도록 교체 방식으로 씁니다.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+
+        # 오래된 인기도가 계속 남지 않도록 횟수를 절반으로 줄입니다.
+        self._counts = Counter(
+            {key: count // 2 for key, count in self._counts.items() if count > 1}
+        )
+        self._forget_untracked()
+        return len(snapshot["entries"])
+
+    async def load(
+        self,
+        cache: BaseCache,
+        prepare: Optional[Callable[[Any], Any]] = None,
+    ) -> int:
+        """워커별 스냅샷을 합쳐 캐시에 없는 상위 항목만 적재합니다.
+
+        Args:
+            cache: 항목을 적재할 캐시
+            prepare: 적재 전에 값을 변환하는 함수 (None을 반환하면 건너뜀)
+
+        Returns:
+            적재한 항목 수
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+        try:
+            self._ensure_directory()
+        except OSError as e:
+            logger.warning("캐시 스냅샷 디렉터리를 사용할 수 없습니다: %s", e)
+            return 0
+
+        # 같은 경로의 항목은 태그와 만료 시간이 같으므로 경로별로 묶어 저장합니다.
+        groups: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        for item in self._merge_snapshots():
+            path = item.get("path")
+            expire = self._route_expire(path) if path else 0
+            if not expire:
+                # 경로가 없는 이전 형식이거나 더 이상 캐시하지 않는 경로입니다.
+                continue
+            value = prepare(item["value"]) if prepare else item["value"]
+            if value is not None:
+                groups.setdefault((path, expire), {})[item["key"]] = value
+        if not groups:
+            return 0
+
+        # 다른 노드가 이미 더 새로운 값을 저장했을 수 있으므로 없는 키만 채웁니다.
+        loaded = 0
+        try:
+            for (path, expire), values in groups.items():
+                existing = await cache.get_many(values)
+                missing = {
+                    key: value for key, value in values.items() if key not in existing
+                }
+                if missing:
+                    await cache.set_many(missing, expire=expire, tags=[route_tag(path)])
+                loaded += len(missing)
+        except Exception:
+            # 워밍업 실패로 애플리케이션 시작이 막히지 않도록 합니다.
+            logger.exception("캐시 스냅샷 적재 실패: %s", self.directory)
+            return loaded
+        for (path, _), values in groups.items():
+            for key in values:
+                self._counts[key] += 1
+                self._paths[key] = path
+        return loaded
+
+    def start_periodic_dump(
+        self, cache: BaseCache, interval: Optional[float] = None
+    ) -> None:
+        """주기적으로 스냅샷을 저장하는 태스크를 시작합니다.
+
+        Args:
+            cache: 값을 읽을 캐시
+            interval: 저장 주기 (초, 없으면 설정값 사용)
+        """
+        interval = interval or get_settings().CACHE_SNAPSHOT_INTERVAL
+        if interval <= 0 or (self._dumper is not None and not self._dumper.done()):
+            return
+        self._dumper = asyncio.get_running_loop().create_task(
+            self._dump_loop(cache, interval)
+        )
+
+    def stop(self) -> None:
+        """주기적인 스냅샷 저장을 중지합니다."""
+        if self._dumper is not None:
+            self._dumper.cancel()
+            self._dumper = None
+
+    def _ensure_directory(self) -> None:
+        """스냅샷 디렉터리를 만들고 이 프로세스만 사용할 수 있는지 확인합니다.
+
+        Raises:
+            PermissionError: 디렉터리가 아니거나, 다른 사용자가 소유했거나,
+                다른 사용자가 쓸 수 있는 경우
+        """
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        info = os.lstat(self.directory)
+        if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+            raise PermissionError(
+                f"디렉터리가 아니거나 다른 사용자가 소유했습니다: {self.directory}"
+            )
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise PermissionError(
+                f"다른 사용자가 쓸 수 있는 디렉터리입니다: {self.directory}"
+            )
+
+    def _merge_snapshots(self) -> List[Dict[str, Any]]:
+        """워커별 스냅샷을 읽어 접근 횟수를 합친 상위 항목을 반환합니다.
+
+        ``max_age``보다 오래된 스냅샷(종료된 워커의 파일 등)은 삭제합니다.
+
+        Returns:
+            접근 횟수가 많은 순서의 항목 목록 (최대 ``top_n``개)
+        """
+        counts: Counter = Counter()
+        latest: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        now = time.time()
+        for file_path in glob.glob(os.path.join(self.directory, _SNAPSHOT_PATTERN)):
+            try:
+                with open(file_path, encoding="utf-8") as f:
+                    snapshot = json.load(f)
+                created_at = float(snapshot.get("created_at", 0))
+                if now - created_at > self.max_age:
+                    os.unlink(file_path)
+                    continue
+            except (OSError, ValueError, TypeError, AttributeError):
+                logger.warning("캐시 스냅샷을 읽을 수 없습니다: %s", file_path)
+                continue
+            for item in snapshot.get("entries", []):
+                key = item["key"]
+                counts[key] += item.get("count", 1)
+                # 같은 키는 가장 최근에 저장된 값을 사용합니다.
+                if key not in latest or latest[key][0] < created_at:
+                    latest[key] = (created_at, item)
+        return [latest[key][1] for key, _ in counts.most_common(self.top_n)]
+
+    def _route_expire(self, path: str) -> int:
+        """경로의 항목을 캐시에 유지할 시간을 구합니다.
+
+        Args:
+            path: 요청 경로
+
+        Returns:
+            신선도 유지 시간에 stale 허용 구간을 더한 시간 (초, 0이면 캐시하지 않음)
+        """
+        policy = self.routes.resolve(path, "GET")
+        expire = self.expire if policy.cache_ttl is None else policy.cache_ttl
+        return expire + self.stale_ttl if expire else 0
+
+    def _forget_untracked(self) -> None:
+        """더 이상 횟수를 추적하지 않는 키의 경로를 버립니다."""
+        self._paths = {
+            key: path for key, path in self._paths.items() if key in self._counts
+        }
+
+    async def _dump_loop(self, cache: BaseCache, interval: float) -> None:
+        """주기적으로 스냅샷을 저장합니다.
+
+        Args:
+            cache: 값을 읽을 캐시
+            interval: 저장 주기 (초)
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.dump(cache)
+            except Exception:
+                logger.exception("캐시 스냅샷 저장 실패: %s", self.directory)
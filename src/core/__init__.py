@@ -27,7 +27,9 @@ from .rate_limit import RateLimiter, rate_limit_middleware
 from .security import (
     create_access_token,
     get_password_hash,
+    get_password_hash_async,
     verify_password,
+    verify_password_async,
     verify_token,
 )
 from .settings import get_settings
@@ -72,6 +74,8 @@ __all__ = [
     # 보안
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
     "create_access_token",
     "verify_token",
     # 설정
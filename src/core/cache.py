@@ -1,16 +1,43 @@
 """캐시 설정을 관리하는 모듈입니다."""
 
-from typing import Any, Optional
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from enum import Enum
+from typing import Any, Callable, Optional, Set
 
 import redis.asyncio as redis
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.params import Depends
 from fastapi_cache import FastAPICache
 from fastapi_cache.backends.redis import RedisBackend
 from fastapi_cache.decorator import cache
+from pydantic import BaseModel
 
+from ..cache.keys import CacheKeyBuilder, digest
+from ..cache.swr import is_stale, should_refresh
 from .constants import CACHE_DEFAULT_TTL, CACHE_KEY_PREFIX
 from .settings import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_key_builder = CacheKeyBuilder()
+
+# 백그라운드 갱신 중인 키와 태스크
+_refreshing: Set[str] = set()
+_background_tasks: Set[asyncio.Task] = set()
+
+# 엔드포인트가 요청을 받지 않을 때 키 생성을 위해 주입하는 매개변수
+_INJECTED_REQUEST = inspect.Parameter(
+    "__swr_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+)
+
+# 대체 키에 포함할 수 있는 인자 값의 타입 (세션 등 의존성 객체는 제외)
+_KEY_VALUE_TYPES = (str, int, float, bool, bytes, type(None), Enum, BaseModel)
 
 
 async def init_cache() -> None:
@@ -23,24 +50,218 @@ async def init_cache() -> None:
     FastAPICache.init(
         RedisBackend(redis_client),
         prefix=CACHE_KEY_PREFIX,
-        key_builder=lambda *args, **kwargs: f"{args[0].url.path}:{kwargs.get('query')}",
+        key_builder=request_key_builder,
     )
 
 
+def request_key_builder(
+    func: Callable,
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Any = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+) -> str:
+    """fastapi-cache용 캐시 키를 만듭니다.
+
+    요청이 있으면 정렬된 쿼리 파라미터, vary 헤더, 인증 주체를 포함한 정규화된
+    키를 사용하고, 없으면 함수 이름과 값 인자의 해시를 사용합니다. 데이터베이스
+    세션처럼 호출마다 달라지는 의존성 객체는 키에서 제외합니다.
+
+    Args:
+        func: 캐시되는 엔드포인트 함수
+        namespace: 키 접두사
+        request: FastAPI 요청
+        response: FastAPI 응답 (사용하지 않음)
+        args: 엔드포인트 위치 인자
+        kwargs: 엔드포인트 키워드 인자
+
+    Returns:
+        str: 캐시 키
+    """
+    if request is not None:
+        key = _key_builder.build(request)
+    else:
+        arguments = repr(
+            (
+                [value for value in args if _is_key_value(value)],
+                sorted(
+                    (name, value)
+                    for name, value in (kwargs or {}).items()
+                    if _is_key_value(value)
+                ),
+            )
+        )
+        key = f"{func.__module__}.{func.__name__}:{digest(arguments)}"
+    return f"{namespace}{key}"
+
+
+def _is_key_value(value: Any) -> bool:
+    """인자 값을 캐시 키에 포함할 수 있는지 확인합니다.
+
+    Args:
+        value: 엔드포인트 인자 값
+
+    Returns:
+        값 타입(또는 값 타입의 컬렉션)이면 True
+    """
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return all(_is_key_value(item) for item in value)
+    if isinstance(value, dict):
+        return all(_is_key_value(item) for item in value.values())
+    return isinstance(value, _KEY_VALUE_TYPES)
+
+
 def get_cache(
     expire: int = CACHE_DEFAULT_TTL,
     key_builder: Optional[callable] = None,
+    stale_ttl: int = 0,
+    xfetch_beta: float = 0.0,
 ) -> Any:
     """캐시 데코레이터를 가져옵니다.
 
+    ``stale_ttl``이나 ``xfetch_beta``를 지정하면 기한이 지난 값을 즉시 반환하고
+    백그라운드에서 갱신하는 stale-while-revalidate 데코레이터를 반환합니다.
+
     Args:
         expire: 캐시 만료 시간 (초)
         key_builder: 캐시 키 생성 함수
+        stale_ttl: 기한이 지난 값을 계속 반환할 시간 (초)
+        xfetch_beta: 확률적 조기 갱신 강도 (0이면 비활성화)
 
     Returns:
         Any: 캐시 데코레이터
     """
-    return cache(expire=expire, key_builder=key_builder)
+    if stale_ttl <= 0 and xfetch_beta <= 0:
+        return cache(expire=expire, key_builder=key_builder)
+    return _stale_while_revalidate(expire, key_builder, stale_ttl, xfetch_beta)
+
+
+def _stale_while_revalidate(
+    expire: int,
+    key_builder: Optional[callable],
+    stale_ttl: int,
+    xfetch_beta: float,
+) -> Callable:
+    """stale-while-revalidate 캐시 데코레이터를 만듭니다.
+
+    엔드포인트가 ``Request`` 매개변수를 선언하지 않으면 fastapi-cache의 ``cache``처럼
+    시그니처에 주입하여 요청 기반 키를 만듭니다.
+
+    백그라운드 갱신은 응답 이후 같은 인자로 엔드포인트를 다시 호출합니다.
+    ``Depends`` 의존성(데이터베이스 세션 등)은 요청이 끝나면 닫히므로, 의존성이
+    있는 엔드포인트는 백그라운드 대신 기한이 지났거나 조기 갱신에 당첨된 요청
+    안에서 갱신합니다.
+
+    Args:
+        expire: 신선도 유지 시간 (초)
+        key_builder: 캐시 키 생성 함수
+        stale_ttl: 기한이 지난 값을 계속 반환할 시간 (초)
+        xfetch_beta: 확률적 조기 갱신 강도
+
+    Returns:
+        Callable: 캐시 데코레이터
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        request_param = next(
+            (
+                param
+                for param in signature.parameters.values()
+                if inspect.isclass(param.annotation)
+                and issubclass(param.annotation, Request)
+            ),
+            None,
+        )
+        background = not any(
+            isinstance(param.default, Depends)
+            for param in signature.parameters.values()
+        )
+
+        async def produce(cache_key: str, args: tuple, kwargs: dict) -> Any:
+            """엔드포인트를 실행하고 결과를 캐시에 저장합니다."""
+            started = time.monotonic()
+            value = jsonable_encoder(await func(*args, **kwargs))
+            envelope = {
+                "value": value,
+                "expires_at": time.time() + expire,
+                "delta": time.monotonic() - started,
+            }
+            await FastAPICache.get_backend().set(
+                cache_key,
+                FastAPICache.get_coder().encode(envelope),
+                expire + stale_ttl,
+            )
+            return value
+
+        async def refresh(cache_key: str, args: tuple, kwargs: dict) -> None:
+            """백그라운드에서 캐시 항목을 갱신합니다."""
+            try:
+                await produce(cache_key, args, kwargs)
+            except Exception:
+                logger.exception("캐시 백그라운드 갱신 실패: %s", cache_key)
+            finally:
+                _refreshing.discard(cache_key)
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if request_param is None:
+                request = kwargs.pop(_INJECTED_REQUEST.name, None)
+            else:
+                request = kwargs.get(request_param.name)
+            builder = key_builder or FastAPICache.get_key_builder()
+            cache_key = builder(
+                func,
+                FastAPICache.get_prefix(),
+                request=request,
+                response=None,
+                args=args,
+                kwargs=kwargs,
+            )
+            if inspect.isawaitable(cache_key):
+                cache_key = await cache_key
+
+            cached = await FastAPICache.get_backend().get(cache_key)
+            if cached is None:
+                return await produce(cache_key, args, kwargs)
+
+            envelope = FastAPICache.get_coder().decode(cached)
+            expires_at = envelope["expires_at"]
+            if is_stale(expires_at + stale_ttl):
+                return await produce(cache_key, args, kwargs)
+
+            if cache_key not in _refreshing and should_refresh(
+                expires_at, envelope["delta"], xfetch_beta
+            ):
+                if not background:
+                    # 요청의 의존성이 열려 있는 동안 이 요청에서 갱신합니다.
+                    return await produce(cache_key, args, kwargs)
+                _refreshing.add(cache_key)
+                task = asyncio.get_running_loop().create_task(
+                    refresh(cache_key, args, kwargs),
+                )
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+            return envelope["value"]
+
+        if request_param is None:
+            parameters = list(signature.parameters.values())
+            # **kwargs 앞에 두어야 올바른 시그니처가 됩니다.
+            position = next(
+                (
+                    index
+                    for index, param in enumerate(parameters)
+                    if param.kind is inspect.Parameter.VAR_KEYWORD
+                ),
+                len(parameters),
+            )
+            parameters.insert(position, _INJECTED_REQUEST)
+            wrapper.__signature__ = signature.replace(parameters=parameters)
+        return wrapper
+
+    return decorator
 
 
 async def clear_cache() -> None:
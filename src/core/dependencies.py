@@ -2,13 +2,16 @@
 
 from typing import Annotated, Generator
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
+from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# 순환 참조를 피하기 위해 보안 모듈은 모듈 단위로 가져옵니다. (core.security 참고)
+from ..security import revocation as revocation_module
+from ..security import token_cache as token_cache_module
 from .database import get_db
-from .errors import AuthenticationError
+from .errors import AuthenticationError, AuthorizationError
 from .settings import get_settings
 from .types import TokenData
 
@@ -17,12 +20,17 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login
 
 
 async def get_current_user(
+    request: Request,
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> TokenData:
     """현재 인증된 사용자를 가져옵니다.
 
+    ``SecurityMiddleware``가 이미 검증한 클레임이 있으면 토큰을 다시 검증하지 않습니다.
+    (이 경우 폐기 여부도 이미 확인되었습니다)
+
     Args:
+        request: FastAPI 요청 객체
         token: JWT 토큰
         db: 데이터베이스 세션
 
@@ -38,11 +46,13 @@ async def get_current_user(
     )
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
-        )
+        payload = getattr(request.state, "token_claims", None)
+        if payload is None:
+            payload = token_cache_module.token_cache.decode(
+                token, settings.SECRET_KEY, settings.ALGORITHM
+            )
+            if await revocation_module.revocation_list.is_revoked(payload, token):
+                raise credentials_exception
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
@@ -71,6 +81,25 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_admin_user(
+    current_user: Annotated[TokenData, Depends(get_current_active_user)],
+) -> TokenData:
+    """관리자 권한이 있는 현재 사용자를 가져옵니다.
+
+    Args:
+        current_user: 현재 사용자
+
+    Returns:
+        TokenData: 토큰 데이터
+
+    Raises:
+        AuthorizationError: ``admin`` 권한 범위가 없는 경우
+    """
+    if "admin" not in current_user.scopes:
+        raise AuthorizationError("관리자 권한이 필요합니다.")
+    return current_user
+
+
 def get_settings_dependency() -> Generator:
     """설정 객체를 가져옵니다.
 
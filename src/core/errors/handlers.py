@@ -42,6 +42,20 @@ async def base_error_handler(request: Request, exc: BaseError) -> JSONResponse:
     )
 
 
+async def rate_limit_error_handler(
+    request: Request, exc: RateLimitError
+) -> JSONResponse:
+    """요청 제한 예외 핸들러입니다.
+
+    ``details.retry_after``가 있으면 ``Retry-After`` 헤더로도 알려 줍니다.
+    """
+    response = await base_error_handler(request, exc)
+    retry_after = exc.details.get("retry_after")
+    if retry_after is not None:
+        response.headers["Retry-After"] = str(retry_after)
+    return response
+
+
 async def validation_error_handler(
     request: Request, exc: RequestValidationError
 ) -> JSONResponse:
@@ -91,7 +105,7 @@ def register_error_handlers(app: Any) -> None:
     app.add_exception_handler(AuthorizationError, base_error_handler)
     app.add_exception_handler(NotFoundError, base_error_handler)
     app.add_exception_handler(ConflictError, base_error_handler)
-    app.add_exception_handler(RateLimitError, base_error_handler)
+    app.add_exception_handler(RateLimitError, rate_limit_error_handler)
     app.add_exception_handler(DatabaseError, base_error_handler)
     app.add_exception_handler(CacheError, base_error_handler)
     app.add_exception_handler(ExternalServiceError, base_error_handler)
@@ -3,7 +3,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .constants import CORS_ORIGINS
 from .settings import get_settings
 
 settings = get_settings()
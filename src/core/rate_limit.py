@@ -1,11 +1,20 @@
 """요청 제한 설정을 관리하는 모듈입니다."""
 
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Optional
 
 import redis.asyncio as redis
-from fastapi import HTTPException, Request, status
-
+from fastapi import HTTPException, Request, Response, status
+
+from ..security.rate_limit.algorithms import (
+    register_rate_limit_script,
+    run_rate_limit_script,
+)
+from ..security.rate_limit.base import (
+    RateLimitResult,
+    rate_limit_headers,
+    rate_limit_key,
+)
 from .constants import RATE_LIMIT_DEFAULT_PERIOD, RATE_LIMIT_DEFAULT_REQUESTS
 from .settings import get_settings
 
@@ -13,13 +22,19 @@ settings = get_settings()
 
 
 class RateLimiter:
-    """요청 제한을 관리하는 클래스입니다."""
+    """요청 제한을 관리하는 클래스입니다.
+
+    검사와 갱신은 Lua 스크립트 한 번으로 원자적으로 수행됩니다. 카운터 키는
+    ``rate_limit_key``로 만들므로 ``RedisRateLimiter``와 같은 클라이언트를 같은
+    카운터로 집계합니다.
+    """
 
     def __init__(
         self,
         redis_client: redis.Redis,
         requests: int = RATE_LIMIT_DEFAULT_REQUESTS,
         period: int = RATE_LIMIT_DEFAULT_PERIOD,
+        algorithm: Optional[str] = None,
     ):
         """요청 제한기를 초기화합니다.
 
@@ -27,59 +42,67 @@ class RateLimiter:
             redis_client: Redis 클라이언트
             requests: 허용된 요청 수
             period: 제한 기간 (초)
+            algorithm: 제한 알고리즘 (fixed_window, sliding_window, sliding_log, token_bucket)
         """
         self.redis = redis_client
         self.requests = requests
         self.period = period
+        self.algorithm = algorithm or settings.RATE_LIMIT_ALGORITHM
+        self._script = register_rate_limit_script(redis_client, self.algorithm)
+
+    async def check(self, key: str, cost: int = 1) -> RateLimitResult:
+        """요청을 제한에 반영하고 결과를 반환합니다.
+
+        Args:
+            key: 클라이언트 식별자 (예: IP 주소)
+            cost: 요청 비용 (0이면 상태를 바꾸지 않고 조회만 함)
+
+        Returns:
+            RateLimitResult: 허용 여부, 남은 요청 수, 초기화 시간
+        """
+        return await run_rate_limit_script(
+            self._script,
+            rate_limit_key(key, self.algorithm),
+            self.requests,
+            self.period,
+            cost,
+        )
 
     async def is_rate_limited(self, key: str) -> bool:
         """요청이 제한되었는지 확인합니다.
 
         Args:
-            key: 요청 키
+            key: 클라이언트 식별자 (예: IP 주소)
 
         Returns:
             bool: 제한 여부
         """
-        current = await self.redis.get(key)
-        if current is None:
-            await self.redis.setex(key, self.period, 1)
-            return False
-
-        current = int(current)
-        if current >= self.requests:
-            return True
-
-        await self.redis.incr(key)
-        return False
+        result = await self.check(key)
+        return not result.allowed
 
     async def get_remaining_requests(self, key: str) -> int:
         """남은 요청 수를 가져옵니다.
 
         Args:
-            key: 요청 키
+            key: 클라이언트 식별자 (예: IP 주소)
 
         Returns:
             int: 남은 요청 수
         """
-        current = await self.redis.get(key)
-        if current is None:
-            return self.requests
-        return max(0, self.requests - int(current))
+        result = await self.check(key, cost=0)
+        return result.remaining
 
     async def get_reset_time(self, key: str) -> Optional[datetime]:
         """제한이 초기화되는 시간을 가져옵니다.
 
         Args:
-            key: 요청 키
+            key: 클라이언트 식별자 (예: IP 주소)
 
         Returns:
             Optional[datetime]: 초기화 시간
         """
-        ttl = await self.redis.ttl(key)
-        if ttl > 0:
-            return datetime.utcnow() + timedelta(seconds=ttl)
-        return None
+        result = await self.check(key, cost=0)
+        return datetime.utcnow() + timedelta(seconds=result.reset_after)
 
 
 async def rate_limit_middleware(
@@ -89,6 +112,8 @@ async def rate_limit_middleware(
 ) -> Response:
     """요청 제한 미들웨어입니다.
 
+    응답 헤더는 추가 Redis 호출 없이 검사 결과로 만듭니다.
+
     Args:
         request: FastAPI 요청
         call_next: 다음 미들웨어/라우트 핸들러
@@ -100,20 +125,15 @@ async def rate_limit_middleware(
     Raises:
         HTTPException: 요청이 제한된 경우
     """
-    key = f"rate_limit:{request.client.host}"
-    if await limiter.is_rate_limited(key):
+    result = await limiter.check(request.client.host)
+    headers = rate_limit_headers(result)
+    if not result.allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+            headers=headers,
         )
 
     response = await call_next(request)
-    response.headers["X-RateLimit-Limit"] = str(limiter.requests)
-    response.headers["X-RateLimit-Remaining"] = str(
-        await limiter.get_remaining_requests(key),
-    )
-    reset_time = await limiter.get_reset_time(key)
-    if reset_time:
-        response.headers["X-RateLimit-Reset"] = reset_time.isoformat()
-
+    response.headers.update(headers)
     return response
@@ -1,20 +1,26 @@
 """보안 관련 유틸리티를 관리하는 모듈입니다."""
 
+import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
 from jose import jwt
-from passlib.context import CryptContext
 
+# 보안 모듈도 이 패키지의 설정과 에러를 가져오므로, 어느 쪽을 먼저 가져와도
+# 순환 참조가 되지 않도록 모듈 단위로 가져와 호출 시점에 속성을 찾습니다.
+from ..security import password as password_module
+from ..security import token_cache as token_cache_module
 from .settings import get_settings
 
 settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호를 검증합니다.
 
+    호출한 스레드를 bcrypt 계산 시간 동안 막으므로, 비동기 코드에서는
+    ``verify_password_async``를 사용합니다.
+
     Args:
         plain_password: 평문 비밀번호
         hashed_password: 해시된 비밀번호
@@ -22,7 +28,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: 검증 결과
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_module.pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -34,7 +40,38 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: 해시된 비밀번호
     """
-    return pwd_context.hash(password)
+    return password_module.pwd_context.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """이벤트 루프를 막지 않고 비밀번호를 검증합니다.
+
+    Args:
+        plain_password: 평문 비밀번호
+        hashed_password: 해시된 비밀번호
+
+    Returns:
+        bool: 검증 결과
+
+    Raises:
+        RateLimitError: 대기 중인 해시 작업이 너무 많은 경우
+    """
+    return await password_module.password_hasher.verify(plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """이벤트 루프를 막지 않고 비밀번호를 해시화합니다.
+
+    Args:
+        password: 평문 비밀번호
+
+    Returns:
+        str: 해시된 비밀번호
+
+    Raises:
+        RateLimitError: 대기 중인 해시 작업이 너무 많은 경우
+    """
+    return await password_module.password_hasher.hash(password)
 
 
 def create_access_token(
@@ -62,6 +99,8 @@ def create_access_token(
     to_encode: Dict[str, Any] = {
         "exp": expire,
         "sub": str(subject),
+        # 토큰 하나만 폐기(로그아웃)할 수 있도록 고유 ID를 넣습니다.
+        "jti": uuid.uuid4().hex,
     }
 
     if scopes:
@@ -88,11 +127,8 @@ def verify_token(token: str) -> Dict[str, Any]:
         ValueError: 토큰이 유효하지 않은 경우
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM],
+        return token_cache_module.token_cache.decode(
+            token, settings.SECRET_KEY, settings.ALGORITHM
         )
-        return payload
     except jwt.JWTError:
         raise ValueError("유효하지 않은 토큰입니다.")
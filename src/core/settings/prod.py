@@ -28,6 +28,9 @@ class ProdSettings(BaseSettings):
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_PERIOD: int = 60
 
+    # 요청 수락 제어 설정
+    ADMISSION_MAX_CONCURRENCY: int = 50
+
     class Config:
         """Pydantic 설정 클래스입니다."""
 
@@ -1,15 +1,28 @@
 """FastAPI 애플리케이션의 메인 모듈입니다."""
 
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .api.v1.api import api_router
+from .core.errors import register_error_handlers
 from .core.settings import get_settings
 from .monitoring.middleware import MonitoringMiddleware
+from .security.encryption.aes import shutdown_executor as shutdown_encryption_executor
 from .security.middleware import SecurityMiddleware
+from .security.password import password_hasher
+from .security.revocation import revocation_list
+from .security.routes import route_registry
+from .security.rate_limit.admission import AdmissionMiddleware
+from .security.rate_limit.leased import close_leased_limiters
+from .security.rate_limit.middleware import RateLimitMiddleware
 from .cache.middleware import CacheMiddleware
-from .cache.redis import RedisCache
+from .cache.redis import RedisCache, close_connection_pools
+from .cache.tiered import TieredCache
+from .cache.warmup import CacheWarmer
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -20,8 +33,12 @@ app = FastAPI(
     openapi_url="/api/openapi.json",
 )
 
-# Redis 캐시 초기화
-redis_cache = RedisCache()
+# 예외 핸들러 등록 (RateLimitError 등을 문서화된 상태 코드와 본문으로 응답)
+register_error_handlers(app)
+
+# 캐시 초기화 (L1 메모리 + L2 Redis)
+response_cache = TieredCache(l2=RedisCache())
+cache_warmer = CacheWarmer()
 
 # 미들웨어 설정
 app.add_middleware(
@@ -33,12 +50,57 @@ app.add_middleware(
 )
 
 app.add_middleware(MonitoringMiddleware)
+# 캐시된 응답은 동시 실행 슬롯을 차지하지 않도록 캐시 미들웨어 안쪽에 둡니다.
+app.add_middleware(AdmissionMiddleware)
+# 캐시 키가 검증된 사용자 정보를 사용할 수 있도록 인증 미들웨어 안쪽에 둡니다.
+app.add_middleware(CacheMiddleware, cache=response_cache, warmer=cache_warmer)
+# 캐시된 응답에도 제한이 적용되고 사용자별 정책이 인증 정보를 사용할 수 있도록
+# 캐시 미들웨어 바깥, 인증 미들웨어 안쪽에 둡니다.
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(SecurityMiddleware)
-app.add_middleware(CacheMiddleware, cache=redis_cache)
 
 # API 라우터 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+# 문서 경로는 인증 없이 열람할 수 있게 합니다.
+for docs_path in (
+    app.docs_url,
+    app.redoc_url,
+    app.openapi_url,
+    app.swagger_ui_oauth2_redirect_url,
+):
+    if docs_path:
+        route_registry.add({"route": docs_path, "access": "public"})
+# 미들웨어는 첫 요청(수명 주기 시작) 때 만들어지므로, 그 전에 라우트 정책을 컴파일합니다.
+route_registry.compile(app.routes)
+
+
+@app.on_event("startup")
+async def startup() -> None:
+    """애플리케이션 시작 시 캐시 스냅샷을 적재하고 토큰 폐기 목록 구독을 시작합니다."""
+    await cache_warmer.load(
+        response_cache, prepare=CacheMiddleware.prepare_snapshot_entry
+    )
+    cache_warmer.start_periodic_dump(response_cache)
+    revocation_list.start()
+
+
+@app.on_event("shutdown")
+async def shutdown() -> None:
+    """애플리케이션 종료 시 리소스를 정리합니다."""
+    cache_warmer.stop()
+    try:
+        await cache_warmer.dump(response_cache)
+    except Exception:
+        logger.exception("캐시 스냅샷 저장 실패")
+    response_cache.close()
+    password_hasher.shutdown()
+    await revocation_list.close()
+    shutdown_encryption_executor()
+    # 빌려 둔 요청 제한 토큰은 연결 풀을 닫기 전에 반납합니다.
+    await close_leased_limiters()
+    await close_connection_pools()
+
 
 @app.get("/")
 async def root() -> dict[str, str]:
@@ -1,15 +1,39 @@
 """메트릭을 정의하는 패키지입니다."""
 
+from .admission import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_REJECTED_TOTAL,
+    ADMISSION_WAIT_SECONDS,
+)
+from .cache import (
+    CACHE_OPERATIONS_TOTAL,
+    CACHE_OPERATION_DURATION,
+    CACHE_VALUE_SIZE,
+)
 from .http import (
     HTTP_REQUEST_DURATION,
     HTTP_REQUEST_SIZE,
     HTTP_RESPONSE_SIZE,
     HTTP_REQUESTS_TOTAL,
 )
+from .quota import QUOTA_REJECTED_TOTAL, QUOTA_TOKENS_TOTAL
+from .revocation import REVOCATION_CHECKS_TOTAL, REVOCATION_FILTER_ENTRIES
 
 __all__ = [
+    "ADMISSION_IN_FLIGHT",
+    "ADMISSION_QUEUE_DEPTH",
+    "ADMISSION_REJECTED_TOTAL",
+    "ADMISSION_WAIT_SECONDS",
+    "CACHE_OPERATIONS_TOTAL",
+    "CACHE_OPERATION_DURATION",
+    "CACHE_VALUE_SIZE",
     "HTTP_REQUEST_DURATION",
     "HTTP_REQUEST_SIZE",
     "HTTP_RESPONSE_SIZE",
     "HTTP_REQUESTS_TOTAL",
+    "QUOTA_REJECTED_TOTAL",
+    "QUOTA_TOKENS_TOTAL",
+    "REVOCATION_CHECKS_TOTAL",
+    "REVOCATION_FILTER_ENTRIES",
 ]
@@ -0,0 +1,29 @@
+"""요청 수락 제어 메트릭을 정의합니다."""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# 처리 중인 요청 수
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight_requests",
+    "동시 실행 슬롯을 차지한 요청 수",
+)
+
+# 대기열 길이
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "admission_queue_depth",
+    "실행 슬롯을 기다리는 요청 수",
+)
+
+# 대기 시간
+ADMISSION_WAIT_SECONDS = Histogram(
+    "admission_wait_seconds",
+    "실행 슬롯을 얻기까지 기다린 시간",
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, 10.0],
+)
+
+# 거부된 요청 수
+ADMISSION_REJECTED_TOTAL = Counter(
+    "admission_rejected_total",
+    "수락 제어에서 거부된 요청 수",
+    ["reason"],
+)
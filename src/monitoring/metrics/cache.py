@@ -0,0 +1,26 @@
+"""캐시 메트릭을 정의합니다."""
+
+from prometheus_client import Counter, Histogram
+
+# 캐시 연산 결과 수 (hit, miss, stale, error, ok)
+CACHE_OPERATIONS_TOTAL = Counter(
+    "cache_operations_total",
+    "캐시 연산 수",
+    ["cache", "operation", "namespace", "result"],
+)
+
+# 캐시 연산 지연 시간
+CACHE_OPERATION_DURATION = Histogram(
+    "cache_operation_duration_seconds",
+    "캐시 연산 처리 시간",
+    ["cache", "operation", "namespace"],
+    buckets=[0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5],
+)
+
+# 캐시 값 크기
+CACHE_VALUE_SIZE = Histogram(
+    "cache_value_size_bytes",
+    "캐시 값 크기",
+    ["cache", "namespace"],
+    buckets=[100, 1000, 10000, 100000, 1000000],
+)
@@ -0,0 +1,17 @@
+"""토큰 할당량 메트릭을 정의합니다."""
+
+from prometheus_client import Counter
+
+# 할당량에 반영된 토큰 수
+QUOTA_TOKENS_TOTAL = Counter(
+    "quota_tokens_total",
+    "토큰 할당량에 반영된 토큰 수",
+    ["scope", "operation"],
+)
+
+# 할당량 부족으로 거부된 요청 수
+QUOTA_REJECTED_TOTAL = Counter(
+    "quota_rejected_total",
+    "토큰 할당량 부족으로 거부된 요청 수",
+    ["scope"],
+)
@@ -0,0 +1,17 @@
+"""토큰 폐기 확인 메트릭을 정의합니다."""
+
+from prometheus_client import Counter, Gauge
+
+# 폐기 확인 결과 (miss: 필터에서 바로 통과, false_positive: 저장소 확인 후 통과,
+# revoked: 폐기됨, unsynced: 필터 동기화 전이라 저장소에서 확인)
+REVOCATION_CHECKS_TOTAL = Counter(
+    "revocation_checks_total",
+    "토큰 폐기 확인 수",
+    ["result"],
+)
+
+# 워커의 필터에 들어 있는 폐기 ID 수
+REVOCATION_FILTER_ENTRIES = Gauge(
+    "revocation_filter_entries",
+    "폐기 필터에 들어 있는 ID 수",
+)
@@ -1,5 +1,6 @@
 """JWT 인증 구현을 구현합니다."""
 
+import uuid
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
@@ -7,8 +8,8 @@ from fastapi import Request
 from jose import JWTError, jwt
 
 from .base import Authenticator
-
-from core.settings import get_settings
+from ..token_cache import token_cache
+from ...core.settings import get_settings
 
 settings = get_settings()
 
@@ -66,6 +67,7 @@ class JWTAuthenticator(Authenticator):
         expire = datetime.utcnow() + timedelta(minutes=self.access_token_expire_minutes)
         to_encode = user_data.copy()
         to_encode.update({"exp": expire})
+        to_encode.setdefault("jti", uuid.uuid4().hex)
 
         # 토큰 생성
         encoded_jwt = jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
@@ -81,7 +83,6 @@ class JWTAuthenticator(Authenticator):
             토큰이 유효하면 사용자 정보, 아니면 None
         """
         try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
+            return token_cache.decode(token, self.secret_key, self.algorithm)
         except JWTError:
             return None
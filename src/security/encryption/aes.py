@@ -1,19 +1,66 @@
 """AES 암호화 구현을 구현합니다."""
 
+import asyncio
 import base64
 import json
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
 from .base import Encryptor
-
-from core.settings import get_settings
+from .stream import ByteSource, decrypt_stream, encrypt_stream
+from ...core.settings import get_settings
 
 settings = get_settings()
 
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+@lru_cache(maxsize=32)
+def derive_key(key: str, salt: bytes = b"llm-agent", iterations: int = 100000) -> bytes:
+    """키 재료에서 32바이트 키를 파생합니다.
+
+    PBKDF2는 의도적으로 느리므로 결과를 프로세스 전체에서 재사용합니다.
+
+    Args:
+        key: 키 재료
+        salt: 솔트
+        iterations: 반복 횟수
+
+    Returns:
+        파생된 키
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+    )
+    return kdf.derive(key.encode())
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """대량 암호화에 사용하는 공유 작업자 풀을 반환합니다."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.ENCRYPTION_WORKERS,
+            thread_name_prefix="encryption",
+        )
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """대량 암호화 작업자 풀을 종료합니다."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
 
 class AESEncryptor(Encryptor):
     """AES 암호화 구현입니다."""
@@ -29,15 +76,10 @@ class AESEncryptor(Encryptor):
 
     def _init_fernet(self) -> None:
         """Fernet 인스턴스를 초기화합니다."""
-        # 키 생성
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"llm-agent",
-            iterations=100000,
+        self._derived_key = derive_key(
+            self.key, iterations=settings.ENCRYPTION_KDF_ITERATIONS
         )
-        key = base64.urlsafe_b64encode(kdf.derive(self.key.encode()))
-        self.fernet = Fernet(key)
+        self.fernet = Fernet(base64.urlsafe_b64encode(self._derived_key))
 
     async def encrypt(self, data: Any) -> str:
         """데이터를 암호화합니다.
@@ -48,11 +90,7 @@ class AESEncryptor(Encryptor):
         Returns:
             암호화된 데이터
         """
-        # 데이터를 JSON 문자열로 변환
-        json_data = json.dumps(data)
-        # 암호화
-        encrypted_data = self.fernet.encrypt(json_data.encode())
-        return encrypted_data.decode()
+        return self._encrypt(data)
 
     async def decrypt(self, encrypted_data: str) -> Any:
         """암호화된 데이터를 복호화합니다.
@@ -63,10 +101,29 @@ class AESEncryptor(Encryptor):
         Returns:
             복호화된 데이터
         """
-        # 복호화
-        decrypted_data = self.fernet.decrypt(encrypted_data.encode())
-        # JSON 문자열을 파이썬 객체로 변환
-        return json.loads(decrypted_data.decode())
+        return self._decrypt(encrypted_data)
+
+    async def encrypt_many(self, values: Sequence[Any]) -> List[str]:
+        """여러 값을 암호화합니다. 값이 많으면 작업자 풀에서 묶음으로 처리합니다.
+
+        Args:
+            values: 암호화할 값 목록
+
+        Returns:
+            입력과 같은 순서의 암호화된 값 목록
+        """
+        return await self._run_batched(self._encrypt, values)
+
+    async def decrypt_many(self, encrypted_values: Sequence[str]) -> List[Any]:
+        """여러 암호화된 값을 복호화합니다. 값이 많으면 작업자 풀에서 묶음으로 처리합니다.
+
+        Args:
+            encrypted_values: 암호화된 값 목록
+
+        Returns:
+            입력과 같은 순서의 복호화된 값 목록
+        """
+        return await self._run_batched(self._decrypt, encrypted_values)
 
     async def encrypt_dict(self, data: Dict[str, Any]) -> Dict[str, str]:
         """딕셔너리를 암호화합니다.
@@ -77,7 +134,7 @@ class AESEncryptor(Encryptor):
         Returns:
             암호화된 딕셔너리
         """
-        return {key: await self.encrypt(value) for key, value in data.items()}
+        return dict(zip(data.keys(), await self.encrypt_many(list(data.values()))))
 
     async def decrypt_dict(self, encrypted_data: Dict[str, str]) -> Dict[str, Any]:
         """암호화된 딕셔너리를 복호화합니다.
@@ -88,4 +145,78 @@ class AESEncryptor(Encryptor):
         Returns:
             복호화된 딕셔너리
         """
-        return {key: await self.decrypt(value) for key, value in encrypted_data.items()}
+        values = await self.decrypt_many(list(encrypted_data.values()))
+        return dict(zip(encrypted_data.keys(), values))
+
+    def encrypt_stream(
+        self,
+        source: ByteSource,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """바이트 스트림을 전체를 메모리에 올리지 않고 조각 단위로 암호화합니다.
+
+        Args:
+            source: 평문 바이트 조각의 (비동기) 이터러블
+            chunk_size: 암호화 조각 크기 (없으면 ``ENCRYPTION_STREAM_CHUNK_SIZE`` 설정)
+
+        Returns:
+            암호화된 바이트 조각의 비동기 이터레이터
+        """
+        return encrypt_stream(
+            self._derived_key,
+            source,
+            chunk_size or settings.ENCRYPTION_STREAM_CHUNK_SIZE,
+        )
+
+    def decrypt_stream(self, source: ByteSource) -> AsyncIterator[bytes]:
+        """``encrypt_stream``으로 암호화한 스트림을 복호화합니다.
+
+        Args:
+            source: 암호문 바이트 조각의 (비동기) 이터러블
+
+        Returns:
+            복호화된 바이트 조각의 비동기 이터레이터
+            (변조되었거나 잘린 스트림이면 순회 중 ValueError가 발생합니다)
+        """
+        return decrypt_stream(self._derived_key, source)
+
+    def _encrypt(self, data: Any) -> str:
+        """값 하나를 JSON으로 직렬화하여 암호화합니다."""
+        return self.fernet.encrypt(json.dumps(data).encode()).decode()
+
+    def _decrypt(self, encrypted_data: str) -> Any:
+        """값 하나를 복호화하여 JSON으로 역직렬화합니다."""
+        return json.loads(self.fernet.decrypt(encrypted_data.encode()).decode())
+
+    async def _run_batched(
+        self, func: Callable[[Any], Any], values: Sequence[Any]
+    ) -> List[Any]:
+        """값 목록에 함수를 적용합니다.
+
+        값이 묶음 크기 이하이면 바로 처리하고, 더 많으면 묶음으로 나누어 작업자 풀에서
+        처리하여 이벤트 루프가 오래 멈추지 않게 합니다.
+
+        Args:
+            func: 값 하나에 적용할 함수
+            values: 값 목록
+
+        Returns:
+            입력과 같은 순서의 결과 목록
+        """
+        batch_size = settings.ENCRYPTION_BATCH_SIZE
+        if len(values) <= batch_size:
+            return [func(value) for value in values]
+
+        loop = asyncio.get_running_loop()
+        executor = _get_executor()
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor,
+                    lambda batch: [func(value) for value in batch],
+                    values[start : start + batch_size],
+                )
+                for start in range(0, len(values), batch_size)
+            )
+        )
+        return [result for batch in batches for result in batch]
@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
+from pydantic import BaseModel
+
 
 class Encryptor(ABC):
     """암호화 기본 클래스입니다."""
@@ -54,3 +56,84 @@ class Encryptor(ABC):
             복호화된 딕셔너리
         """
         pass
+
+
+class DataKeyRecord(BaseModel):
+    """마스터 키로 감싼 데이터 키입니다."""
+
+    key_id: str
+    master_version: str
+    wrapped_key: str  # URL-safe base64
+
+
+class MasterKey(ABC):
+    """데이터 키를 감싸고 푸는 마스터 키의 기본 클래스입니다.
+
+    KMS를 사용하는 구현은 ``wrap``/``unwrap``에서 KMS를 호출합니다.
+    """
+
+    version: str
+
+    @abstractmethod
+    async def wrap(self, data_key: bytes, context: bytes) -> bytes:
+        """데이터 키를 감쌉니다.
+
+        Args:
+            data_key: 데이터 키
+            context: 감싼 키를 묶을 문맥 (예: 테넌트 ID)
+
+        Returns:
+            감싼 데이터 키
+        """
+        pass
+
+    @abstractmethod
+    async def unwrap(self, wrapped_key: bytes, context: bytes) -> bytes:
+        """감싼 데이터 키를 풉니다.
+
+        Args:
+            wrapped_key: 감싼 데이터 키
+            context: 감쌀 때 사용한 문맥
+
+        Returns:
+            데이터 키
+
+        Raises:
+            ValueError: 감싼 키가 손상되었거나 문맥이 다른 경우
+        """
+        pass
+
+
+class DataKeyStore(ABC):
+    """테넌트별 현재 데이터 키를 보관하는 저장소의 기본 클래스입니다."""
+
+    @abstractmethod
+    async def get_current(self, tenant_id: str) -> Optional[DataKeyRecord]:
+        """테넌트의 현재 데이터 키를 조회합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            현재 데이터 키 (없으면 None)
+        """
+        pass
+
+    @abstractmethod
+    async def set_current(
+        self,
+        tenant_id: str,
+        record: DataKeyRecord,
+        replace: bool = False,
+    ) -> DataKeyRecord:
+        """테넌트의 현재 데이터 키를 저장합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+            record: 저장할 데이터 키
+            replace: 이미 있는 키를 바꿀지 여부 (False면 없을 때만 저장)
+
+        Returns:
+            저장 후의 현재 데이터 키 (다른 프로세스가 먼저 저장했으면 그 키)
+        """
+        pass
@@ -0,0 +1,568 @@
+"""테넌트별 데이터 키를 사용하는 봉투 암호화를 구현합니다.
+
+값은 테넌트의 데이터 키(AES-256-GCM)로 암호화하고, 데이터 키는 마스터 키로 감싸
+암호문 헤더에 함께 저장합니다. 마스터 키(또는 KMS)는 데이터 키를 풀 때만
+필요하며, 푼 데이터 키는 TTL이 있는 LRU에 보관하므로 같은 테넌트의 문서 목록을
+복호화할 때 키 버전마다 한 번만 풉니다. 동시에 같은 키를 요청해도 한 번만 풉니다.
+
+암호문 형식:
+    env1$<마스터 키 버전>$<데이터 키 ID>$<감싼 데이터 키>$<논스 + 암호문>
+
+헤더의 키 버전으로 이전 키로 암호화된 값을 찾아, 읽을 때 새 키로 다시 암호화할
+수 있습니다 (``needs_reencryption``, ``reencrypt``). 테넌트 ID는 추가 인증 데이터로
+묶이므로 다른 테넌트의 암호문은 복호화되지 않습니다.
+"""
+
+import asyncio
+import base64
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from ...core.settings import get_settings
+from .aes import derive_key
+from .base import DataKeyRecord, DataKeyStore, Encryptor, MasterKey
+from .redis import RedisDataKeyStore
+
+settings = get_settings()
+
+ENVELOPE_PREFIX = "env1"
+_NONCE_SIZE = 12
+
+
+def _b64encode(data: bytes) -> str:
+    """바이트를 패딩 없는 URL-safe base64 문자열로 바꿉니다."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data: str) -> bytes:
+    """패딩 없는 URL-safe base64 문자열을 바이트로 바꿉니다."""
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class LocalMasterKey(MasterKey):
+    """설정의 키 재료에서 파생한 마스터 키입니다."""
+
+    def __init__(self, version: str, secret: str):
+        """마스터 키를 초기화합니다.
+
+        Args:
+            version: 마스터 키 버전
+            secret: 키 재료
+        """
+        self.version = version
+        self._aead = AESGCM(
+            derive_key(
+                secret,
+                salt=b"llm-agent-master",
+                iterations=settings.ENCRYPTION_KDF_ITERATIONS,
+            )
+        )
+
+    async def wrap(self, data_key: bytes, context: bytes) -> bytes:
+        """데이터 키를 감쌉니다.
+
+        Args:
+            data_key: 데이터 키
+            context: 감싼 키를 묶을 문맥 (예: 테넌트 ID)
+
+        Returns:
+            감싼 데이터 키
+        """
+        nonce = os.urandom(_NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, data_key, context)
+
+    async def unwrap(self, wrapped_key: bytes, context: bytes) -> bytes:
+        """감싼 데이터 키를 풉니다.
+
+        Args:
+            wrapped_key: 감싼 데이터 키
+            context: 감쌀 때 사용한 문맥
+
+        Returns:
+            데이터 키
+
+        Raises:
+            ValueError: 감싼 키가 손상되었거나 문맥이 다른 경우
+        """
+        try:
+            return self._aead.decrypt(
+                wrapped_key[:_NONCE_SIZE],
+                wrapped_key[_NONCE_SIZE:],
+                context,
+            )
+        except InvalidTag as exc:
+            raise ValueError("데이터 키를 풀 수 없습니다.") from exc
+
+
+class InMemoryDataKeyStore(DataKeyStore):
+    """프로세스 메모리에 데이터 키를 보관하는 저장소입니다. 단일 프로세스 개발용입니다."""
+
+    def __init__(self):
+        """데이터 키 저장소를 초기화합니다."""
+        self._records: Dict[str, DataKeyRecord] = {}
+
+    async def get_current(self, tenant_id: str) -> Optional[DataKeyRecord]:
+        """테넌트의 현재 데이터 키를 조회합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            현재 데이터 키 (없으면 None)
+        """
+        return self._records.get(tenant_id)
+
+    async def set_current(
+        self,
+        tenant_id: str,
+        record: DataKeyRecord,
+        replace: bool = False,
+    ) -> DataKeyRecord:
+        """테넌트의 현재 데이터 키를 저장합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+            record: 저장할 데이터 키
+            replace: 이미 있는 키를 바꿀지 여부 (False면 없을 때만 저장)
+
+        Returns:
+            저장 후의 현재 데이터 키
+        """
+        if replace or tenant_id not in self._records:
+            self._records[tenant_id] = record
+        return self._records[tenant_id]
+
+
+class DataKeyCache:
+    """푼 데이터 키와 테넌트별 현재 키의 LRU 캐시입니다."""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """캐시를 초기화합니다.
+
+        Args:
+            max_entries: 최대 항목 수
+            ttl: 항목 유지 시간(초)
+        """
+        self.max_entries = max_entries or settings.ENCRYPTION_DATA_KEY_CACHE_SIZE
+        self.ttl = ttl or settings.ENCRYPTION_DATA_KEY_CACHE_TTL
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._loading: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        """캐시된 항목 수를 반환합니다."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """항목을 조회합니다.
+
+        Args:
+            key: 항목 키
+
+        Returns:
+            항목 값 (없거나 만료되었으면 None)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """항목을 저장합니다.
+
+        Args:
+            key: 항목 키
+            value: 항목 값
+        """
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """항목을 지웁니다.
+
+        Args:
+            key: 항목 키
+        """
+        self._entries.pop(key, None)
+
+    async def get_or_load(
+        self, key: Hashable, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """항목을 조회하고, 없으면 불러와 저장합니다.
+
+        같은 키를 동시에 요청하면 불러오기를 한 번만 실행하고 결과를 나눠 씁니다.
+
+        Args:
+            key: 항목 키
+            loader: 항목 값을 불러오는 함수
+
+        Returns:
+            항목 값
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        future = self._loading.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(key, loader))
+            self._loading[key] = future
+        # 먼저 요청한 호출이 취소되어도 기다리는 다른 호출에 영향이 없게 합니다.
+        return await asyncio.shield(future)
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """항목을 불러와 저장합니다."""
+        try:
+            value = await loader()
+            self.set(key, value)
+            return value
+        finally:
+            self._loading.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 항목을 지웁니다."""
+        self._entries.clear()
+
+
+class EnvelopeKeyManager:
+    """테넌트별 데이터 키를 만들고, 감싸고, 푸는 관리자입니다."""
+
+    def __init__(
+        self,
+        store: Optional[DataKeyStore] = None,
+        master_keys: Optional[Dict[str, MasterKey]] = None,
+        master_version: Optional[str] = None,
+        cache: Optional[DataKeyCache] = None,
+    ):
+        """키 관리자를 초기화합니다.
+
+        Args:
+            store: 현재 데이터 키 저장소
+            master_keys: 버전별 마스터 키 (없으면 ``ENCRYPTION_MASTER_KEYS`` 설정)
+            master_version: 새 데이터 키를 감쌀 마스터 키 버전
+            cache: 데이터 키 캐시
+
+        Raises:
+            ValueError: 현재 마스터 키 버전이 없는 경우
+        """
+        self.store = store or RedisDataKeyStore()
+        self.master_version = master_version or settings.ENCRYPTION_MASTER_KEY_VERSION
+        if master_keys is None:
+            secrets = settings.ENCRYPTION_MASTER_KEYS or {
+                self.master_version: settings.SECRET_KEY
+            }
+            master_keys = {
+                version: LocalMasterKey(version, secret)
+                for version, secret in secrets.items()
+            }
+        if self.master_version not in master_keys:
+            raise ValueError(f"마스터 키 버전이 없습니다: {self.master_version}")
+        self.master_keys = master_keys
+        self.cache = cache or DataKeyCache()
+
+    async def current_key(self, tenant_id: str) -> Tuple[DataKeyRecord, AESGCM]:
+        """테넌트의 현재 데이터 키를 가져옵니다. 없으면 새로 만듭니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            현재 데이터 키와 암호화 인스턴스
+        """
+
+        async def load() -> DataKeyRecord:
+            record = await self.store.get_current(tenant_id)
+            if record is None or record.master_version != self.master_version:
+                # 마스터 키가 교체되었으면 새 데이터 키로 넘어갑니다.
+                record = await self.store.set_current(
+                    tenant_id,
+                    await self._generate(tenant_id),
+                    replace=record is not None,
+                )
+            return record
+
+        record = await self.cache.get_or_load(("current", tenant_id), load)
+        return record, await self.data_key(tenant_id, record)
+
+    async def data_key(self, tenant_id: str, record: DataKeyRecord) -> AESGCM:
+        """감싼 데이터 키를 풀어 암호화 인스턴스를 반환합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+            record: 감싼 데이터 키
+
+        Returns:
+            암호화 인스턴스
+
+        Raises:
+            ValueError: 마스터 키 버전이 없거나 키를 풀 수 없는 경우
+        """
+
+        async def load() -> AESGCM:
+            master_key = self.master_keys.get(record.master_version)
+            if master_key is None:
+                raise ValueError(f"마스터 키 버전이 없습니다: {record.master_version}")
+            data_key = await master_key.unwrap(
+                _b64decode(record.wrapped_key), tenant_id.encode()
+            )
+            return AESGCM(data_key)
+
+        return await self.cache.get_or_load(("data", tenant_id, record.key_id), load)
+
+    async def rotate(self, tenant_id: str) -> DataKeyRecord:
+        """테넌트의 데이터 키를 새로 만듭니다.
+
+        이전 키로 암호화된 값은 계속 복호화할 수 있으며, ``reencrypt``로 새 키로
+        옮길 수 있습니다. 다른 프로세스는 캐시 TTL이 지난 뒤 새 키를 사용합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            새 데이터 키
+        """
+        record = await self.store.set_current(
+            tenant_id,
+            await self._generate(tenant_id),
+            replace=True,
+        )
+        self.cache.set(("current", tenant_id), record)
+        return record
+
+    async def is_current(
+        self, tenant_id: str, master_version: str, key_id: str
+    ) -> bool:
+        """키 버전이 테넌트의 현재 데이터 키인지 확인합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+            master_version: 마스터 키 버전
+            key_id: 데이터 키 ID
+
+        Returns:
+            현재 키이면 True
+        """
+        if master_version != self.master_version:
+            return False
+        record, _ = await self.current_key(tenant_id)
+        return record.key_id == key_id
+
+    async def _generate(self, tenant_id: str) -> DataKeyRecord:
+        """새 데이터 키를 만들어 현재 마스터 키로 감쌉니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            감싼 데이터 키
+        """
+        data_key = AESGCM.generate_key(bit_length=256)
+        wrapped = await self.master_keys[self.master_version].wrap(
+            data_key, tenant_id.encode()
+        )
+        # 감싸는 데 사용한 키를 캐시에 넣어 바로 다시 풀지 않게 합니다.
+        key_id = os.urandom(8).hex()
+        self.cache.set(("data", tenant_id, key_id), AESGCM(data_key))
+        return DataKeyRecord(
+            key_id=key_id,
+            master_version=self.master_version,
+            wrapped_key=_b64encode(wrapped),
+        )
+
+
+class EnvelopeEncryptor(Encryptor):
+    """테넌트 데이터 키를 사용하는 봉투 암호화 구현입니다."""
+
+    def __init__(self, tenant_id: str, keys: Optional[EnvelopeKeyManager] = None):
+        """봉투 암호화를 초기화합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+            keys: 키 관리자 (없으면 공유 관리자)
+        """
+        self.tenant_id = tenant_id
+        self.keys = keys or get_envelope_keys()
+
+    @staticmethod
+    def is_encrypted(value: str) -> bool:
+        """값이 봉투 암호화된 값인지 확인합니다.
+
+        Args:
+            value: 확인할 값
+
+        Returns:
+            봉투 암호문이면 True
+        """
+        return value.startswith(ENVELOPE_PREFIX + "$")
+
+    async def encrypt(self, data: Any) -> str:
+        """데이터를 테넌트의 현재 데이터 키로 암호화합니다.
+
+        Args:
+            data: 암호화할 데이터
+
+        Returns:
+            암호화된 데이터
+        """
+        record, aead = await self.keys.current_key(self.tenant_id)
+        header = "$".join(
+            (ENVELOPE_PREFIX, record.master_version, record.key_id, record.wrapped_key)
+        )
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = aead.encrypt(nonce, json.dumps(data).encode(), self._aad(header))
+        return f"{header}${_b64encode(nonce + ciphertext)}"
+
+    async def decrypt(self, encrypted_data: str) -> Any:
+        """암호화된 데이터를 복호화합니다.
+
+        Args:
+            encrypted_data: 암호화된 데이터
+
+        Returns:
+            복호화된 데이터
+
+        Raises:
+            ValueError: 형식이 맞지 않거나, 변조되었거나, 다른 테넌트의 값인 경우
+        """
+        header, record, payload = self._parse(encrypted_data)
+        aead = await self.keys.data_key(self.tenant_id, record)
+        try:
+            plaintext = aead.decrypt(
+                payload[:_NONCE_SIZE],
+                payload[_NONCE_SIZE:],
+                self._aad(header),
+            )
+        except InvalidTag as exc:
+            raise ValueError("암호화된 데이터를 복호화할 수 없습니다.") from exc
+        return json.loads(plaintext.decode())
+
+    async def decrypt_many(self, encrypted_values: Sequence[str]) -> List[Any]:
+        """여러 암호화된 값을 복호화합니다.
+
+        Args:
+            encrypted_values: 암호화된 값 목록
+
+        Returns:
+            입력과 같은 순서의 복호화된 값 목록
+        """
+        return [await self.decrypt(value) for value in encrypted_values]
+
+    async def encrypt_dict(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """딕셔너리를 암호화합니다.
+
+        Args:
+            data: 암호화할 딕셔너리
+
+        Returns:
+            암호화된 딕셔너리
+        """
+        return {key: await self.encrypt(value) for key, value in data.items()}
+
+    async def decrypt_dict(self, encrypted_data: Dict[str, str]) -> Dict[str, Any]:
+        """암호화된 딕셔너리를 복호화합니다.
+
+        Args:
+            encrypted_data: 암호화된 딕셔너리
+
+        Returns:
+            복호화된 딕셔너리
+        """
+        return {key: await self.decrypt(value) for key, value in encrypted_data.items()}
+
+    async def needs_reencryption(self, value: str) -> bool:
+        """값을 현재 키로 다시 암호화해야 하는지 확인합니다.
+
+        Args:
+            value: 저장된 값 (암호화 전의 평문일 수 있음)
+
+        Returns:
+            평문이거나 이전 키로 암호화된 값이면 True
+        """
+        if not self.is_encrypted(value):
+            return True
+        _, record, _ = self._parse(value)
+        return not await self.keys.is_current(
+            self.tenant_id, record.master_version, record.key_id
+        )
+
+    async def reencrypt(self, value: str) -> str:
+        """값을 현재 키로 다시 암호화합니다. 이미 현재 키이면 그대로 반환합니다.
+
+        암호화되지 않은 값은 평문으로 보고 암호화하므로, 기존 평문 데이터도 읽을 때
+        점진적으로 옮길 수 있습니다.
+
+        Args:
+            value: 저장된 값
+
+        Returns:
+            현재 키로 암호화된 값
+        """
+        if not await self.needs_reencryption(value):
+            return value
+        if not self.is_encrypted(value):
+            return await self.encrypt(value)
+        return await self.encrypt(await self.decrypt(value))
+
+    def _aad(self, header: str) -> bytes:
+        """테넌트 ID와 헤더를 묶은 추가 인증 데이터를 만듭니다."""
+        return f"{self.tenant_id}${header}".encode()
+
+    def _parse(self, value: str) -> Tuple[str, DataKeyRecord, bytes]:
+        """암호문을 헤더, 데이터 키, 본문으로 나눕니다.
+
+        Args:
+            value: 암호문
+
+        Returns:
+            헤더, 감싼 데이터 키, 논스와 암호문
+
+        Raises:
+            ValueError: 형식이 맞지 않는 경우
+        """
+        parts = value.split("$")
+        if len(parts) != 5 or parts[0] != ENVELOPE_PREFIX:
+            raise ValueError("봉투 암호문 형식이 올바르지 않습니다.")
+        _, master_version, key_id, wrapped_key, payload = parts
+        record = DataKeyRecord(
+            key_id=key_id,
+            master_version=master_version,
+            wrapped_key=wrapped_key,
+        )
+        return "$".join(parts[:4]), record, _b64decode(payload)
+
+
+_envelope_keys: Optional[EnvelopeKeyManager] = None
+
+
+def get_envelope_keys() -> EnvelopeKeyManager:
+    """애플리케이션 전체에서 공유하는 키 관리자를 반환합니다.
+
+    Returns:
+        키 관리자
+    """
+    global _envelope_keys
+    if _envelope_keys is None:
+        _envelope_keys = EnvelopeKeyManager()
+    return _envelope_keys
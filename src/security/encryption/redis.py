@@ -0,0 +1,82 @@
+"""Redis를 사용한 데이터 키 저장소를 구현합니다.
+
+감싼 데이터 키는 암호문 헤더에도 들어 있으므로 이 저장소는 여러 프로세스가 같은
+현재 키를 사용하게 하는 용도입니다. 저장소를 잃어도 기존 데이터는 복호화할 수
+있으며, 다음 암호화 때 새 데이터 키가 만들어집니다.
+"""
+
+from typing import Optional
+
+import redis.asyncio as redis
+
+from ...cache.redis import get_connection_pool
+from ...core.settings import get_settings
+from .base import DataKeyRecord, DataKeyStore
+
+settings = get_settings()
+
+
+class RedisDataKeyStore(DataKeyStore):
+    """Redis를 사용한 데이터 키 저장소입니다."""
+
+    def __init__(
+        self, redis_url: Optional[str] = None, prefix: str = "encryption:data_key"
+    ):
+        """데이터 키 저장소를 초기화합니다.
+
+        Args:
+            redis_url: Redis URL
+            prefix: 키 접두사
+        """
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.prefix = prefix
+        self.redis: Optional[redis.Redis] = None
+
+    async def _get_redis(self) -> redis.Redis:
+        """Redis 클라이언트를 가져옵니다.
+
+        Returns:
+            Redis 클라이언트
+        """
+        if not self.redis:
+            self.redis = redis.Redis(
+                connection_pool=get_connection_pool(self.redis_url)
+            )
+        return self.redis
+
+    async def get_current(self, tenant_id: str) -> Optional[DataKeyRecord]:
+        """테넌트의 현재 데이터 키를 조회합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+
+        Returns:
+            현재 데이터 키 (없으면 None)
+        """
+        client = await self._get_redis()
+        value = await client.get(f"{self.prefix}:{tenant_id}")
+        if value is None:
+            return None
+        return DataKeyRecord.model_validate_json(value)
+
+    async def set_current(
+        self,
+        tenant_id: str,
+        record: DataKeyRecord,
+        replace: bool = False,
+    ) -> DataKeyRecord:
+        """테넌트의 현재 데이터 키를 저장합니다.
+
+        Args:
+            tenant_id: 테넌트 ID
+            record: 저장할 데이터 키
+            replace: 이미 있는 키를 바꿀지 여부 (False면 없을 때만 저장)
+
+        Returns:
+            저장 후의 현재 데이터 키 (다른 프로세스가 먼저 저장했으면 그 키)
+        """
+        client = await self._get_redis()
+        key = f"{self.prefix}:{tenant_id}"
+        if await client.set(key, record.model_dump_json(), nx=not replace):
+            return record
+        return await self.get_current(tenant_id) or record
@@ -0,0 +1,200 @@
+"""큰 데이터를 조각 단위로 암호화하는 스트리밍 AEAD를 구현합니다.
+
+전체 데이터를 메모리에 올리지 않고 고정 크기 조각마다 AES-GCM으로 암호화합니다.
+논스는 스트림마다 임의로 정한 접두사, 조각 번호, 마지막 조각 여부로 구성되므로
+(STREAM 구성) 조각의 순서를 바꾸거나, 빼거나, 스트림을 중간에서 자르면 복호화가
+실패합니다. 스트림 키는 마스터 키와 스트림마다 새로 만든 솔트로 HKDF 파생하여
+스트림 간에 논스가 겹치지 않게 합니다.
+
+형식:
+    헤더: 매직(4) + 솔트(16) + 논스 접두사(7) + 조각 크기(4, 빅엔디언)
+    조각: AES-GCM(조각 평문) + 태그(16), 헤더를 추가 인증 데이터로 사용
+"""
+
+import os
+import struct
+from typing import AsyncIterable, AsyncIterator, Iterable, Union
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+MAGIC = b"LAS1"
+TAG_SIZE = 16
+# 조각 하나를 메모리에 올려 처리하므로, 헤더의 조각 크기로 큰 메모리를 잡지 않게 제한합니다.
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+_HEADER = struct.Struct(">4s16s7sI")
+_MAX_CHUNKS = 2**32
+
+ByteSource = Union[AsyncIterable[bytes], Iterable[bytes]]
+
+
+def _aead(master_key: bytes, salt: bytes) -> AESGCM:
+    """스트림마다 다른 AES-GCM 키를 파생합니다.
+
+    Args:
+        master_key: 마스터 키
+        salt: 스트림 솔트
+
+    Returns:
+        AES-GCM 인스턴스
+    """
+    hkdf = HKDF(
+        algorithm=hashes.SHA256(), length=32, salt=salt, info=b"llm-agent stream v1"
+    )
+    return AESGCM(hkdf.derive(master_key))
+
+
+def _check_chunk_size(chunk_size: int) -> None:
+    """조각 크기가 허용 범위인지 확인합니다.
+
+    Args:
+        chunk_size: 조각 크기 (바이트)
+
+    Raises:
+        ValueError: 0 이하이거나 ``MAX_CHUNK_SIZE``보다 큰 경우
+    """
+    if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+        raise ValueError(
+            f"조각 크기는 1 이상 {MAX_CHUNK_SIZE} 이하여야 합니다: {chunk_size}"
+        )
+
+
+def _nonce(prefix: bytes, counter: int, last: bool) -> bytes:
+    """조각의 논스를 만듭니다.
+
+    Args:
+        prefix: 스트림 논스 접두사
+        counter: 조각 번호
+        last: 마지막 조각 여부
+
+    Returns:
+        12바이트 논스
+
+    Raises:
+        ValueError: 조각 수가 한도를 넘은 경우
+    """
+    if counter >= _MAX_CHUNKS:
+        raise ValueError("스트림이 너무 큽니다.")
+    return prefix + struct.pack(">IB", counter, int(last))
+
+
+class _Reader:
+    """임의 크기로 들어오는 바이트 조각에서 원하는 크기만큼 읽습니다."""
+
+    def __init__(self, source: ByteSource):
+        """읽기 도구를 초기화합니다.
+
+        Args:
+            source: 바이트 조각의 (비동기) 이터러블
+        """
+        self._iterator = _aiter(source)
+        self._buffer = bytearray()
+        self._eof = False
+
+    async def read(self, size: int) -> bytes:
+        """최대 ``size`` 바이트를 읽습니다. 끝에 도달한 경우에만 더 적게 반환합니다.
+
+        Args:
+            size: 읽을 바이트 수
+
+        Returns:
+            읽은 바이트
+        """
+        while len(self._buffer) < size and not self._eof:
+            try:
+                self._buffer += await self._iterator.__anext__()
+            except StopAsyncIteration:
+                self._eof = True
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+async def _aiter(source: ByteSource) -> AsyncIterator[bytes]:
+    """동기 또는 비동기 이터러블을 비동기 이터레이터로 바꿉니다."""
+    if hasattr(source, "__aiter__"):
+        async for chunk in source:
+            yield chunk
+    else:
+        for chunk in source:
+            yield chunk
+
+
+async def encrypt_stream(
+    master_key: bytes,
+    source: ByteSource,
+    chunk_size: int,
+) -> AsyncIterator[bytes]:
+    """바이트 스트림을 조각 단위로 암호화합니다.
+
+    Args:
+        master_key: 마스터 키 (32바이트)
+        source: 평문 바이트 조각의 (비동기) 이터러블
+        chunk_size: 암호화 조각 크기
+
+    Yields:
+        헤더, 그리고 암호화된 조각
+
+    Raises:
+        ValueError: 조각 크기가 허용 범위를 벗어난 경우
+    """
+    _check_chunk_size(chunk_size)
+    salt, prefix = os.urandom(16), os.urandom(7)
+    header = _HEADER.pack(MAGIC, salt, prefix, chunk_size)
+    aead = _aead(master_key, salt)
+    yield header
+
+    reader = _Reader(source)
+    counter = 0
+    chunk = await reader.read(chunk_size)
+    while True:
+        # 다음 조각을 미리 읽어 지금 조각이 마지막인지 판단합니다.
+        following = await reader.read(chunk_size) if len(chunk) == chunk_size else b""
+        last = not following
+        yield aead.encrypt(_nonce(prefix, counter, last), chunk, header)
+        if last:
+            return
+        chunk = following
+        counter += 1
+
+
+async def decrypt_stream(master_key: bytes, source: ByteSource) -> AsyncIterator[bytes]:
+    """``encrypt_stream``으로 암호화한 스트림을 복호화합니다.
+
+    Args:
+        master_key: 마스터 키 (32바이트)
+        source: 암호문 바이트 조각의 (비동기) 이터러블
+
+    Yields:
+        복호화된 조각
+
+    Raises:
+        ValueError: 형식이 맞지 않거나(조각 크기가 허용 범위를 벗어난 경우 포함),
+            변조되었거나, 잘린 스트림인 경우
+    """
+    reader = _Reader(source)
+    header = await reader.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise ValueError("암호화된 스트림의 헤더가 올바르지 않습니다.")
+    magic, salt, prefix, chunk_size = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError("암호화된 스트림의 형식이 올바르지 않습니다.")
+    _check_chunk_size(chunk_size)
+    aead = _aead(master_key, salt)
+
+    block_size = chunk_size + TAG_SIZE
+    counter = 0
+    block = await reader.read(block_size)
+    while True:
+        following = await reader.read(block_size) if len(block) == block_size else b""
+        last = not following
+        try:
+            yield aead.decrypt(_nonce(prefix, counter, last), block, header)
+        except InvalidTag as exc:
+            raise ValueError("암호화된 스트림이 변조되었거나 잘렸습니다.") from exc
+        if last:
+            return
+        block = following
+        counter += 1
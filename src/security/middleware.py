@@ -1,16 +1,42 @@
 """보안을 위한 미들웨어 모듈입니다."""
 
+import hashlib
 from typing import Optional
 
 from fastapi import Request
+from fastapi.responses import JSONResponse
+from jose import JWTError
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
 
-from .auth import verify_token
+from ..core.settings import get_settings
+from .rate_limit.policy import API_KEY_HEADER
+from .revocation import revocation_list
+from .routes import RouteRegistry, route_registry
+from .token_cache import token_cache
+
+settings = get_settings()
 
 
 class SecurityMiddleware(BaseHTTPMiddleware):
-    """보안을 위한 미들웨어입니다."""
+    """보안을 위한 미들웨어입니다.
+
+    경로 정책 등록부에서 요청에 적용할 정책을 한 번 조회하여 인증 방식을 정하고,
+    정책은 ``request.state.route_policy``에 담아 이후 미들웨어가 다시 조회하지 않게
+    합니다. 검증한 토큰의 클레임은 ``request.state.token_claims``에 담아, 의존성과
+    이후 미들웨어가 토큰을 다시 검증하지 않고 사용할 수 있게 합니다.
+    """
+
+    def __init__(self, app, routes: Optional[RouteRegistry] = None):
+        """보안 미들웨어를 초기화합니다.
+
+        Args:
+            app: ASGI 애플리케이션
+            routes: 경로 정책 등록부 (없으면 공유 등록부)
+        """
+        super().__init__(app)
+        self.routes = routes or route_registry
+        self._api_key_hashes = frozenset(settings.AUTH_API_KEY_HASHES)
 
     async def dispatch(self, request: Request, call_next: callable) -> Response:
         """요청을 처리합니다.
@@ -22,46 +48,61 @@ class SecurityMiddleware(BaseHTTPMiddleware):
         Returns:
             FastAPI 응답 객체
         """
-        # 인증이 필요한 경로인지 확인
-        if self._requires_auth(request.url.path):
+        policy = self.routes.resolve(request.url.path, request.method)
+        request.state.route_policy = policy
+
+        if policy.access == "api_key":
+            # API 키 확인 (원본 키 대신 다이제스트를 비교하고 보관)
+            api_key = request.headers.get(API_KEY_HEADER)
+            digest = hashlib.sha256(api_key.encode()).hexdigest() if api_key else None
+            if digest is None or digest not in self._api_key_hashes:
+                return JSONResponse(
+                    status_code=401,
+                    content={"detail": "유효하지 않은 API 키입니다."},
+                )
+            request.state.api_key_id = digest[:32]
+
+        elif policy.access == "authenticated":
             # Authorization 헤더 확인
             auth_header = request.headers.get("Authorization")
             if not auth_header or not auth_header.startswith("Bearer "):
-                return Response(
+                return JSONResponse(
                     status_code=401,
                     content={"detail": "인증이 필요합니다."},
                 )
 
-            # 토큰 검증
+            # 토큰 검증 (검증된 토큰은 캐시된 클레임을 사용)
             token = auth_header.split(" ")[1]
-            subject = verify_token(token)
-            if not subject:
-                return Response(
+            try:
+                claims = token_cache.decode(token)
+            except JWTError:
+                claims = None
+            if not claims or not claims.get("sub"):
+                return JSONResponse(
                     status_code=401,
                     content={"detail": "유효하지 않은 토큰입니다."},
                 )
 
+            # 폐기 확인 (대부분 워커의 블룸 필터만으로 끝남)
+            if await revocation_list.is_revoked(claims, token):
+                return JSONResponse(
+                    status_code=401,
+                    content={"detail": "폐기된 토큰입니다."},
+                )
+
+            # 권한 범위 확인
+            scopes = claims.get("scopes", [])
+            if not set(policy.scopes).issubset(scopes):
+                return JSONResponse(
+                    status_code=403,
+                    content={"detail": "접근 권한이 없습니다."},
+                )
+
             # 요청 상태에 사용자 정보 추가
-            request.state.user_id = subject
+            request.state.user_id = claims["sub"]
+            request.state.scopes = scopes
+            request.state.token_claims = claims
 
         # 다음 미들웨어/라우트 핸들러 호출
         response = await call_next(request)
         return response
-
-    def _requires_auth(self, path: str) -> bool:
-        """인증이 필요한 경로인지 확인합니다.
-
-        Args:
-            path: 요청 경로
-
-        Returns:
-            인증이 필요하면 True, 아니면 False
-        """
-        # 인증이 필요하지 않은 경로 목록
-        public_paths = [
-            "/api/v1/auth/login",
-            "/api/v1/auth/register",
-            "/api/v1/docs",
-            "/api/v1/openapi.json",
-        ]
-        return not any(path.startswith(p) for p in public_paths)
@@ -0,0 +1,174 @@
+"""비밀번호 해시를 이벤트 루프 밖에서 계산하는 모듈입니다.
+
+bcrypt 해시와 검증은 한 번에 수백 밀리초가 걸리는 CPU 작업이므로, 이벤트 루프
+스레드에서 실행하면 그동안 같은 워커의 다른 요청이 모두 멈춥니다.
+``PasswordHasher``는 하나로 설정된 ``CryptContext``를 재사용하고, 작업을 크기가
+제한된 스레드 또는 프로세스 풀에서 실행합니다. 대기 중인 작업 수도 제한하여
+로그인 요청이 몰려도 다른 요청의 처리량을 빼앗지 않게 합니다.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from ..core.errors import RateLimitError
+from ..core.settings import get_settings
+
+settings = get_settings()
+
+# 애플리케이션 전체에서 공유하는 비밀번호 해시 설정
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+
+def _hash(password: str) -> str:
+    """비밀번호를 해시합니다.
+
+    프로세스 풀에서 실행할 수 있도록 모듈 함수로 둡니다.
+    """
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """비밀번호를 검증하고, 해시 설정이 바뀌었으면 새 해시를 함께 반환합니다."""
+    return pwd_context.verify_and_update(password, hashed)
+
+
+class PasswordHasher:
+    """비밀번호 해시를 제한된 작업자 풀에서 계산하는 서비스입니다.
+
+    bcrypt는 해시 중에 GIL을 놓으므로 기본값인 스레드 풀로도 이벤트 루프가
+    멈추지 않습니다. 프로세스 풀은 다른 CPU 작업과 GIL 경쟁을 피해야 할 때
+    사용합니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        executor: Optional[str] = None,
+    ):
+        """비밀번호 해시 서비스를 초기화합니다.
+
+        Args:
+            max_workers: 동시에 해시를 계산하는 작업자 수
+            max_pending: 실행 중인 작업을 포함해 받을 수 있는 최대 작업 수
+            executor: 작업자 풀 종류 (thread, process)
+
+        Raises:
+            ValueError: 지원하지 않는 작업자 풀 종류인 경우
+        """
+        self.max_workers = max_workers or settings.PASSWORD_HASH_WORKERS
+        self.max_pending = max_pending or settings.PASSWORD_HASH_MAX_PENDING
+        self.executor_type = executor or settings.PASSWORD_HASH_EXECUTOR
+        if self.executor_type not in ("thread", "process"):
+            raise ValueError(f"지원하지 않는 작업자 풀입니다: {self.executor_type}")
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """실행 중이거나 기다리는 작업 수를 반환합니다."""
+        return self._pending
+
+    async def hash(self, password: str) -> str:
+        """비밀번호를 해시합니다.
+
+        Args:
+            password: 평문 비밀번호
+
+        Returns:
+            해시된 비밀번호
+
+        Raises:
+            RateLimitError: 대기 중인 작업이 너무 많은 경우
+        """
+        return await self._run(_hash, password)
+
+    async def verify(self, password: str, hashed: str) -> bool:
+        """비밀번호를 검증합니다.
+
+        Args:
+            password: 평문 비밀번호
+            hashed: 해시된 비밀번호
+
+        Returns:
+            일치하면 True
+
+        Raises:
+            RateLimitError: 대기 중인 작업이 너무 많은 경우
+        """
+        verified, _ = await self.verify_and_update(password, hashed)
+        return verified
+
+    async def verify_and_update(
+        self, password: str, hashed: str
+    ) -> Tuple[bool, Optional[str]]:
+        """비밀번호를 검증하고, 해시 설정(예: bcrypt 라운드)이 바뀌었으면 새 해시를 만듭니다.
+
+        Args:
+            password: 평문 비밀번호
+            hashed: 해시된 비밀번호
+
+        Returns:
+            일치 여부와 저장할 새 해시 (갱신이 필요 없으면 None)
+
+        Raises:
+            RateLimitError: 대기 중인 작업이 너무 많은 경우
+        """
+        return await self._run(_verify_and_update, password, hashed)
+
+    def shutdown(self) -> None:
+        """작업자 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """작업을 작업자 풀에서 실행합니다.
+
+        Args:
+            func: 실행할 함수
+            *args: 함수 인자
+
+        Returns:
+            함수 반환값
+
+        Raises:
+            RateLimitError: 대기 중인 작업이 너무 많은 경우
+        """
+        if self._pending >= self.max_pending:
+            raise RateLimitError(
+                "인증 요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                details={"retry_after": 1},
+            )
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="password-hash",
+                )
+
+        self._pending += 1
+        try:
+            # 작업자 풀의 내부 큐가 아닌 세마포어에서 기다리게 하여, 취소된 요청의
+            # 작업이 풀에 남아 CPU를 쓰지 않게 합니다.
+            async with self._semaphore:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+
+# 애플리케이션 전체에서 공유하는 비밀번호 해시 서비스
+password_hasher = PasswordHasher()
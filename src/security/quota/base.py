@@ -0,0 +1,97 @@
+"""토큰 사용량 할당량의 모델과 토큰 수 추정 함수를 정의합니다."""
+
+import math
+from typing import Any, Dict, Optional, Sequence, Union
+
+from pydantic import BaseModel
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - 선택 의존성
+    tiktoken = None
+
+# 메시지마다 역할과 구분자에 쓰이는 토큰 수 (OpenAI 채팅 형식 기준)
+_MESSAGE_OVERHEAD = 4
+
+_encodings: Dict[str, Any] = {}
+
+
+class QuotaReservation(BaseModel):
+    """요청 전에 미리 차감한 토큰 할당량입니다.
+
+    호출이 끝나면 ``used_tokens``에 실제 사용량을 기록하고 ``reconcile``로
+    차이를 정산합니다.
+    """
+
+    user_id: str
+    tenant_id: Optional[str] = None
+    reserved_tokens: int
+    remaining: Dict[str, int]  # 범위(user, tenant)별 차감 후 남은 토큰 수
+    used_tokens: Optional[int] = None
+    settled: bool = False
+
+
+def _encoding(model: Optional[str]) -> Any:
+    """모델에 맞는 tiktoken 인코딩을 가져옵니다."""
+    name = model or "cl100k_base"
+    encoding = _encodings.get(name)
+    if encoding is None:
+        try:
+            encoding = tiktoken.encoding_for_model(name)
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        _encodings[name] = encoding
+    return encoding
+
+
+def estimate_tokens(text: str, model: Optional[str] = None) -> int:
+    """텍스트의 토큰 수를 추정합니다.
+
+    tiktoken이 없으면 UTF-8 3바이트당 토큰 하나로 넉넉하게 추정합니다.
+
+    Args:
+        text: 텍스트
+        model: 모델 이름 (tiktoken 인코딩 선택에 사용)
+
+    Returns:
+        추정 토큰 수
+    """
+    if not text:
+        return 0
+    if tiktoken is not None:
+        return len(_encoding(model).encode(text, disallowed_special=()))
+    return math.ceil(len(text.encode("utf-8")) / 3)
+
+
+def estimate_prompt_tokens(
+    messages: Sequence[Union[str, Dict[str, Any]]],
+    max_completion_tokens: int = 0,
+    model: Optional[str] = None,
+) -> int:
+    """프롬프트 메시지의 토큰 수를 추정합니다.
+
+    Args:
+        messages: 문자열 또는 ``{"role": ..., "content": ...}`` 형식의 메시지 목록
+        max_completion_tokens: 미리 차감할 응답 토큰 수
+        model: 모델 이름
+
+    Returns:
+        추정 토큰 수
+    """
+    total = max_completion_tokens
+    for message in messages:
+        if isinstance(message, str):
+            total += estimate_tokens(message, model)
+            continue
+        total += _MESSAGE_OVERHEAD
+        for value in message.values():
+            if isinstance(value, str):
+                total += estimate_tokens(value, model)
+            elif isinstance(value, list):
+                # 여러 부분으로 된 content ({"type": "text", "text": ...})
+                total += sum(
+                    estimate_tokens(part.get("text", ""), model)
+                    for part in value
+                    if isinstance(part, dict)
+                )
+    return total
@@ -0,0 +1,350 @@
+"""Redis를 사용한 토큰 사용량 할당량을 구현합니다.
+
+사용자와 테넌트마다 토큰 버킷 하나를 두고, 버킷은 기간당 예산만큼 연속적으로
+채워집니다. 버킷 용량은 기간 예산에 ``burst_factor``를 곱한 값이므로 쌓아 둔
+만큼은 짧은 시간에 몰아 쓸 수 있습니다.
+
+LLM 호출 전에 추정 토큰 수를 모든 버킷에서 한 번에 차감하고, 호출이 끝나면
+실제 사용량과의 차이를 정산합니다. 실제 사용량이 더 많으면 버킷이 음수가 될 수
+있으며, 그만큼 다음 요청이 늦게 허용됩니다.
+"""
+
+import math
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
+from ...cache.redis import get_connection_pool
+from ...core.errors import RateLimitError
+from ...core.settings import get_settings
+from ...monitoring.metrics import QUOTA_REJECTED_TOTAL, QUOTA_TOKENS_TOTAL
+from .base import QuotaReservation
+
+settings = get_settings()
+
+# 버킷을 현재 시각까지 채우는 함수
+# 키가 없으면 가득 찬 버킷으로 보며, 가득 찰 때까지만 키를 유지합니다.
+_BUCKET = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
+
+local function refill(key, rate, capacity)
+    local data = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(data[1]) or capacity
+    local ts = tonumber(data[2]) or now
+    return math.min(capacity, tokens + math.max(now - ts, 0) * rate)
+end
+
+local function store(key, tokens, rate, capacity)
+    redis.call('HSET', key, 'tokens', string.format('%.3f', tokens), 'ts', string.format('%.3f', now))
+    redis.call('PEXPIRE', key, math.ceil((capacity - tokens) / rate) + 1000)
+end
+"""
+
+# 모든 버킷에 토큰이 충분할 때만 한꺼번에 차감합니다.
+# 용량보다 큰 요청은 버킷이 가득 찼을 때 허용하여 영원히 거부되지 않게 합니다.
+#
+# 인자: KEYS[i]: 버킷 키, ARGV[1]: 차감할 토큰 수,
+#       ARGV[2i], ARGV[2i + 1]: 밀리초당 충전량, 용량
+# 반환값: {허용 여부, 재시도까지 남은 시간 (밀리초), 버킷별 남은 토큰 수...}
+_RESERVE_SCRIPT = (
+    _BUCKET
+    + """
+local cost = tonumber(ARGV[1])
+local buckets = {}
+local allowed = 1
+local retry = 0
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[i * 2])
+    local capacity = tonumber(ARGV[i * 2 + 1])
+    local tokens = refill(KEYS[i], rate, capacity)
+    local need = math.min(cost, capacity)
+    if tokens < need then
+        allowed = 0
+        retry = math.max(retry, (need - tokens) / rate)
+    end
+    buckets[i] = tokens
+end
+local reply = {allowed, math.ceil(retry)}
+for i = 1, #KEYS do
+    local tokens = buckets[i]
+    if allowed == 1 and cost > 0 then
+        tokens = tokens - cost
+        store(KEYS[i], tokens, tonumber(ARGV[i * 2]), tonumber(ARGV[i * 2 + 1]))
+    end
+    reply[#reply + 1] = math.floor(tokens)
+end
+return reply
+"""
+)
+
+# 미리 차감한 양과 실제 사용량의 차이를 모든 버킷에 반영합니다.
+#
+# 인자: KEYS[i]: 버킷 키, ARGV[1]: 추가로 차감할 토큰 수 (음수면 환불),
+#       ARGV[2i], ARGV[2i + 1]: 밀리초당 충전량, 용량
+# 반환값: {버킷별 남은 토큰 수...}
+_ADJUST_SCRIPT = (
+    _BUCKET
+    + """
+local delta = tonumber(ARGV[1])
+local reply = {}
+for i = 1, #KEYS do
+    local rate = tonumber(ARGV[i * 2])
+    local capacity = tonumber(ARGV[i * 2 + 1])
+    local tokens = math.min(refill(KEYS[i], rate, capacity) - delta, capacity)
+    store(KEYS[i], tokens, rate, capacity)
+    reply[i] = math.floor(tokens)
+end
+return reply
+"""
+)
+
+
+class TokenQuota:
+    """사용자별, 테넌트별 토큰 사용량 할당량입니다.
+
+    요청 수가 아니라 LLM 토큰 사용량을 기준으로 제한하므로, 긴 컨텍스트를 쓰는
+    요청이 클러스터 처리량을 독차지하지 못하게 합니다.
+
+    사용 예::
+
+        async with quota.consume(user_id, tenant_id, estimated) as reservation:
+            response = await llm.ainvoke(messages)
+            reservation.used_tokens = response.usage_metadata["total_tokens"]
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        user_budget: Optional[int] = None,
+        tenant_budget: Optional[int] = None,
+        period_in_seconds: Optional[int] = None,
+        burst_factor: Optional[float] = None,
+    ):
+        """토큰 할당량을 초기화합니다.
+
+        Args:
+            redis_url: Redis URL
+            user_budget: 사용자별 기간당 토큰 예산 (0이면 제한 없음)
+            tenant_budget: 테넌트별 기간당 토큰 예산 (0이면 제한 없음)
+            period_in_seconds: 예산 기간(초)
+            burst_factor: 기간 예산 대비 버킷 용량 배수 (몰아 쓸 수 있는 양)
+        """
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.user_budget = (
+            settings.QUOTA_USER_TOKENS if user_budget is None else user_budget
+        )
+        self.tenant_budget = (
+            settings.QUOTA_TENANT_TOKENS if tenant_budget is None else tenant_budget
+        )
+        self.period_in_seconds = period_in_seconds or settings.QUOTA_PERIOD
+        self.burst_factor = burst_factor or settings.QUOTA_BURST_FACTOR
+        self.redis: Optional[redis.Redis] = None
+        self._reserve_script: Optional[AsyncScript] = None
+        self._adjust_script: Optional[AsyncScript] = None
+
+    async def _get_redis(self) -> redis.Redis:
+        """Redis 클라이언트를 가져옵니다.
+
+        Returns:
+            Redis 클라이언트
+        """
+        if not self.redis:
+            self.redis = redis.Redis(
+                connection_pool=get_connection_pool(self.redis_url)
+            )
+            self._reserve_script = self.redis.register_script(_RESERVE_SCRIPT)
+            self._adjust_script = self.redis.register_script(_ADJUST_SCRIPT)
+        return self.redis
+
+    def _buckets(
+        self, user_id: str, tenant_id: Optional[str]
+    ) -> List[Tuple[str, str, int]]:
+        """요청에 적용할 버킷 목록을 만듭니다.
+
+        Args:
+            user_id: 사용자 ID
+            tenant_id: 테넌트 ID
+
+        Returns:
+            ``(범위, 키, 기간 예산)`` 목록 (예산이 0인 범위는 제외)
+        """
+        buckets = [
+            (
+                "user",
+                f"quota:user:{user_id}",
+                settings.QUOTA_USER_BUDGETS.get(user_id, self.user_budget),
+            )
+        ]
+        if tenant_id is not None:
+            buckets.append(
+                (
+                    "tenant",
+                    f"quota:tenant:{tenant_id}",
+                    settings.QUOTA_TENANT_BUDGETS.get(tenant_id, self.tenant_budget),
+                )
+            )
+        return [bucket for bucket in buckets if bucket[2] > 0]
+
+    def _args(self, buckets: List[Tuple[str, str, int]], tokens: int) -> List[object]:
+        """스크립트 인자를 만듭니다.
+
+        Args:
+            buckets: 버킷 목록
+            tokens: 토큰 수
+
+        Returns:
+            스크립트 인자
+        """
+        args: List[object] = [tokens]
+        for _, _, budget in buckets:
+            rate = budget / (self.period_in_seconds * 1000)
+            args.extend((repr(rate), math.ceil(budget * self.burst_factor)))
+        return args
+
+    async def reserve(
+        self,
+        user_id: str,
+        tenant_id: Optional[str] = None,
+        tokens: int = 0,
+    ) -> QuotaReservation:
+        """추정 토큰 수를 사용자와 테넌트 할당량에서 한 번에 차감합니다.
+
+        Args:
+            user_id: 사용자 ID
+            tenant_id: 테넌트 ID
+            tokens: 추정 토큰 수
+
+        Returns:
+            차감 내역
+
+        Raises:
+            RateLimitError: 할당량이 부족한 경우
+        """
+        buckets = self._buckets(user_id, tenant_id)
+        if not buckets:
+            return QuotaReservation(
+                user_id=user_id,
+                tenant_id=tenant_id,
+                reserved_tokens=tokens,
+                remaining={},
+            )
+
+        await self._get_redis()
+        reply = await self._reserve_script(
+            keys=[key for _, key, _ in buckets],
+            args=self._args(buckets, tokens),
+        )
+        allowed, retry_ms = reply[0], reply[1]
+        remaining = {
+            scope: int(value) for (scope, _, _), value in zip(buckets, reply[2:])
+        }
+
+        if not allowed:
+            for scope, _, budget in buckets:
+                if remaining[scope] < min(
+                    tokens, math.ceil(budget * self.burst_factor)
+                ):
+                    QUOTA_REJECTED_TOTAL.labels(scope=scope).inc()
+            raise RateLimitError(
+                "토큰 사용량 한도를 초과했습니다.",
+                details={
+                    "retry_after": max(math.ceil(int(retry_ms) / 1000), 1),
+                    "remaining": remaining,
+                },
+            )
+
+        for scope, _, _ in buckets:
+            QUOTA_TOKENS_TOTAL.labels(scope=scope, operation="reserve").inc(tokens)
+        return QuotaReservation(
+            user_id=user_id,
+            tenant_id=tenant_id,
+            reserved_tokens=tokens,
+            remaining=remaining,
+        )
+
+    async def reconcile(
+        self,
+        reservation: QuotaReservation,
+        used_tokens: Optional[int] = None,
+    ) -> QuotaReservation:
+        """실제 사용량과 미리 차감한 양의 차이를 정산합니다.
+
+        같은 차감 내역은 한 번만 정산됩니다.
+
+        Args:
+            reservation: ``reserve``가 반환한 차감 내역
+            used_tokens: 실제 사용 토큰 수 (없으면 ``reservation.used_tokens``)
+
+        Returns:
+            정산된 차감 내역
+        """
+        if reservation.settled:
+            return reservation
+        if used_tokens is not None:
+            reservation.used_tokens = used_tokens
+        if reservation.used_tokens is None:
+            return reservation
+        reservation.settled = True
+
+        delta = reservation.used_tokens - reservation.reserved_tokens
+        buckets = self._buckets(reservation.user_id, reservation.tenant_id)
+        if delta == 0 or not buckets:
+            return reservation
+
+        await self._get_redis()
+        reply = await self._adjust_script(
+            keys=[key for _, key, _ in buckets],
+            args=self._args(buckets, delta),
+        )
+        reservation.remaining = {
+            scope: int(value) for (scope, _, _), value in zip(buckets, reply)
+        }
+        operation = "debit" if delta > 0 else "refund"
+        for scope, _, _ in buckets:
+            QUOTA_TOKENS_TOTAL.labels(scope=scope, operation=operation).inc(abs(delta))
+        return reservation
+
+    async def release(self, reservation: QuotaReservation) -> QuotaReservation:
+        """호출이 실패한 경우 미리 차감한 토큰을 모두 돌려줍니다.
+
+        Args:
+            reservation: ``reserve``가 반환한 차감 내역
+
+        Returns:
+            정산된 차감 내역
+        """
+        return await self.reconcile(reservation, used_tokens=0)
+
+    @asynccontextmanager
+    async def consume(
+        self,
+        user_id: str,
+        tenant_id: Optional[str] = None,
+        tokens: int = 0,
+    ) -> AsyncIterator[QuotaReservation]:
+        """추정 토큰을 차감하고, 블록이 끝나면 실제 사용량으로 정산합니다.
+
+        블록 안에서 ``used_tokens``를 기록하지 않으면 추정값을 그대로 사용량으로
+        봅니다. 블록에서 예외가 발생하면 차감한 토큰을 모두 돌려줍니다.
+
+        Args:
+            user_id: 사용자 ID
+            tenant_id: 테넌트 ID
+            tokens: 추정 토큰 수
+
+        Raises:
+            RateLimitError: 할당량이 부족한 경우
+        """
+        reservation = await self.reserve(user_id, tenant_id, tokens)
+        try:
+            yield reservation
+        except BaseException:
+            if reservation.used_tokens is None:
+                await self.release(reservation)
+            else:
+                await self.reconcile(reservation)
+            raise
+        await self.reconcile(reservation)
@@ -0,0 +1,364 @@
+"""동시 실행 수를 제한하는 요청 수락 제어를 구현합니다.
+
+요청 수(기간당)를 세는 요청 제한과 달리, 동시에 실행 중인 요청 수를 제한하여
+느린 LLM 호출이 쌓여 워커가 과부하되는 것을 막습니다. 슬롯이 없으면 요청은
+제한된 길이의 대기열에서 기다리고, 대기열이 가득 찼거나 기한 안에 슬롯을 얻을
+수 없다고 예상되면 기다리지 않고 바로 거부됩니다.
+
+제한은 워커 프로세스마다 적용됩니다.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, Optional, Sequence, Union
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ...core.settings import get_settings
+from ...monitoring.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_REJECTED_TOTAL,
+    ADMISSION_WAIT_SECONDS,
+)
+from ..routes import RouteTrie
+from .policy import RateLimitPolicy, request_principal
+
+settings = get_settings()
+
+# 클라이언트가 응답을 기다릴 수 있는 시간(초)을 알려 주는 요청 헤더
+REQUEST_TIMEOUT_HEADER = "x-request-timeout"
+
+# 처리 시간 지수 이동 평균의 가중치
+_SERVICE_TIME_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """요청 수락이 거부되었을 때 발생하는 예외입니다."""
+
+    def __init__(self, status_code: int, reason: str, retry_after: float):
+        """거부 예외를 초기화합니다.
+
+        Args:
+            status_code: 응답 상태 코드 (사용자별 한도 초과는 429, 과부하는 503)
+            reason: 거부 사유 (user_limit, queue_full, deadline, timeout)
+            retry_after: 다시 시도할 수 있을 때까지 예상되는 시간(초)
+        """
+        super().__init__(reason)
+        self.status_code = status_code
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """전체 및 사용자별 동시 실행 수를 제한하는 수락 제어기입니다.
+
+    슬롯은 대기열 순서대로 넘겨주며, 실행 중인 요청이 끝나면 기다리던 요청이
+    그 슬롯을 그대로 이어받습니다. 사용자별 한도에는 대기 중인 요청도 포함되므로
+    한 사용자가 대기열을 독차지할 수 없습니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_per_user: Optional[int] = None,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+    ):
+        """수락 제어기를 초기화합니다.
+
+        Args:
+            max_concurrency: 동시에 실행할 수 있는 최대 요청 수
+            max_per_user: 사용자 하나가 동시에 실행하거나 기다릴 수 있는 최대 요청 수
+            max_queue: 최대 대기열 길이 (0이면 기다리지 않고 거부)
+            queue_timeout: 최대 대기 시간(초)
+        """
+        self.max_concurrency = max_concurrency or settings.ADMISSION_MAX_CONCURRENCY
+        self.max_per_user = max_per_user or settings.ADMISSION_MAX_PER_USER
+        self.max_queue = (
+            settings.ADMISSION_MAX_QUEUE if max_queue is None else max_queue
+        )
+        self.queue_timeout = queue_timeout or settings.ADMISSION_QUEUE_TIMEOUT
+
+        self._active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._per_user: Dict[str, int] = {}
+        # 요청 하나의 평균 처리 시간(초), 대기 시간 예측에 사용
+        self._service_time = 1.0
+
+    @property
+    def active(self) -> int:
+        """실행 슬롯을 차지한 요청 수를 반환합니다."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """대기 중인 요청 수를 반환합니다."""
+        return len(self._waiters)
+
+    def estimated_wait(self, position: Optional[int] = None) -> float:
+        """대기열의 주어진 위치에서 슬롯을 얻기까지 예상되는 시간을 반환합니다.
+
+        Args:
+            position: 대기열 위치 (없으면 대기열 맨 뒤)
+
+        Returns:
+            예상 대기 시간(초)
+        """
+        position = len(self._waiters) + 1 if position is None else position
+        return position * self._service_time / self.max_concurrency
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        identity: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        """실행 슬롯을 얻고, 블록이 끝나면 반납합니다.
+
+        Args:
+            identity: 사용자별 한도를 적용할 식별자 (없으면 전체 한도만 적용)
+            timeout: 호출자가 기다릴 수 있는 최대 시간(초)
+
+        Raises:
+            AdmissionRejected: 슬롯을 얻지 못한 경우
+        """
+        await self.acquire(identity, timeout)
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(identity, time.monotonic() - started)
+
+    async def acquire(
+        self, identity: Optional[str] = None, timeout: Optional[float] = None
+    ) -> None:
+        """실행 슬롯을 얻습니다.
+
+        Args:
+            identity: 사용자별 한도를 적용할 식별자
+            timeout: 호출자가 기다릴 수 있는 최대 시간(초)
+
+        Raises:
+            AdmissionRejected: 사용자별 한도를 넘었거나, 대기열이 가득 찼거나,
+                기한 안에 슬롯을 얻지 못한 경우
+        """
+        if identity is not None:
+            if self._per_user.get(identity, 0) >= self.max_per_user:
+                raise self._reject(429, "user_limit", self._service_time)
+            self._per_user[identity] = self._per_user.get(identity, 0) + 1
+
+        try:
+            if self._active < self.max_concurrency and not self._waiters:
+                self._active += 1
+                ADMISSION_IN_FLIGHT.set(self._active)
+                ADMISSION_WAIT_SECONDS.observe(0.0)
+                return
+            await self._wait(timeout)
+        except BaseException:
+            self._release_user(identity)
+            raise
+
+    def release(
+        self, identity: Optional[str] = None, duration: Optional[float] = None
+    ) -> None:
+        """실행 슬롯을 반납하고 기다리던 요청에 넘겨줍니다.
+
+        Args:
+            identity: ``acquire``에 전달한 식별자
+            duration: 요청 처리 시간(초, 평균 처리 시간 갱신에 사용)
+        """
+        if duration is not None:
+            self._service_time += _SERVICE_TIME_ALPHA * (duration - self._service_time)
+        self._release_user(identity)
+        self._release_slot()
+
+    async def _wait(self, timeout: Optional[float]) -> None:
+        """대기열에서 슬롯을 넘겨받을 때까지 기다립니다.
+
+        Args:
+            timeout: 호출자가 기다릴 수 있는 최대 시간(초)
+
+        Raises:
+            AdmissionRejected: 대기열이 가득 찼거나 기한 안에 슬롯을 얻지 못한 경우
+        """
+        if len(self._waiters) >= self.max_queue:
+            raise self._reject(503, "queue_full", self.estimated_wait())
+        timeout = (
+            self.queue_timeout if timeout is None else min(timeout, self.queue_timeout)
+        )
+        estimate = self.estimated_wait()
+        if estimate > timeout:
+            # 기한 안에 처리될 가능성이 낮으면 기다리게 하지 않고 바로 거부합니다.
+            raise self._reject(503, "deadline", estimate)
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+        started = time.monotonic()
+        try:
+            await asyncio.wait({future}, timeout=timeout)
+        except BaseException:
+            # 취소되었는데 이미 슬롯을 넘겨받았다면 다음 요청에 넘겨줍니다.
+            if future.done() and not future.cancelled():
+                self._release_slot()
+            raise
+        finally:
+            if not future.done():
+                future.cancel()
+                self._waiters.remove(future)
+            ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+        if future.cancelled():
+            raise self._reject(503, "timeout", self.estimated_wait())
+        ADMISSION_WAIT_SECONDS.observe(time.monotonic() - started)
+
+    def _release_slot(self) -> None:
+        """슬롯을 대기열의 다음 요청에 넘겨주거나, 기다리는 요청이 없으면 반납합니다."""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                ADMISSION_QUEUE_DEPTH.set(len(self._waiters))
+                return
+        self._active -= 1
+        ADMISSION_IN_FLIGHT.set(self._active)
+
+    def _release_user(self, identity: Optional[str]) -> None:
+        """사용자별 사용 수를 줄입니다.
+
+        Args:
+            identity: 사용자 식별자
+        """
+        if identity is None:
+            return
+        count = self._per_user.get(identity, 0) - 1
+        if count > 0:
+            self._per_user[identity] = count
+        else:
+            self._per_user.pop(identity, None)
+
+    def _reject(
+        self, status_code: int, reason: str, retry_after: float
+    ) -> AdmissionRejected:
+        """거부 예외를 만들고 메트릭에 기록합니다.
+
+        Args:
+            status_code: 응답 상태 코드
+            reason: 거부 사유
+            retry_after: 다시 시도할 수 있을 때까지 예상되는 시간(초)
+
+        Returns:
+            거부 예외
+        """
+        ADMISSION_REJECTED_TOTAL.labels(reason=reason).inc()
+        return AdmissionRejected(status_code, reason, retry_after)
+
+
+class AdmissionMiddleware:
+    """요청 수락 제어를 적용하는 ASGI 미들웨어입니다.
+
+    스트리밍 응답이 끝날 때까지 슬롯을 유지하도록 ``BaseHTTPMiddleware``가 아닌
+    ASGI 미들웨어로 구현합니다. 캐시된 응답은 슬롯을 차지하지 않도록 캐시
+    미들웨어 안쪽에 두는 것이 좋습니다.
+
+    요청 제한 정책 표에서 주체나 권한 범위와 무관하게 면제된 경로(헬스 체크,
+    메트릭 등)는 과부하 중에도 대기하거나 거부되지 않도록 슬롯 없이 실행합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        controller: Optional[AdmissionController] = None,
+        policies: Optional[Sequence[Union[RateLimitPolicy, Dict[str, Any]]]] = None,
+    ):
+        """수락 제어 미들웨어를 초기화합니다.
+
+        Args:
+            app: ASGI 애플리케이션
+            controller: 수락 제어기 (없으면 설정값으로 생성)
+            policies: 면제 경로를 찾을 요청 제한 정책 표 (없으면 ``RATE_LIMIT_POLICIES`` 설정)
+        """
+        self.app = app
+        self.controller = controller or AdmissionController()
+        if policies is None:
+            policies = settings.RATE_LIMIT_POLICIES
+        self._exempt: RouteTrie[RateLimitPolicy] = RouteTrie()
+        for policy in policies:
+            if not isinstance(policy, RateLimitPolicy):
+                policy = RateLimitPolicy(**policy)
+            if policy.exempt and not policy.subjects and not policy.scopes:
+                self._exempt.add(policy.route, policy)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """요청을 처리합니다.
+
+        Args:
+            scope: ASGI 스코프
+            receive: ASGI receive 함수
+            send: ASGI send 함수
+        """
+        if scope["type"] != "http" or self._is_exempt(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        subject, _ = request_principal(request)
+        try:
+            async with self.controller.admit(subject, self._timeout(request)):
+                await self.app(scope, receive, send)
+        except AdmissionRejected as exc:
+            retry_after = max(math.ceil(exc.retry_after), 1)
+            detail = (
+                "동시 요청이 너무 많습니다. 잠시 후 다시 시도해주세요."
+                if exc.status_code == 429
+                else "서버가 혼잡합니다. 잠시 후 다시 시도해주세요."
+            )
+            response = JSONResponse(
+                status_code=exc.status_code,
+                content={
+                    "detail": detail,
+                    "code": "ADMISSION_REJECTED",
+                    "retry_after": retry_after,
+                },
+                headers={"Retry-After": str(retry_after)},
+            )
+            await response(scope, receive, send)
+
+    def _is_exempt(self, scope: Scope) -> bool:
+        """수락 제어를 적용하지 않는 요청인지 확인합니다.
+
+        Args:
+            scope: ASGI 스코프
+
+        Returns:
+            면제 정책이 일치하면 True
+        """
+        method = scope["method"].upper()
+        return any(
+            not policy.methods or method in policy.methods
+            for policy in self._exempt.match(scope["path"])
+        )
+
+    @staticmethod
+    def _timeout(request: Request) -> Optional[float]:
+        """클라이언트가 알려 준 대기 가능 시간을 읽습니다.
+
+        Args:
+            request: FastAPI 요청 객체
+
+        Returns:
+            대기 가능 시간(초), 없거나 잘못된 값이면 None
+        """
+        value = request.headers.get(REQUEST_TIMEOUT_HEADER)
+        if value is None:
+            return None
+        try:
+            timeout = float(value)
+        except ValueError:
+            return None
+        return timeout if timeout >= 0 else None
@@ -0,0 +1,320 @@
+"""Redis Lua 스크립트로 구현한 요청 제한 알고리즘을 정의합니다.
+
+모든 스크립트는 한 번의 EVALSHA로 허용 여부, 남은 요청 수, 초기화까지 남은 시간,
+재시도까지 남은 시간을 함께 반환하므로 동시 요청에서도 경쟁 조건이 없습니다.
+시각은 Redis 서버의 TIME을 사용하여 노드 간 시계 차이의 영향을 받지 않습니다.
+
+``cost``가 0이면 상태를 바꾸지 않고 현재 상태만 조회합니다.
+
+단일 키 스크립트 인자:
+    KEYS[1]: 제한 키
+    ARGV[1]: 허용 요청 수, ARGV[2]: 제한 기간 (밀리초), ARGV[3]: 요청 비용
+
+단일 키 스크립트 반환값:
+    {허용 여부 (1/0), 남은 요청 수, 초기화까지 남은 시간 (밀리초), 재시도까지 남은 시간 (밀리초)}
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import redis.asyncio as redis
+from redis.commands.core import AsyncScript
+
+from .base import RateLimitResult
+
+_PRELUDE = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + tonumber(time[2]) / 1000
+"""
+
+# 고정 창: 기간마다 초기화되는 카운터
+_FIXED_WINDOW = """
+local function fixed_window(key, limit, period, cost)
+    local current = tonumber(redis.call('GET', key) or '0')
+    local ttl = redis.call('PTTL', key)
+    local reset = ttl
+    if reset < 0 then reset = period end
+    if current + cost > limit then
+        return {0, math.max(limit - current, 0), reset, reset}
+    end
+    if cost > 0 then
+        current = redis.call('INCRBY', key, cost)
+        if ttl < 0 then redis.call('PEXPIRE', key, period) end
+    end
+    return {1, limit - current, reset, 0}
+end
+"""
+
+# 슬라이딩 창 카운터: 이전 창의 카운트를 남은 비율만큼 더해 근사합니다.
+_SLIDING_WINDOW = """
+local function sliding_window(key, limit, period, cost)
+    local window = math.floor(now / period)
+    local elapsed = now - window * period
+    local data = redis.call('HMGET', key, 'window', 'current', 'previous')
+    local stored = tonumber(data[1])
+    local current = tonumber(data[2]) or 0
+    local previous = tonumber(data[3]) or 0
+    if stored ~= window then
+        if stored == window - 1 then previous = current else previous = 0 end
+        current = 0
+    end
+    local used = previous * (period - elapsed) / period + current
+    local reset = period - elapsed
+    if used + cost > limit then
+        local retry = reset
+        if cost > limit then
+            -- 한도보다 큰 요청은 항상 거부됩니다.
+        elseif current + cost <= limit then
+            -- 이전 창의 가중치가 충분히 줄어드는 시점까지 기다립니다.
+            retry = period * (1 - (limit - current - cost) / previous) - elapsed
+        else
+            -- 다음 창에서 현재 창의 카운트 가중치가 충분히 줄어드는 시점까지 기다립니다.
+            retry = reset + period * math.max(1 - (limit - cost) / current, 0)
+        end
+        return {0, math.max(math.floor(limit - used), 0), reset, math.max(math.ceil(retry), 1)}
+    end
+    if cost > 0 then
+        current = current + cost
+        redis.call('HSET', key, 'window', window, 'current', current, 'previous', previous)
+        redis.call('PEXPIRE', key, period * 2)
+    end
+    return {1, math.floor(limit - used - cost), reset, 0}
+end
+"""
+
+# 슬라이딩 창 로그: 기간 안의 요청 시각을 모두 저장하는 정확한 방식입니다.
+_SLIDING_LOG = """
+local function sliding_log(key, limit, period, cost)
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - period)
+    local count = redis.call('ZCARD', key)
+    local reset = period
+    local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+    if oldest[2] then reset = tonumber(oldest[2]) + period - now end
+    if count + cost > limit then
+        local retry = reset
+        if cost <= limit then
+            -- 초과분만큼 오래된 요청이 창에서 빠질 때까지 기다립니다.
+            local index = count + cost - limit - 1
+            local entry = redis.call('ZRANGE', key, index, index, 'WITHSCORES')
+            retry = tonumber(entry[2]) + period - now
+        end
+        return {0, math.max(limit - count, 0), reset, math.max(math.ceil(retry), 1)}
+    end
+    for i = 1, cost do
+        redis.call('ZADD', key, now, string.format('%s.%06d-%d', time[1], time[2], i))
+    end
+    if cost > 0 then
+        redis.call('PEXPIRE', key, period)
+    end
+    return {1, limit - count - cost, reset, 0}
+end
+"""
+
+# GCRA 토큰 버킷: 이론적 도착 시각(TAT) 하나만 저장합니다.
+_TOKEN_BUCKET = """
+local function token_bucket(key, limit, period, cost)
+    local emission = period / limit
+    local tat = tonumber(redis.call('GET', key)) or now
+    if tat < now then tat = now end
+    local new_tat = tat + cost * emission
+    local allow_at = new_tat - period
+    if now < allow_at then
+        local remaining = math.max(math.floor((now - (tat - period)) / emission), 0)
+        return {0, remaining, math.ceil(tat - now), math.ceil(allow_at - now)}
+    end
+    local reset = tat - now
+    if cost > 0 then
+        redis.call('SET', key, string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+        reset = new_tat - now
+    end
+    return {1, math.floor((now - allow_at) / emission), math.ceil(reset), 0}
+end
+"""
+
+_ALGORITHM_FUNCTIONS: Dict[str, str] = {
+    "fixed_window": _FIXED_WINDOW,
+    "sliding_window": _SLIDING_WINDOW,
+    "sliding_log": _SLIDING_LOG,
+    "token_bucket": _TOKEN_BUCKET,
+}
+
+
+def _single_key_script(algorithm: str) -> str:
+    """알고리즘 함수 하나를 키 하나에 실행하는 스크립트를 만듭니다."""
+    return (
+        _PRELUDE
+        + _ALGORITHM_FUNCTIONS[algorithm]
+        + f"""
+return {algorithm}(KEYS[1], tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3]))
+"""
+    )
+
+
+FIXED_WINDOW_SCRIPT = _single_key_script("fixed_window")
+SLIDING_WINDOW_SCRIPT = _single_key_script("sliding_window")
+SLIDING_LOG_SCRIPT = _single_key_script("sliding_log")
+TOKEN_BUCKET_SCRIPT = _single_key_script("token_bucket")
+
+RATE_LIMIT_SCRIPTS: Dict[str, str] = {
+    "fixed_window": FIXED_WINDOW_SCRIPT,
+    "sliding_window": SLIDING_WINDOW_SCRIPT,
+    "sliding_log": SLIDING_LOG_SCRIPT,
+    "token_bucket": TOKEN_BUCKET_SCRIPT,
+}
+
+# 여러 제한을 한 번에 검사합니다. 먼저 비용 0으로 모든 키를 조회하고,
+# 모두 통과할 때만 비용을 반영하므로 일부 제한에만 요청이 기록되지 않습니다.
+# 거부된 키는 실제 비용으로 다시 검사하여 정확한 재시도 시간을 얻습니다
+# (거부되는 검사는 상태를 바꾸지 않습니다).
+#
+# 인자: KEYS[i]: 제한 키, ARGV[1]: 요청 비용,
+#       ARGV[3i - 1], ARGV[3i], ARGV[3i + 1]: 알고리즘 이름, 허용 요청 수, 제한 기간 (밀리초)
+# 반환값: {허용 여부, 키별 4개 값 (단일 키 스크립트의 반환값과 같은 순서)...}
+STACKED_SCRIPT = (
+    _PRELUDE
+    + "".join(_ALGORITHM_FUNCTIONS.values())
+    + """
+local algorithms = {
+    fixed_window = fixed_window,
+    sliding_window = sliding_window,
+    sliding_log = sliding_log,
+    token_bucket = token_bucket,
+}
+local cost = tonumber(ARGV[1])
+local checks = {}
+local results = {}
+local allowed = 1
+for i = 1, #KEYS do
+    local base = (i - 1) * 3 + 2
+    local check = {algorithms[ARGV[base]], tonumber(ARGV[base + 1]), tonumber(ARGV[base + 2])}
+    checks[i] = check
+    local result = check[1](KEYS[i], check[2], check[3], 0)
+    if result[2] < cost then
+        allowed = 0
+        result = check[1](KEYS[i], check[2], check[3], cost)
+    end
+    results[i] = result
+end
+if allowed == 1 and cost > 0 then
+    for i = 1, #KEYS do
+        results[i] = checks[i][1](KEYS[i], checks[i][2], checks[i][3], cost)
+    end
+end
+local reply = {allowed}
+for i = 1, #KEYS do
+    for j = 1, 4 do
+        reply[#reply + 1] = results[i][j]
+    end
+end
+return reply
+"""
+)
+
+
+def register_rate_limit_script(
+    redis_client: redis.Redis, algorithm: str
+) -> AsyncScript:
+    """요청 제한 알고리즘의 Lua 스크립트를 등록합니다.
+
+    등록된 스크립트는 EVALSHA로 실행되며, 서버에 스크립트가 없으면 자동으로
+    다시 적재됩니다.
+
+    Args:
+        redis_client: Redis 클라이언트
+        algorithm: 알고리즘 이름 (fixed_window, sliding_window, sliding_log, token_bucket)
+
+    Returns:
+        등록된 스크립트
+
+    Raises:
+        ValueError: 지원하지 않는 알고리즘인 경우
+    """
+    script = RATE_LIMIT_SCRIPTS.get(algorithm)
+    if script is None:
+        raise ValueError(f"지원하지 않는 요청 제한 알고리즘입니다: {algorithm}")
+    return redis_client.register_script(script)
+
+
+async def run_rate_limit_script(
+    script: AsyncScript,
+    key: str,
+    limit: int,
+    period: int,
+    cost: int = 1,
+) -> RateLimitResult:
+    """요청 제한 스크립트를 실행합니다.
+
+    Args:
+        script: ``register_rate_limit_script``로 등록한 스크립트
+        key: 제한 키
+        limit: 기간당 허용 요청 수
+        period: 제한 기간 (초)
+        cost: 요청 비용 (0이면 상태를 바꾸지 않고 조회만 함)
+
+    Returns:
+        요청 제한 결과
+    """
+    allowed, remaining, reset_ms, retry_ms = await script(
+        keys=[key],
+        args=[limit, period * 1000, cost],
+    )
+    return RateLimitResult(
+        allowed=bool(allowed),
+        limit=limit,
+        remaining=max(int(remaining), 0),
+        reset_after=max(int(reset_ms), 0) / 1000,
+        retry_after=max(int(retry_ms), 0) / 1000,
+    )
+
+
+def register_stacked_rate_limit_script(redis_client: redis.Redis) -> AsyncScript:
+    """여러 제한을 한 번에 검사하는 Lua 스크립트를 등록합니다.
+
+    Args:
+        redis_client: Redis 클라이언트
+
+    Returns:
+        등록된 스크립트
+    """
+    return redis_client.register_script(STACKED_SCRIPT)
+
+
+async def run_stacked_rate_limit_script(
+    script: AsyncScript,
+    checks: Sequence[Tuple[str, str, int, int]],
+    cost: int = 1,
+) -> Tuple[bool, List[RateLimitResult]]:
+    """여러 제한을 한 번의 스크립트 호출로 검사합니다.
+
+    모든 제한을 통과할 때만 각 제한에 비용이 반영됩니다.
+
+    Args:
+        script: ``register_stacked_rate_limit_script``로 등록한 스크립트
+        checks: ``(키, 알고리즘, 허용 요청 수, 제한 기간(초))`` 목록
+        cost: 요청 비용 (0이면 상태를 바꾸지 않고 조회만 함)
+
+    Returns:
+        전체 허용 여부와 ``checks`` 순서의 제한별 결과
+
+    Raises:
+        ValueError: 지원하지 않는 알고리즘이 포함된 경우
+    """
+    args: List[object] = [cost]
+    for _, algorithm, limit, period in checks:
+        if algorithm not in _ALGORITHM_FUNCTIONS:
+            raise ValueError(f"지원하지 않는 요청 제한 알고리즘입니다: {algorithm}")
+        args.extend((algorithm, limit, period * 1000))
+    reply = await script(keys=[key for key, _, _, _ in checks], args=args)
+
+    results = []
+    for index, (_, _, limit, _) in enumerate(checks):
+        allowed, remaining, reset_ms, retry_ms = reply[1 + index * 4 : 5 + index * 4]
+        results.append(
+            RateLimitResult(
+                allowed=bool(allowed),
+                limit=limit,
+                remaining=max(int(remaining), 0),
+                reset_after=max(int(reset_ms), 0) / 1000,
+                retry_after=max(int(retry_ms), 0) / 1000,
+            )
+        )
+    return bool(reply[0]), results
@@ -1,15 +1,82 @@
 """요청 제한의 기본 클래스를 정의합니다."""
 
+import math
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Optional
 
 from fastapi import Request
+from pydantic import BaseModel
+
+
+class RateLimitResult(BaseModel):
+    """요청 제한 검사 결과 모델입니다."""
+
+    allowed: bool
+    limit: int  # 0이면 제한이 적용되지 않은 요청 (면제)
+    remaining: int
+    reset_after: float  # 제한이 초기화될 때까지 남은 시간 (초)
+    retry_after: float = 0.0  # 거부된 경우 다시 시도할 수 있을 때까지 남은 시간 (초)
+    policy: Optional[str] = None  # 결과를 결정한 정책 이름
+
+
+def rate_limit_key(identity: str, algorithm: str, policy: Optional[str] = None) -> str:
+    """요청 제한 카운터의 Redis 키를 만듭니다.
+
+    모든 요청 제한 구현이 같은 형식을 사용하므로, 같은 클라이언트는 어느 진입점을
+    거치더라도 같은 카운터로 집계됩니다. 알고리즘마다 저장 형식이 다르므로 키를
+    나눕니다.
+
+    Args:
+        identity: 클라이언트 식별자 (예: IP 주소)
+        algorithm: 제한 알고리즘 (임대 방식은 ``leased``)
+        policy: 정책 이름 (정책 표의 제한이면 지정)
+
+    Returns:
+        ``rate_limit:[policy:{정책}:]{알고리즘}:{식별자}`` 형식의 키
+    """
+    if policy is not None:
+        return f"rate_limit:policy:{policy}:{algorithm}:{identity}"
+    return f"rate_limit:{algorithm}:{identity}"
+
+
+def rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    """요청 제한 결과로 응답 헤더를 만듭니다.
+
+    Args:
+        result: 요청 제한 결과
+
+    Returns:
+        ``X-RateLimit-*`` 헤더 (거부된 경우 ``Retry-After`` 포함, 면제된 요청은 빈 dict)
+    """
+    if result.limit == 0:
+        return {}
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(int(time.time() + result.reset_after)),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(math.ceil(result.retry_after), 1))
+    return headers
 
 
 class RateLimiter(ABC):
     """요청 제한 기본 클래스입니다."""
 
     @abstractmethod
+    async def check(self, request: Request, cost: int = 1) -> RateLimitResult:
+        """요청을 제한에 반영하고 결과를 반환합니다.
+
+        Args:
+            request: FastAPI 요청 객체
+            cost: 요청 비용 (0이면 상태를 바꾸지 않고 조회만 함)
+
+        Returns:
+            허용 여부, 남은 요청 수, 초기화 시간을 담은 결과
+        """
+        pass
+
     async def is_rate_limited(self, request: Request) -> bool:
         """요청이 제한되었는지 확인합니다.
 
@@ -19,28 +86,33 @@ class RateLimiter(ABC):
         Returns:
             요청이 제한되었으면 True, 아니면 False
         """
-        pass
+        result = await self.check(request)
+        return not result.allowed
 
-    @abstractmethod
     async def get_remaining_requests(self, request: Request) -> Optional[int]:
         """남은 요청 수를 반환합니다.
 
+        응답 헤더에는 ``check`` 결과를 그대로 사용하는 것이 좋습니다.
+
         Args:
             request: FastAPI 요청 객체
 
         Returns:
             남은 요청 수, 제한 정보를 가져올 수 없으면 None
         """
-        pass
+        result = await self.check(request, cost=0)
+        return result.remaining
 
-    @abstractmethod
     async def get_reset_time(self, request: Request) -> Optional[int]:
         """제한이 초기화되는 시간을 반환합니다.
 
+        응답 헤더에는 ``check`` 결과를 그대로 사용하는 것이 좋습니다.
+
         Args:
             request: FastAPI 요청 객체
 
         Returns:
             제한이 초기화되는 시간(초), 제한 정보를 가져올 수 없으면 None
         """
-        pass
+        result = await self.check(request, cost=0)
+        return math.ceil(result.reset_after)
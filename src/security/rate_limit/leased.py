@@ -0,0 +1,376 @@
+"""Redis에서 할당량을 빌려 프로세스 안에서 판단하는 근사 요청 제한을 구현합니다.
+
+각 워커는 키별 로컬 토큰 버킷을 두고, 토큰이 모자랄 때만 Redis에서 한도의 일부
+(``lease_fraction``)를 한 번에 빌려옵니다. 빌린 할당량은 Redis에서 먼저 차감되므로
+전체 허용량이 한도를 넘지 않습니다. 대신 다른 워커가 빌려 두고 쓰지 않은 토큰만큼
+일찍 거부될 수 있으며, 그 오차는 ``워커 수 x ceil(한도 x lease_fraction)``
+이하입니다. 쓰지 않은 토큰은 주기적으로 반납하여 오차가 유지되는 시간을 줄입니다.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+
+import redis.asyncio as redis
+from fastapi import Request
+from redis.commands.core import AsyncScript
+
+from ...cache.redis import get_connection_pool
+from ...core.settings import get_settings
+from .base import RateLimiter, RateLimitResult, rate_limit_key
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 현재 창의 남은 한도에서 최대 ARGV[3]개를 빌립니다.
+# 창마다 세대(gen)를 새로 정해 이전 창에서 빌린 토큰이 반납되지 않게 합니다.
+_LEASE_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+local batch = tonumber(ARGV[3])
+local data = redis.call('HMGET', KEYS[1], 'used', 'gen')
+local used = tonumber(data[1])
+local gen = data[2]
+if not used then
+    local time = redis.call('TIME')
+    gen = time[1] .. time[2]
+    used = 0
+    redis.call('HSET', KEYS[1], 'used', 0, 'gen', gen)
+    redis.call('PEXPIRE', KEYS[1], period)
+end
+local grant = math.max(math.min(batch, limit - used), 0)
+if grant > 0 then
+    redis.call('HINCRBY', KEYS[1], 'used', grant)
+end
+local ttl = redis.call('PTTL', KEYS[1])
+if ttl < 0 then ttl = period end
+return {grant, limit - used - grant, ttl, gen}
+"""
+
+# 같은 창에서 빌린 토큰 중 쓰지 않은 만큼 반납합니다.
+_RETURN_SCRIPT = """
+local data = redis.call('HMGET', KEYS[1], 'used', 'gen')
+if data[2] ~= ARGV[1] then return 0 end
+local returned = math.min(tonumber(ARGV[2]), tonumber(data[1]))
+if returned > 0 then
+    redis.call('HINCRBY', KEYS[1], 'used', -returned)
+end
+return returned
+"""
+
+
+class _Lease:
+    """키 하나에 대해 빌려 온 로컬 토큰 상태입니다."""
+
+    __slots__ = (
+        "tokens",
+        "gen",
+        "expires_at",
+        "last_used",
+        "retry_at",
+        "global_remaining",
+    )
+
+    def __init__(self):
+        """빈 임대 상태를 초기화합니다."""
+        self.tokens = 0
+        self.gen: Optional[str] = None
+        self.expires_at = 0.0
+        self.last_used = 0.0
+        # 전체 한도가 소진되었을 때 Redis에 다시 물어볼 시각
+        self.retry_at = 0.0
+        self.global_remaining = 0
+
+
+class LeasedRateLimiter(RateLimiter):
+    """Redis 할당량을 묶음으로 빌려 로컬에서 판단하는 근사 요청 제한 구현입니다.
+
+    대부분의 요청은 Redis 호출 없이 처리되고, 로컬 토큰이 떨어졌을 때만
+    Redis를 한 번 호출합니다. 고정 창 방식이므로 창 경계에서는 한도의 최대
+    2배까지 허용될 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        requests_per_period: Optional[int] = None,
+        period_in_seconds: Optional[int] = None,
+        lease_fraction: Optional[float] = None,
+        return_interval: Optional[float] = None,
+    ):
+        """임대 방식 요청 제한을 초기화합니다.
+
+        Args:
+            redis_url: Redis URL
+            requests_per_period: 기간당 허용 요청 수
+            period_in_seconds: 제한 기간(초)
+            lease_fraction: 한 번에 빌릴 한도 비율 (작을수록 정확하지만 Redis 호출이 늘어남)
+            return_interval: 쓰지 않은 토큰을 반납하는 주기(초)
+        """
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.requests_per_period = requests_per_period or settings.RATE_LIMIT_REQUESTS
+        self.period_in_seconds = period_in_seconds or settings.RATE_LIMIT_PERIOD
+        self.lease_fraction = lease_fraction or settings.RATE_LIMIT_LEASE_FRACTION
+        self.return_interval = (
+            return_interval or settings.RATE_LIMIT_LEASE_RETURN_INTERVAL
+        )
+        self.lease_size = max(
+            1, math.ceil(self.requests_per_period * self.lease_fraction)
+        )
+
+        self.redis: Optional[redis.Redis] = None
+        self._lease_script: Optional[AsyncScript] = None
+        self._return_script: Optional[AsyncScript] = None
+        self._leases: Dict[str, _Lease] = {}
+        # 키별로 진행 중인 임대 요청 (같은 키의 동시 임대를 하나로 합침)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._returner: Optional[asyncio.Task] = None
+
+    @property
+    def max_error(self) -> int:
+        """워커 하나가 빌려 두고 쓰지 않을 수 있는 최대 토큰 수를 반환합니다."""
+        return self.lease_size
+
+    async def _get_redis(self) -> redis.Redis:
+        """Redis 클라이언트를 가져옵니다.
+
+        Returns:
+            Redis 클라이언트
+        """
+        if not self.redis:
+            self.redis = redis.Redis(
+                connection_pool=get_connection_pool(self.redis_url)
+            )
+            self._lease_script = self.redis.register_script(_LEASE_SCRIPT)
+            self._return_script = self.redis.register_script(_RETURN_SCRIPT)
+        return self.redis
+
+    def _get_key(self, request: Request) -> str:
+        """요청에 대한 Redis 키를 생성합니다.
+
+        Args:
+            request: FastAPI 요청 객체
+
+        Returns:
+            Redis 키
+        """
+        return rate_limit_key(request.client.host, "leased")
+
+    async def check(self, request: Request, cost: int = 1) -> RateLimitResult:
+        """요청을 제한에 반영하고 결과를 반환합니다.
+
+        Args:
+            request: FastAPI 요청 객체
+            cost: 요청 비용 (0이면 상태를 바꾸지 않고 조회만 함)
+
+        Returns:
+            로컬 상태로 계산한 요청 제한 결과 (남은 요청 수는 근사치)
+        """
+        return await self.check_key(self._get_key(request), cost)
+
+    async def check_key(self, key: str, cost: int = 1) -> RateLimitResult:
+        """키에 대한 요청을 제한에 반영하고 결과를 반환합니다.
+
+        Args:
+            key: 제한 키
+            cost: 요청 비용
+
+        Returns:
+            요청 제한 결과
+        """
+        self._ensure_returner()
+        while True:
+            now = time.monotonic()
+            lease = self._leases.get(key)
+            if lease is not None and lease.gen is not None and lease.expires_at <= now:
+                # 창이 바뀌었으므로 이전 창의 토큰은 버립니다.
+                del self._leases[key]
+                lease = None
+            if lease is None:
+                lease = self._leases[key] = _Lease()
+
+            lease.last_used = now
+            if lease.tokens >= cost:
+                lease.tokens -= cost
+                return self._result(lease, True, now)
+            if cost > self.requests_per_period or now < lease.retry_at:
+                return self._result(lease, False, now)
+
+            granted = await self._lease(key, lease, cost - lease.tokens)
+            if not granted:
+                return self._result(lease, False, time.monotonic())
+
+    def refund(self, key: str, cost: int = 1) -> None:
+        """허용했지만 다른 제한에 거부된 요청의 토큰을 로컬 임대로 돌려놓습니다.
+
+        Args:
+            key: 제한 키
+            cost: 돌려놓을 요청 비용
+        """
+        lease = self._leases.get(key)
+        if lease is not None and lease.expires_at > time.monotonic():
+            lease.tokens += cost
+
+    async def close(self) -> None:
+        """반납 태스크를 중지하고 쓰지 않은 토큰을 모두 반납합니다."""
+        if self._returner is not None:
+            self._returner.cancel()
+            self._returner = None
+        await self.return_unused(idle_for=0.0)
+
+    async def return_unused(self, idle_for: Optional[float] = None) -> int:
+        """일정 시간 사용되지 않은 키의 토큰을 Redis에 반납합니다.
+
+        Args:
+            idle_for: 반납 대상으로 볼 미사용 시간(초, 없으면 반납 주기)
+
+        Returns:
+            반납한 키 수
+        """
+        idle_for = self.return_interval if idle_for is None else idle_for
+        now = time.monotonic()
+        returns: List[Tuple[str, str, int]] = []
+        for key, lease in list(self._leases.items()):
+            if key in self._pending or now - lease.last_used < idle_for:
+                continue
+            del self._leases[key]
+            if lease.tokens > 0 and lease.gen is not None and lease.expires_at > now:
+                returns.append((key, lease.gen, lease.tokens))
+        if not returns:
+            return 0
+
+        redis_client = await self._get_redis()
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key, gen, tokens in returns:
+                await self._return_script(keys=[key], args=[gen, tokens], client=pipe)
+            await pipe.execute()
+        return len(returns)
+
+    async def _lease(self, key: str, lease: _Lease, needed: int) -> bool:
+        """Redis에서 토큰을 빌려 로컬 임대 상태에 더합니다.
+
+        같은 키의 임대 요청이 이미 진행 중이면 그 결과를 기다립니다.
+
+        Args:
+            key: 제한 키
+            lease: 로컬 임대 상태
+            needed: 부족한 토큰 수
+
+        Returns:
+            토큰을 하나 이상 빌렸으면 True
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            await self._get_redis()
+            batch = min(max(self.lease_size, needed), self.requests_per_period)
+            grant, remaining, ttl, gen = await self._lease_script(
+                keys=[key],
+                args=[self.requests_per_period, self.period_in_seconds * 1000, batch],
+            )
+            gen = gen.decode() if isinstance(gen, bytes) else str(gen)
+            now = time.monotonic()
+            # 기다리는 동안 창이 바뀌어 상태가 새로 만들어졌으면 그 상태에 반영합니다.
+            lease = self._leases.setdefault(key, lease)
+            if lease.gen != gen:
+                # 새 창에서 빌린 토큰이면 이전 창의 토큰과 합치지 않습니다.
+                lease.tokens = 0
+                lease.gen = gen
+            lease.tokens += int(grant)
+            lease.global_remaining = int(remaining)
+            lease.expires_at = now + int(ttl) / 1000
+            # 전체 한도가 소진되면 다른 워커의 반납을 기다렸다가 다시 확인합니다.
+            lease.retry_at = (
+                now + min(self.return_interval, int(ttl) / 1000) if not grant else 0.0
+            )
+            future.set_result(bool(grant))
+            return bool(grant)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # 기다리는 호출자가 없어도 경고가 남지 않도록 예외를 회수합니다.
+            future.exception()
+            raise
+        finally:
+            del self._pending[key]
+
+    def _result(self, lease: _Lease, allowed: bool, now: float) -> RateLimitResult:
+        """로컬 임대 상태로 요청 제한 결과를 만듭니다.
+
+        Args:
+            lease: 로컬 임대 상태
+            allowed: 허용 여부
+            now: 현재 시각 (monotonic)
+
+        Returns:
+            요청 제한 결과
+        """
+        reset_after = max(lease.expires_at - now, 0.0) or float(self.period_in_seconds)
+        retry_after = 0.0
+        if not allowed:
+            retry_after = max(lease.retry_at - now, 0.0) or reset_after
+        return RateLimitResult(
+            allowed=allowed,
+            limit=self.requests_per_period,
+            remaining=lease.tokens + lease.global_remaining,
+            reset_after=reset_after,
+            retry_after=retry_after,
+        )
+
+    def _ensure_returner(self) -> None:
+        """실행 중인 이벤트 루프에서 토큰 반납 태스크를 시작합니다."""
+        if self._returner is not None and not self._returner.done():
+            return
+        self._returner = asyncio.get_running_loop().create_task(self._return_loop())
+
+    async def _return_loop(self) -> None:
+        """주기적으로 쓰지 않은 토큰을 반납합니다."""
+        while True:
+            await asyncio.sleep(self.return_interval)
+            try:
+                await self.return_unused()
+            except redis.RedisError:
+                # 반납하지 못한 토큰은 창이 끝나면 자연히 사라집니다.
+                logger.warning("요청 제한 토큰 반납 실패")
+
+
+# (한도, 기간)별로 프로세스 전체에서 공유되는 임대 방식 요청 제한
+_leased_limiters: Dict[Tuple[int, int], LeasedRateLimiter] = {}
+
+
+def get_leased_limiter(
+    requests_per_period: int, period_in_seconds: int
+) -> LeasedRateLimiter:
+    """프로세스 전체에서 공유되는 임대 방식 요청 제한을 가져옵니다.
+
+    Args:
+        requests_per_period: 기간당 허용 요청 수
+        period_in_seconds: 제한 기간(초)
+
+    Returns:
+        임대 방식 요청 제한
+    """
+    limiter = _leased_limiters.get((requests_per_period, period_in_seconds))
+    if limiter is None:
+        limiter = _leased_limiters[(requests_per_period, period_in_seconds)] = (
+            LeasedRateLimiter(
+                requests_per_period=requests_per_period,
+                period_in_seconds=period_in_seconds,
+            )
+        )
+    return limiter
+
+
+async def close_leased_limiters() -> None:
+    """공유 임대 방식 요청 제한이 빌려 둔 토큰을 모두 반납합니다."""
+    for limiter in _leased_limiters.values():
+        try:
+            await limiter.close()
+        except redis.RedisError:
+            logger.warning("요청 제한 토큰 반납 실패")
+    _leased_limiters.clear()
@@ -0,0 +1,240 @@
+"""프로세스 메모리를 사용한 요청 제한 구현을 구현합니다.
+
+``algorithms``의 Lua 스크립트와 같은 알고리즘과 반환값을 파이썬으로 구현하여,
+Redis 없이 테스트하거나 벤치마크할 때 같은 결정을 얻을 수 있습니다. 상태는
+프로세스마다 따로 유지되므로 여러 워커에서는 워커 수만큼 더 허용됩니다.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from fastapi import Request
+
+from ...core.settings import get_settings
+from .base import RateLimiter, RateLimitResult
+
+settings = get_settings()
+
+# 허용 여부, 남은 요청 수, 초기화까지 남은 시간(밀리초), 재시도까지 남은 시간(밀리초)
+_Decision = Tuple[bool, float, float, float]
+
+
+class InMemoryRateLimiter(RateLimiter):
+    """프로세스 메모리를 사용한 요청 제한 구현입니다.
+
+    ``check``는 중간에 await하지 않으므로 같은 이벤트 루프의 동시 요청에서도
+    검사와 갱신이 원자적으로 수행됩니다.
+    """
+
+    def __init__(
+        self,
+        requests_per_period: Optional[int] = None,
+        period_in_seconds: Optional[int] = None,
+        algorithm: Optional[str] = None,
+        max_keys: int = 100_000,
+        clock: Callable[[], float] = time.time,
+    ):
+        """메모리 요청 제한을 초기화합니다.
+
+        Args:
+            requests_per_period: 기간당 허용 요청 수
+            period_in_seconds: 제한 기간(초)
+            algorithm: 제한 알고리즘 (fixed_window, sliding_window, sliding_log, token_bucket)
+            max_keys: 만료된 키를 정리하기 시작하는 키 수
+            clock: 현재 시각(초)을 반환하는 함수
+
+        Raises:
+            ValueError: 지원하지 않는 알고리즘인 경우
+        """
+        self.requests_per_period = requests_per_period or settings.RATE_LIMIT_REQUESTS
+        self.period_in_seconds = period_in_seconds or settings.RATE_LIMIT_PERIOD
+        self.algorithm = algorithm or settings.RATE_LIMIT_ALGORITHM
+        self.max_keys = max_keys
+        self.clock = clock
+
+        algorithms: Dict[str, Callable[..., _Decision]] = {
+            "fixed_window": self._fixed_window,
+            "sliding_window": self._sliding_window,
+            "sliding_log": self._sliding_log,
+            "token_bucket": self._token_bucket,
+        }
+        if self.algorithm not in algorithms:
+            raise ValueError(
+                f"지원하지 않는 요청 제한 알고리즘입니다: {self.algorithm}"
+            )
+        self._algorithm = algorithms[self.algorithm]
+        # 키별 (상태, 만료 시각(밀리초))
+        self._state: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        """상태를 유지 중인 키 수를 반환합니다."""
+        return len(self._state)
+
+    def _get_key(self, request: Request) -> str:
+        """요청에 대한 제한 키를 생성합니다.
+
+        Args:
+            request: FastAPI 요청 객체
+
+        Returns:
+            제한 키
+        """
+        return request.client.host
+
+    async def check(self, request: Request, cost: int = 1) -> RateLimitResult:
+        """요청을 제한에 반영하고 결과를 반환합니다.
+
+        Args:
+            request: FastAPI 요청 객체
+            cost: 요청 비용 (0이면 상태를 바꾸지 않고 조회만 함)
+
+        Returns:
+            요청 제한 결과
+        """
+        return self.check_key(self._get_key(request), cost)
+
+    def check_key(self, key: str, cost: int = 1) -> RateLimitResult:
+        """키에 대한 요청을 제한에 반영하고 결과를 반환합니다.
+
+        Args:
+            key: 제한 키
+            cost: 요청 비용
+
+        Returns:
+            요청 제한 결과
+        """
+        now = self.clock() * 1000
+        entry = self._state.get(key)
+        if entry is not None and entry[1] <= now:
+            del self._state[key]
+            entry = None
+
+        limit = self.requests_per_period
+        period = self.period_in_seconds * 1000
+        allowed, remaining, reset_ms, retry_ms = self._algorithm(
+            key, entry, now, limit, period, cost
+        )
+        if len(self._state) > self.max_keys:
+            self._prune(now)
+        return RateLimitResult(
+            allowed=allowed,
+            limit=limit,
+            remaining=max(int(remaining), 0),
+            reset_after=max(int(reset_ms), 0) / 1000,
+            retry_after=max(int(retry_ms), 0) / 1000,
+        )
+
+    def clear(self) -> None:
+        """모든 제한 상태를 지웁니다."""
+        self._state.clear()
+
+    def _prune(self, now: float) -> None:
+        """만료된 키를 정리합니다.
+
+        Args:
+            now: 현재 시각(밀리초)
+        """
+        for key in [key for key, entry in self._state.items() if entry[1] <= now]:
+            del self._state[key]
+
+    def _fixed_window(
+        self,
+        key: str,
+        entry: Optional[List[Any]],
+        now: float,
+        limit: int,
+        period: float,
+        cost: int,
+    ) -> _Decision:
+        """고정 창 알고리즘입니다. 상태는 카운트 하나입니다."""
+        current = entry[0] if entry else 0
+        reset = entry[1] - now if entry else period
+        if current + cost > limit:
+            return False, limit - current, reset, reset
+        if cost > 0:
+            if entry is None:
+                entry = self._state[key] = [0, now + period]
+            entry[0] += cost
+            current = entry[0]
+        return True, limit - current, reset, 0
+
+    def _sliding_window(
+        self,
+        key: str,
+        entry: Optional[List[Any]],
+        now: float,
+        limit: int,
+        period: float,
+        cost: int,
+    ) -> _Decision:
+        """슬라이딩 창 카운터 알고리즘입니다. 상태는 (창 번호, 현재 창, 이전 창)입니다."""
+        window = math.floor(now / period)
+        elapsed = now - window * period
+        stored, current, previous = entry[0] if entry else (None, 0, 0)
+        if stored != window:
+            previous = current if stored == window - 1 else 0
+            current = 0
+        used = previous * (period - elapsed) / period + current
+        reset = period - elapsed
+        if used + cost > limit:
+            retry = reset
+            if cost > limit:
+                pass
+            elif current + cost <= limit:
+                retry = period * (1 - (limit - current - cost) / previous) - elapsed
+            else:
+                retry = reset + period * max(1 - (limit - cost) / current, 0)
+            return False, math.floor(limit - used), reset, max(math.ceil(retry), 1)
+        if cost > 0:
+            self._state[key] = [(window, current + cost, previous), now + period * 2]
+        return True, math.floor(limit - used - cost), reset, 0
+
+    def _sliding_log(
+        self,
+        key: str,
+        entry: Optional[List[Any]],
+        now: float,
+        limit: int,
+        period: float,
+        cost: int,
+    ) -> _Decision:
+        """슬라이딩 창 로그 알고리즘입니다. 상태는 요청 시각의 큐입니다."""
+        log: Deque[float] = entry[0] if entry else deque()
+        while log and log[0] <= now - period:
+            log.popleft()
+        count = len(log)
+        reset = log[0] + period - now if log else period
+        if count + cost > limit:
+            retry = reset
+            if cost <= limit:
+                retry = log[count + cost - limit - 1] + period - now
+            return False, limit - count, reset, max(math.ceil(retry), 1)
+        if cost > 0:
+            log.extend([now] * cost)
+            self._state[key] = [log, now + period]
+        return True, limit - count - cost, reset, 0
+
+    def _token_bucket(
+        self,
+        key: str,
+        entry: Optional[List[Any]],
+        now: float,
+        limit: int,
+        period: float,
+        cost: int,
+    ) -> _Decision:
+        """GCRA 토큰 버킷 알고리즘입니다. 상태는 이론적 도착 시각(TAT)입니다."""
+        emission = period / limit
+        tat = max(entry[0] if entry else now, now)
+        new_tat = tat + cost * emission
+        allow_at = new_tat - period
+        if now < allow_at:
+            remaining = max(math.floor((now - (tat - period)) / emission), 0)
+            return False, remaining, math.ceil(tat - now), math.ceil(allow_at - now)
+        reset = tat - now
+        if cost > 0:
+            self._state[key] = [new_tat, new_tat]
+            reset = new_tat - now
+        return True, math.floor((now - allow_at) / emission), math.ceil(reset), 0
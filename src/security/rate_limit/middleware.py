@@ -0,0 +1,65 @@
+"""요청 제한을 적용하는 미들웨어 모듈입니다."""
+
+import logging
+from typing import Optional
+
+import redis.asyncio as redis
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
+
+from .base import RateLimiter, rate_limit_headers
+from .policy import PolicyRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitMiddleware(BaseHTTPMiddleware):
+    """요청 제한을 적용하는 미들웨어입니다.
+
+    사용자별 정책이 검증된 주체를 사용할 수 있도록 인증 미들웨어 안쪽에 두어야
+    합니다. Redis에 접근할 수 없으면 요청을 막지 않고 그대로 처리합니다.
+    """
+
+    def __init__(self, app, limiter: Optional[RateLimiter] = None):
+        """요청 제한 미들웨어를 초기화합니다.
+
+        Args:
+            app: ASGI 애플리케이션
+            limiter: 요청 제한 구현 (없으면 설정의 정책 표를 사용)
+        """
+        super().__init__(app)
+        self.limiter = limiter or PolicyRateLimiter()
+
+    async def dispatch(self, request: Request, call_next: callable) -> Response:
+        """요청을 처리합니다.
+
+        Args:
+            request: FastAPI 요청 객체
+            call_next: 다음 미들웨어/라우트 핸들러
+
+        Returns:
+            FastAPI 응답 객체 (제한을 초과하면 429 응답)
+        """
+        try:
+            result = await self.limiter.check(request)
+        except redis.RedisError:
+            logger.warning("요청 제한 검사 실패: %s", request.url.path)
+            return await call_next(request)
+
+        headers = rate_limit_headers(result)
+        if not result.allowed:
+            return JSONResponse(
+                status_code=429,
+                content={
+                    "detail": "요청 제한을 초과했습니다.",
+                    "code": "RATE_LIMIT_EXCEEDED",
+                    "retry_after": int(headers["Retry-After"]),
+                },
+                headers=headers,
+            )
+
+        response = await call_next(request)
+        response.headers.update(headers)
+        return response
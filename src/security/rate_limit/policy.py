@@ -0,0 +1,285 @@
+"""경로, 사용자, API 키별 정책으로 요청 제한을 적용합니다.
+
+정책 표는 경로 템플릿을 기준으로 접두사 트리 하나로 컴파일되므로, 요청마다
+정책을 찾는 비용은 정책 수와 무관하게 경로 길이에 비례합니다. 요청에 적용되는
+정책들(예: 엔드포인트별 제한과 전체 제한)은 Lua 스크립트 한 번으로 함께 검사되며,
+모두 통과할 때만 각 제한에 요청이 기록됩니다.
+"""
+
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Sequence, Tuple, Union
+
+import redis.asyncio as redis
+from fastapi import Request
+from pydantic import BaseModel, Field, field_validator
+from redis.commands.core import AsyncScript
+
+from ...cache.redis import get_connection_pool
+from ...core.settings import get_settings
+from ..routes import RouteTrie, route_registry
+from .algorithms import (
+    RATE_LIMIT_SCRIPTS,
+    register_stacked_rate_limit_script,
+    run_stacked_rate_limit_script,
+)
+from .base import RateLimiter, RateLimitResult, rate_limit_key
+from .leased import get_leased_limiter
+
+settings = get_settings()
+
+API_KEY_HEADER = "X-API-Key"
+
+
+class RateLimitPolicy(BaseModel):
+    """요청 제한 정책 모델입니다."""
+
+    name: str = Field(
+        ..., description="정책 이름 (제한 키에 포함되므로 바꾸면 카운터가 초기화됨)"
+    )
+    route: str = Field(
+        "/*", description="경로 템플릿 (``{name}``은 한 단계, 끝의 ``*``는 나머지 전체)"
+    )
+    methods: List[str] = Field(
+        default_factory=list, description="적용할 HTTP 메서드 (비어 있으면 전체)"
+    )
+    key: Literal["ip", "user", "api_key", "global"] = Field(
+        "ip",
+        description="제한을 나누는 기준 (global이면 모든 클라이언트가 한도를 공유)",
+    )
+    limit: Optional[int] = Field(
+        None, gt=0, description="기간당 허용 요청 수 (없으면 기본값)"
+    )
+    period: Optional[int] = Field(
+        None, gt=0, description="제한 기간(초, 없으면 기본값)"
+    )
+    algorithm: Optional[str] = Field(None, description="제한 알고리즘 (없으면 기본값)")
+    subjects: List[str] = Field(
+        default_factory=list, description="적용할 JWT 주체 (비어 있으면 전체)"
+    )
+    scopes: List[str] = Field(
+        default_factory=list, description="적용할 JWT 권한 범위 (하나라도 있으면 적용)"
+    )
+    group: Optional[str] = Field(
+        None, description="같은 그룹에서는 표에서 먼저 일치한 정책 하나만 적용"
+    )
+    exempt: bool = Field(False, description="일치하면 요청 제한을 적용하지 않음")
+
+    @field_validator("methods")
+    @classmethod
+    def _normalize_methods(cls, methods: List[str]) -> List[str]:
+        """메서드 이름을 대문자로 맞춥니다."""
+        return [method.upper() for method in methods]
+
+
+def request_principal(request: Request) -> Tuple[Optional[str], FrozenSet[str]]:
+    """요청 상태에서 인증된 주체와 권한 범위를 가져옵니다.
+
+    Args:
+        request: FastAPI 요청 객체
+
+    Returns:
+        주체(없으면 None)와 권한 범위
+    """
+    user = getattr(request.state, "user_id", None)
+    scopes = getattr(request.state, "scopes", None)
+    if isinstance(user, dict):
+        scopes = scopes if scopes is not None else user.get("scopes")
+        user = user.get("sub")
+    return (str(user) if user else None), frozenset(scopes or ())
+
+
+class PolicyRateLimiter(RateLimiter):
+    """정책 표에 따라 요청 제한을 적용하는 구현입니다.
+
+    표의 정책 중 경로, 메서드, 주체, 권한 범위가 일치하는 정책이 모두 함께
+    적용되며, ``group``이 같은 정책끼리는 표에서 먼저 일치한 하나만 적용됩니다.
+    ``exempt`` 정책이 일치하면 요청 제한을 적용하지 않습니다.
+
+    ``leased`` 모드에서는 알고리즘을 지정하지 않은 정책을 워커별로 빌린 할당량으로
+    근사하여 판단하고(``LeasedRateLimiter``), 알고리즘을 지정한 정책만 Redis
+    스크립트로 정확히 검사합니다. 어느 한 제한이라도 거부하면 다른 제한에서 쓴
+    토큰은 돌려놓습니다.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Sequence[Union[RateLimitPolicy, Dict[str, Any]]]] = None,
+        redis_url: Optional[str] = None,
+        mode: Optional[str] = None,
+    ):
+        """정책 기반 요청 제한을 초기화합니다.
+
+        Args:
+            policies: 정책 표 (없으면 ``RATE_LIMIT_POLICIES`` 설정과 경로 정책 등록부의
+                라우트별 제한)
+            redis_url: Redis URL
+            mode: ``exact`` 또는 ``leased`` (없으면 ``RATE_LIMIT_MODE`` 설정)
+
+        Raises:
+            ValueError: 정책 이름이 중복되거나, 지원하지 않는 알고리즘이나 모드인 경우
+        """
+        self.mode = mode or settings.RATE_LIMIT_MODE
+        if self.mode not in ("exact", "leased"):
+            raise ValueError(f"지원하지 않는 요청 제한 모드입니다: {self.mode}")
+        if policies is None:
+            policies = [
+                *settings.RATE_LIMIT_POLICIES,
+                *route_registry.rate_limit_policies(),
+            ]
+        self.policies = [
+            policy if isinstance(policy, RateLimitPolicy) else RateLimitPolicy(**policy)
+            for policy in policies
+        ]
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.redis: Optional[redis.Redis] = None
+        self._script: Optional[AsyncScript] = None
+
+        names = set()
+        self._routes: RouteTrie[RateLimitPolicy] = RouteTrie()
+        for policy in self.policies:
+            if policy.name in names:
+                raise ValueError(f"요청 제한 정책 이름이 중복되었습니다: {policy.name}")
+            if (
+                policy.algorithm is not None
+                and policy.algorithm not in RATE_LIMIT_SCRIPTS
+            ):
+                raise ValueError(
+                    f"지원하지 않는 요청 제한 알고리즘입니다: {policy.algorithm}"
+                )
+            names.add(policy.name)
+            self._routes.add(policy.route, policy)
+
+    async def _get_redis(self) -> redis.Redis:
+        """Redis 클라이언트를 가져옵니다.
+
+        Returns:
+            Redis 클라이언트
+        """
+        if not self.redis:
+            self.redis = redis.Redis(
+                connection_pool=get_connection_pool(self.redis_url)
+            )
+            self._script = register_stacked_rate_limit_script(self.redis)
+        return self.redis
+
+    def match(self, request: Request) -> List[Tuple[RateLimitPolicy, str]]:
+        """요청에 적용할 정책과 각 정책의 클라이언트 식별자를 찾습니다.
+
+        Args:
+            request: FastAPI 요청 객체
+
+        Returns:
+            ``(정책, 식별자)`` 목록 (면제된 요청이면 빈 목록)
+        """
+        subject, scopes = request_principal(request)
+        method = request.method.upper()
+        matched = []
+        groups = set()
+        for policy in self._routes.match(request.url.path):
+            if policy.methods and method not in policy.methods:
+                continue
+            if policy.subjects and subject not in policy.subjects:
+                continue
+            if policy.scopes and scopes.isdisjoint(policy.scopes):
+                continue
+            if policy.exempt:
+                return []
+            identity = self._identity(request, policy, subject)
+            if identity is None:
+                # 식별자가 없는 요청(예: 익명 요청의 사용자별 정책)에는 적용하지 않습니다.
+                continue
+            if policy.group is not None:
+                if policy.group in groups:
+                    continue
+                groups.add(policy.group)
+            matched.append((policy, identity))
+        return matched
+
+    async def check(self, request: Request, cost: int = 1) -> RateLimitResult:
+        """요청에 적용되는 모든 정책을 한 번에 검사하고 결과를 반환합니다.
+
+        Args:
+            request: FastAPI 요청 객체
+            cost: 요청 비용 (0이면 상태를 바꾸지 않고 조회만 함)
+
+        Returns:
+            거부되었으면 가장 오래 기다려야 하는 정책의 결과,
+            허용되었으면 남은 요청 수가 가장 적은 정책의 결과
+            (적용되는 정책이 없으면 ``limit``이 0인 결과)
+        """
+        matched = self.match(request)
+        if not matched:
+            return RateLimitResult(allowed=True, limit=0, remaining=0, reset_after=0.0)
+
+        exact = []
+        checks = []
+        leased = []
+        for policy, identity in matched:
+            limit = policy.limit or settings.RATE_LIMIT_REQUESTS
+            period = policy.period or settings.RATE_LIMIT_PERIOD
+            if self.mode == "leased" and policy.algorithm is None:
+                key = rate_limit_key(identity, "leased", policy.name)
+                leased.append((policy, key, get_leased_limiter(limit, period)))
+                continue
+            algorithm = policy.algorithm or settings.RATE_LIMIT_ALGORITHM
+            exact.append(policy)
+            key = rate_limit_key(identity, algorithm, policy.name)
+            checks.append((key, algorithm, limit, period))
+
+        results: List[RateLimitResult] = []
+        allowed = True
+        debited = []
+        for policy, key, limiter in leased:
+            result = await limiter.check_key(key, cost)
+            result.policy = policy.name
+            results.append(result)
+            if not result.allowed:
+                allowed = False
+                break
+            debited.append((key, limiter))
+
+        if allowed and checks:
+            await self._get_redis()
+            allowed, exact_results = await run_stacked_rate_limit_script(
+                self._script, checks, cost
+            )
+            for policy, result in zip(exact, exact_results):
+                result.policy = policy.name
+            results.extend(exact_results)
+        if not allowed:
+            for key, limiter in debited:
+                limiter.refund(key, cost)
+        if allowed:
+            return min(results, key=lambda result: result.remaining)
+        return max(
+            (result for result in results if not result.allowed),
+            key=lambda result: result.retry_after,
+        )
+
+    def _identity(
+        self,
+        request: Request,
+        policy: RateLimitPolicy,
+        subject: Optional[str],
+    ) -> Optional[str]:
+        """정책의 기준에 따라 클라이언트 식별자를 만듭니다.
+
+        Args:
+            request: FastAPI 요청 객체
+            policy: 요청 제한 정책
+            subject: 인증된 주체
+
+        Returns:
+            클라이언트 식별자, 식별할 수 없으면 None
+        """
+        if policy.key == "global":
+            return "*"
+        if policy.key == "user":
+            return subject
+        if policy.key == "api_key":
+            # 인증 미들웨어가 검증한 키의 다이제스트만 사용합니다. 검증되지 않은
+            # 헤더를 쓰면 요청마다 다른 값을 보내 제한을 피할 수 있으므로, 검증된
+            # 키가 없으면 IP로 제한합니다.
+            api_key_id = getattr(request.state, "api_key_id", None)
+            if api_key_id is not None:
+                return f"key:{api_key_id}"
+        return request.client.host if request.client else None
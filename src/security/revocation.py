@@ -0,0 +1,418 @@
+"""폐기된 토큰과 세션을 확인하는 모듈입니다.
+
+폐기 목록의 원본은 Redis 정렬 집합(점수는 만료 시각)이고, 각 워커는 목록 전체를
+블룸 필터로 들고 있습니다. 폐기는 Redis pub/sub으로 모든 워커에 전파되어 필터에
+바로 추가됩니다. 요청마다 필터만 확인하고, 필터가 "있을 수도 있다"고 답한 경우에만
+Redis에서 확인하므로 대부분의 요청은 폐기 확인에 네트워크를 사용하지 않습니다.
+
+블룸 필터는 항목을 지울 수 없으므로 주기적으로, 그리고 구독을 다시 시작할 때
+Redis 목록에서 만료된 항목을 빼고 새로 만듭니다. 구독을 다시 시작하는 사이에 놓친
+폐기도 이때 반영됩니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import redis.asyncio as redis
+
+from ..core.settings import get_settings
+from ..monitoring.metrics import REVOCATION_CHECKS_TOTAL, REVOCATION_FILTER_ENTRIES
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 필터 적중을 확인한 결과를 보관하는 최대 항목 수
+_CONFIRMED_MAX_ENTRIES = 1024
+
+
+class BloomFilter:
+    """문자열 항목의 블룸 필터입니다."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        """블룸 필터를 초기화합니다.
+
+        Args:
+            capacity: 오탐률을 지킬 수 있는 최대 항목 수
+            error_rate: 목표 오탐률
+        """
+        self.capacity = capacity
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def __contains__(self, item: str) -> bool:
+        """항목이 있을 수 있는지 확인합니다. False이면 확실히 없습니다."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def add(self, item: str) -> None:
+        """항목을 추가합니다.
+
+        Args:
+            item: 추가할 항목
+        """
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def _positions(self, item: str) -> Iterator[int]:
+        """항목의 비트 위치를 이중 해싱으로 계산합니다."""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hashes):
+            yield (first + index * second) % self.size
+
+
+class RevocationList:
+    """클러스터 전체에서 공유하는 토큰과 세션 폐기 목록입니다."""
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        key: Optional[str] = None,
+        channel: Optional[str] = None,
+        capacity: Optional[int] = None,
+        error_rate: Optional[float] = None,
+        rebuild_interval: Optional[float] = None,
+    ):
+        """폐기 목록을 초기화합니다.
+
+        Args:
+            redis_url: Redis URL
+            key: 폐기 목록을 저장하는 정렬 집합 키
+            channel: 폐기 알림 채널
+            capacity: 블룸 필터의 기본 용량
+            error_rate: 블룸 필터의 목표 오탐률
+            rebuild_interval: 필터를 새로 만드는 주기(초)
+        """
+        self.redis_url = redis_url or settings.REDIS_URL
+        self.key = key or settings.REVOCATION_KEY
+        self.channel = channel or settings.REVOCATION_CHANNEL
+        self.capacity = capacity or settings.REVOCATION_FILTER_CAPACITY
+        self.error_rate = error_rate or settings.REVOCATION_FILTER_ERROR_RATE
+        self.reconnect_interval = settings.REVOCATION_RECONNECT_INTERVAL
+        self.rebuild_interval = rebuild_interval or settings.REVOCATION_REBUILD_INTERVAL
+
+        self._redis: Optional[redis.Redis] = None
+        self._listener: Optional[asyncio.Task] = None
+        # 구독이 끊기면 이 시각(monotonic)까지 다시 구독하지 않습니다.
+        self._reconnect_at = 0.0
+        self._disconnected = False
+        self._rebuilding: Optional[asyncio.Task] = None
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        self._built_at = 0.0
+        self._synced = False
+        # 진행 중인 필터 재생성별로 그동안 추가된 폐기 ID (교체 전에 새 필터에 반영)
+        self._pending: List[List[str]] = []
+        # 필터 적중을 Redis에서 확인한 결과 (ID -> (폐기 여부, 만료 시각))
+        self._confirmed: "OrderedDict[str, Tuple[bool, float]]" = OrderedDict()
+
+    @staticmethod
+    def revocation_ids(claims: Dict[str, Any], token: str) -> List[str]:
+        """토큰을 폐기할 때 사용하는 ID 목록을 만듭니다.
+
+        Args:
+            claims: 토큰 클레임
+            token: JWT 토큰
+
+        Returns:
+            ``jti``와 ``sid`` 클레임의 ID (둘 다 없으면 토큰 다이제스트)
+        """
+        ids = [
+            f"{claim}:{claims[claim]}" for claim in ("jti", "sid") if claims.get(claim)
+        ]
+        if not ids:
+            ids.append(f"token:{hashlib.sha256(token.encode()).hexdigest()[:32]}")
+        return ids
+
+    def start(self) -> None:
+        """실행 중인 이벤트 루프에서 폐기 알림 구독을 시작합니다."""
+        self._ensure_listener()
+
+    async def close(self) -> None:
+        """구독을 멈추고 Redis 연결을 닫습니다."""
+        for task in (self._listener, self._rebuilding):
+            if task is not None:
+                task.cancel()
+        self._listener = self._rebuilding = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    async def is_revoked(self, claims: Dict[str, Any], token: str) -> bool:
+        """토큰이나 토큰의 세션이 폐기되었는지 확인합니다.
+
+        필터에 없으면 바로 False를 반환합니다. 필터에 있으면 Redis에서 확인하며,
+        이때 Redis를 사용할 수 없으면 폐기된 것으로 봅니다. 필터를 아직 불러오지
+        못한 동안에는 모든 요청을 Redis에서 확인하고, Redis를 사용할 수 없으면
+        통과시킵니다.
+
+        Args:
+            claims: 토큰 클레임
+            token: JWT 토큰
+
+        Returns:
+            폐기되었으면 True
+        """
+        self._ensure_listener()
+        now = time.time()
+        if self._synced and now - self._built_at > self.rebuild_interval:
+            self._schedule_rebuild()
+
+        ids = self.revocation_ids(claims, token)
+        if self._synced:
+            candidates = [
+                revocation_id for revocation_id in ids if revocation_id in self._filter
+            ]
+            if not candidates:
+                REVOCATION_CHECKS_TOTAL.labels(result="miss").inc()
+                return False
+        else:
+            candidates = ids
+
+        unknown = []
+        for revocation_id in candidates:
+            confirmed = self._confirmed.get(revocation_id)
+            if confirmed is None or confirmed[1] <= now:
+                unknown.append(revocation_id)
+            elif confirmed[0]:
+                REVOCATION_CHECKS_TOTAL.labels(result="revoked").inc()
+                return True
+
+        revoked = False
+        if unknown:
+            try:
+                revoked = await self._confirm(unknown, now)
+            except redis.RedisError:
+                logger.warning("토큰 폐기 여부를 확인하지 못했습니다.")
+                revoked = self._synced
+
+        if revoked:
+            result = "revoked"
+        else:
+            result = "false_positive" if self._synced else "unsynced"
+        REVOCATION_CHECKS_TOTAL.labels(result=result).inc()
+        return revoked
+
+    async def revoke(self, revocation_id: str, expires_at: float) -> None:
+        """ID를 폐기하고 모든 워커에 알립니다.
+
+        Args:
+            revocation_id: 폐기할 ID (예: ``jti:<값>``, ``sid:<값>``)
+            expires_at: 폐기 항목을 유지할 시각 (토큰 만료 시각, 유닉스 초)
+
+        Raises:
+            redis.RedisError: 폐기를 저장하지 못한 경우
+        """
+        if expires_at <= time.time():
+            return
+        client = await self._get_redis()
+        await client.zadd(self.key, {revocation_id: expires_at})
+        await client.publish(
+            self.channel, json.dumps({"id": revocation_id, "exp": expires_at})
+        )
+        self._add(revocation_id, expires_at)
+
+    async def revoke_token(self, claims: Dict[str, Any], token: str) -> None:
+        """로그아웃한 토큰 하나를 폐기합니다.
+
+        Args:
+            claims: 토큰 클레임
+            token: JWT 토큰
+
+        Raises:
+            redis.RedisError: 폐기를 저장하지 못한 경우
+        """
+        exp = claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            exp = time.time() + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        for revocation_id in self.revocation_ids(claims, token):
+            if not revocation_id.startswith("sid:"):
+                await self.revoke(revocation_id, exp)
+
+    async def revoke_session(self, session_id: str, expires_at: float) -> None:
+        """세션과 그 세션으로 발급된 모든 토큰을 폐기합니다.
+
+        Args:
+            session_id: 세션 ID (토큰의 ``sid`` 클레임)
+            expires_at: 세션 만료 시각 (유닉스 초)
+
+        Raises:
+            redis.RedisError: 폐기를 저장하지 못한 경우
+        """
+        await self.revoke(f"sid:{session_id}", expires_at)
+
+    async def _confirm(self, revocation_ids: List[str], now: float) -> bool:
+        """필터에 적중한 ID를 Redis에서 확인하고 결과를 보관합니다.
+
+        Args:
+            revocation_ids: 확인할 ID 목록
+            now: 현재 시각
+
+        Returns:
+            하나라도 폐기되었으면 True
+        """
+        client = await self._get_redis()
+        scores = await client.zmscore(self.key, revocation_ids)
+        revoked = False
+        for revocation_id, score in zip(revocation_ids, scores):
+            if score is not None and score > now:
+                self._remember(revocation_id, True, score)
+                revoked = True
+            elif self._synced:
+                # 오탐은 폐기 알림이 올 때까지 유효합니다.
+                self._remember(revocation_id, False, now + self.rebuild_interval)
+        return revoked
+
+    def _remember(self, revocation_id: str, revoked: bool, until: float) -> None:
+        """확인 결과를 보관합니다."""
+        self._confirmed[revocation_id] = (revoked, until)
+        self._confirmed.move_to_end(revocation_id)
+        if len(self._confirmed) > _CONFIRMED_MAX_ENTRIES:
+            self._confirmed.popitem(last=False)
+
+    def _add(self, revocation_id: str, expires_at: float) -> None:
+        """폐기된 ID를 필터에 추가합니다."""
+        self._filter.add(revocation_id)
+        for pending in self._pending:
+            pending.append(revocation_id)
+        self._remember(revocation_id, True, expires_at)
+        REVOCATION_FILTER_ENTRIES.set(self._filter.count)
+        if self._filter.count > self._filter.capacity:
+            # 필터가 가득 차면 오탐률이 올라가므로 만료된 항목을 빼고 새로 만듭니다.
+            self._schedule_rebuild()
+
+    def _schedule_rebuild(self) -> None:
+        """필터를 새로 만드는 작업을 예약합니다."""
+        if self._rebuilding is not None and not self._rebuilding.done():
+            return
+        self._rebuilding = asyncio.get_running_loop().create_task(
+            self._rebuild_safely()
+        )
+
+    async def _rebuild_safely(self) -> None:
+        """필터를 새로 만들고, 실패하면 기존 필터를 유지합니다."""
+        try:
+            await self._rebuild()
+        except redis.RedisError:
+            logger.warning("토큰 폐기 필터를 새로 만들지 못했습니다.")
+
+    async def _rebuild(self) -> None:
+        """Redis의 폐기 목록으로 필터를 새로 만듭니다.
+
+        필터는 이벤트 루프를 막지 않도록 실행기에서 만들고, 그동안 추가된 폐기 ID는
+        교체하기 직전에 새 필터에 반영합니다.
+        """
+        pending: List[str] = []
+        self._pending.append(pending)
+        try:
+            client = await self._get_redis()
+            now = time.time()
+            await client.zremrangebyscore(self.key, "-inf", now)
+            members = await client.zrangebyscore(self.key, now, "+inf")
+
+            bloom = await asyncio.get_running_loop().run_in_executor(
+                None, self._build_filter, members
+            )
+            # 반영과 교체 사이에 await가 없으므로 이후의 추가는 새 필터로 갑니다.
+            for revocation_id in pending:
+                bloom.add(revocation_id)
+            self._filter = bloom
+            self._built_at = now
+            self._synced = True
+            # 구독이 끊긴 동안 폐기된 ID가 이전의 오탐 확인 결과로 통과되지 않도록
+            # 폐기되지 않았다는 확인 결과는 버립니다.
+            self._confirmed = OrderedDict(
+                (revocation_id, confirmed)
+                for revocation_id, confirmed in self._confirmed.items()
+                if confirmed[0]
+            )
+            REVOCATION_FILTER_ENTRIES.set(bloom.count)
+        finally:
+            self._pending = [other for other in self._pending if other is not pending]
+
+    def _build_filter(self, members: List[str]) -> BloomFilter:
+        """폐기 ID 목록으로 블룸 필터를 만듭니다.
+
+        Args:
+            members: 폐기 ID 목록
+
+        Returns:
+            새 블룸 필터
+        """
+        bloom = BloomFilter(max(self.capacity, len(members) * 2), self.error_rate)
+        for member in members:
+            bloom.add(member)
+        return bloom
+
+    async def _get_redis(self) -> redis.Redis:
+        """Redis 클라이언트를 가져옵니다.
+
+        Returns:
+            Redis 클라이언트
+        """
+        if not self._redis:
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    def _ensure_listener(self) -> None:
+        """실행 중인 이벤트 루프에서 폐기 알림 구독 태스크를 시작합니다.
+
+        구독이 끊긴 뒤에는 ``reconnect_interval``이 지날 때까지 다시 시작하지 않습니다.
+        """
+        if self._listener is not None and not self._listener.done():
+            return
+        if time.monotonic() < self._reconnect_at:
+            return
+        self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        """폐기 알림을 구독하고 필터에 반영합니다."""
+        redis_client = await self._get_redis()
+        pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self.channel)
+            # 구독한 뒤에 목록을 불러와야 그 사이의 폐기를 놓치지 않습니다.
+            await self._rebuild()
+            self._disconnected = False
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                self._apply_revocation(message["data"])
+        except redis.RedisError:
+            # 연결이 끊기면 잠시 뒤의 확인에서 구독을 다시 시작하고 필터를 새로 만듭니다.
+            self._reconnect_at = time.monotonic() + self.reconnect_interval
+            if not self._disconnected:
+                self._disconnected = True
+                logger.warning("토큰 폐기 구독이 중단되었습니다.")
+        finally:
+            await pubsub.reset()
+
+    def _apply_revocation(self, data: str) -> None:
+        """수신한 폐기 알림을 필터에 반영합니다.
+
+        Args:
+            data: JSON 형식의 폐기 알림
+        """
+        try:
+            message = json.loads(data)
+            revocation_id, expires_at = message["id"], float(message["exp"])
+        except (ValueError, KeyError, TypeError):
+            return
+        self._add(revocation_id, expires_at)
+
+
+# 애플리케이션 전체에서 공유하는 폐기 목록
+revocation_list = RevocationList()
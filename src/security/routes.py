@@ -0,0 +1,372 @@
+"""경로 템플릿별 정책을 등록하고 접두사 트리로 컴파일합니다.
+
+라우트 데코레이터(``route_policy``)와 ``AUTH_ROUTE_POLICIES`` 설정으로 경로마다
+인증 방식(공개, 인증 필요, API 키), 필요한 권한 범위, 요청 제한, 응답 캐시 시간을
+등록합니다. 애플리케이션 시작 시 등록부를 경로 템플릿의 접두사 트리 하나로
+컴파일하므로, 요청마다 적용할 정책은 경로 길이에 비례하는 한 번의 조회로 정해집니다.
+인증 미들웨어, 요청 제한, 응답 캐시가 같은 등록부를 사용합니다.
+"""
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from pydantic import BaseModel, Field
+from starlette.routing import BaseRoute
+
+from ..core.settings import get_settings
+
+settings = get_settings()
+
+T = TypeVar("T")
+
+# 엔드포인트 함수에 경로 정책을 담는 속성 이름
+_POLICY_ATTRIBUTE = "__route_policy__"
+
+# 경로별 라우트 템플릿 조회 결과를 기억할 최대 경로 수
+_TEMPLATE_CACHE_SIZE = 4096
+
+
+class _RouteNode:
+    """경로 트리의 노드입니다."""
+
+    __slots__ = ("children", "param", "values", "tail_values")
+
+    def __init__(self):
+        """빈 노드를 초기화합니다."""
+        self.children: Dict[str, "_RouteNode"] = {}
+        self.param: Optional["_RouteNode"] = None
+        # 경로가 이 노드에서 끝날 때 일치하는 값
+        self.values: List[Tuple[int, Any]] = []
+        # 이 노드 아래의 모든 경로에 일치하는 값 (끝의 ``*``)
+        self.tail_values: List[Tuple[int, Any]] = []
+
+
+class RouteTrie(Generic[T]):
+    """경로 템플릿을 경로 단계별 접두사 트리로 컴파일합니다.
+
+    템플릿 문법:
+        ``/api/v1/users``: 정확히 일치
+        ``/api/v1/users/{user_id}``: ``{...}`` 단계는 임의의 한 단계와 일치
+        ``/api/v1/*``: 끝의 ``*``는 0개 이상의 나머지 단계와 일치
+        ``/files/{file_path:path}``: FastAPI의 경로 매개변수는 끝의 ``*``와 같음
+    """
+
+    def __init__(self):
+        """빈 트리를 초기화합니다."""
+        self._root = _RouteNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """등록된 템플릿 수를 반환합니다."""
+        return self._size
+
+    def add(self, template: str, value: T) -> None:
+        """경로 템플릿에 값을 등록합니다.
+
+        Args:
+            template: 경로 템플릿
+            value: 일치할 때 반환할 값
+
+        Raises:
+            ValueError: ``*``가 마지막 단계가 아닌 경우
+        """
+        segments = _split_path(template)
+        node = self._root
+        entry = (self._size, value)
+        for index, segment in enumerate(segments):
+            if _is_tail(segment):
+                if index != len(segments) - 1:
+                    raise ValueError(
+                        f"'*'는 경로 템플릿의 마지막에만 올 수 있습니다: {template}"
+                    )
+                node.tail_values.append(entry)
+                break
+            if segment.startswith("{") and segment.endswith("}"):
+                if node.param is None:
+                    node.param = _RouteNode()
+                node = node.param
+            else:
+                node = node.children.setdefault(segment, _RouteNode())
+        else:
+            node.values.append(entry)
+        self._size += 1
+
+    def match(self, path: str) -> List[T]:
+        """경로와 일치하는 값을 등록 순서대로 반환합니다.
+
+        Args:
+            path: 요청 경로
+
+        Returns:
+            일치하는 값 목록
+        """
+        found: List[Tuple[int, Any]] = []
+        nodes = [self._root]
+        for segment in _split_path(path):
+            next_nodes = []
+            for node in nodes:
+                found.extend(node.tail_values)
+                child = node.children.get(segment)
+                if child is not None:
+                    next_nodes.append(child)
+                if node.param is not None:
+                    next_nodes.append(node.param)
+            nodes = next_nodes
+            if not nodes:
+                break
+        for node in nodes:
+            found.extend(node.values)
+            found.extend(node.tail_values)
+        found.sort(key=lambda entry: entry[0])
+        return [value for _, value in found]
+
+
+def _split_path(path: str) -> List[str]:
+    """경로를 비어 있지 않은 단계 목록으로 나눕니다."""
+    return [segment for segment in path.split("/") if segment]
+
+
+def _is_tail(segment: str) -> bool:
+    """나머지 경로 전체와 일치하는 템플릿 단계인지 확인합니다."""
+    return segment == "*" or (segment.startswith("{") and segment.endswith(":path}"))
+
+
+class RoutePolicy(BaseModel):
+    """경로 정책 모델입니다."""
+
+    route: str = Field(
+        "/*", description="경로 템플릿 (``{name}``은 한 단계, 끝의 ``*``는 나머지 전체)"
+    )
+    methods: List[str] = Field(
+        default_factory=list, description="적용할 HTTP 메서드 (비어 있으면 전체)"
+    )
+    access: Literal["public", "authenticated", "api_key"] = Field(
+        "authenticated", description="인증 방식 (public이면 인증 없이 허용)"
+    )
+    scopes: List[str] = Field(
+        default_factory=list, description="필요한 JWT 권한 범위 (모두 있어야 함)"
+    )
+    rate_limit: Optional[Dict[str, Any]] = Field(
+        None,
+        description="라우트별 요청 제한 (``RateLimitPolicy``의 limit, period, key 등)",
+    )
+    cache_ttl: Optional[int] = Field(
+        None,
+        ge=0,
+        description="응답 캐시 신선도 유지 시간(초, 없으면 기본값, 0이면 캐시하지 않음)",
+    )
+
+
+def route_policy(
+    access: Literal["public", "authenticated", "api_key"] = "authenticated",
+    scopes: Optional[List[str]] = None,
+    rate_limit: Optional[Dict[str, Any]] = None,
+    cache_ttl: Optional[int] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """엔드포인트에 경로 정책을 지정하는 데코레이터를 만듭니다.
+
+    라우터 데코레이터보다 아래(먼저 적용되는 위치)에 둡니다. 경로와 메서드는
+    등록부를 컴파일할 때 라우트에서 가져옵니다.
+
+    예:
+        @router.get("/cache/top-keys")
+        @route_policy(scopes=["admin"], cache_ttl=0)
+        async def cache_top_keys(...): ...
+
+    Args:
+        access: 인증 방식
+        scopes: 필요한 JWT 권한 범위
+        rate_limit: 라우트별 요청 제한
+        cache_ttl: 응답 캐시 신선도 유지 시간(초, 0이면 캐시하지 않음)
+
+    Returns:
+        엔드포인트 함수를 그대로 반환하는 데코레이터
+    """
+    policy = RoutePolicy(
+        access=access,
+        scopes=scopes or [],
+        rate_limit=rate_limit,
+        cache_ttl=cache_ttl,
+    )
+
+    def decorator(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        setattr(endpoint, _POLICY_ATTRIBUTE, policy)
+        return endpoint
+
+    return decorator
+
+
+def _specificity(template: str) -> Tuple[int, int, int]:
+    """경로 템플릿의 구체성을 계산합니다. 값이 클수록 더 구체적입니다.
+
+    Args:
+        template: 경로 템플릿
+
+    Returns:
+        (고정 길이 단계 수, 리터럴 단계 수, 끝의 ``*``가 없으면 1)
+    """
+    segments = _split_path(template)
+    tail = bool(segments) and _is_tail(segments[-1])
+    if tail:
+        segments = segments[:-1]
+    literals = sum(1 for segment in segments if not segment.startswith("{"))
+    return len(segments), literals, int(not tail)
+
+
+class RouteRegistry:
+    """경로 정책 등록부입니다.
+
+    요청에 일치하는 정책이 여러 개면 가장 구체적인 템플릿의 정책을 사용하고,
+    구체성이 같으면 나중에 등록된 정책(설정이 데코레이터보다 나중)을 사용합니다.
+    일치하는 정책이 없으면 인증이 필요한 기본 정책을 사용합니다.
+    """
+
+    def __init__(self, policies: Optional[Iterable[Any]] = None):
+        """등록부를 초기화합니다.
+
+        Args:
+            policies: 정책 목록 (없으면 ``AUTH_ROUTE_POLICIES`` 설정)
+        """
+        if policies is None:
+            policies = settings.AUTH_ROUTE_POLICIES
+        self.default = RoutePolicy()
+        self._policies: List[RoutePolicy] = []
+        self._decorated: List[RoutePolicy] = []
+        self._trie: Optional[
+            RouteTrie[Tuple[Tuple[int, int, int], int, RoutePolicy]]
+        ] = None
+        self._templates: RouteTrie[Tuple[Tuple[int, int, int], str]] = RouteTrie()
+        self._template_cache: Dict[str, Optional[str]] = {}
+        for policy in policies:
+            self.add(policy)
+
+    def add(self, policy: Any) -> None:
+        """정책을 등록합니다. 다음 조회 전에 다시 컴파일됩니다.
+
+        Args:
+            policy: ``RoutePolicy`` 또는 같은 형식의 딕셔너리
+        """
+        if not isinstance(policy, RoutePolicy):
+            policy = RoutePolicy(**policy)
+        self._policies.append(policy)
+        self._trie = None
+
+    def compile(self, routes: Optional[Iterable[BaseRoute]] = None) -> None:
+        """라우트의 데코레이터 정책을 모으고 등록부를 접두사 트리로 컴파일합니다.
+
+        Args:
+            routes: 애플리케이션 라우트 (예: ``app.routes``, 없으면 이전에 모은 정책 사용)
+        """
+        if routes is not None:
+            routes = list(routes)
+            self._decorated = self._collect(routes)
+            templates: RouteTrie[Tuple[Tuple[int, int, int], str]] = RouteTrie()
+            for path in {getattr(route, "path", None) for route in routes} - {None}:
+                templates.add(path, (_specificity(path), path))
+            self._templates = templates
+            self._template_cache = {}
+
+        trie: RouteTrie[Tuple[Tuple[int, int, int], int, RoutePolicy]] = RouteTrie()
+        for order, policy in enumerate([*self._decorated, *self._policies]):
+            trie.add(policy.route, (_specificity(policy.route), order, policy))
+        self._trie = trie
+
+    @staticmethod
+    def _collect(routes: Iterable[BaseRoute]) -> List[RoutePolicy]:
+        """라우트 엔드포인트에 지정된 정책을 모읍니다.
+
+        Args:
+            routes: 애플리케이션 라우트
+
+        Returns:
+            라우트의 경로와 메서드가 채워진 정책 목록
+        """
+        decorated = []
+        for route in routes:
+            policy = getattr(getattr(route, "endpoint", None), _POLICY_ATTRIBUTE, None)
+            path = getattr(route, "path", None)
+            if policy is None or path is None:
+                continue
+            methods = policy.methods or sorted(getattr(route, "methods", None) or ())
+            decorated.append(
+                policy.model_copy(update={"route": path, "methods": methods})
+            )
+        return decorated
+
+    def resolve(self, path: str, method: str) -> RoutePolicy:
+        """요청에 적용할 정책을 찾습니다.
+
+        Args:
+            path: 요청 경로
+            method: HTTP 메서드
+
+        Returns:
+            가장 구체적으로 일치하는 정책 (없으면 기본 정책)
+        """
+        if self._trie is None:
+            self.compile()
+        best = None
+        for entry in self._trie.match(path):
+            policy = entry[2]
+            if policy.methods and method not in policy.methods:
+                continue
+            if best is None or entry[:2] > best[:2]:
+                best = entry
+        return best[2] if best is not None else self.default
+
+    def template(self, path: str) -> Optional[str]:
+        """요청 경로와 일치하는 애플리케이션 라우트의 경로 템플릿을 찾습니다.
+
+        메트릭 레이블처럼 값의 종류가 라우트 수로 제한되어야 하는 곳에서 원래
+        경로 대신 사용합니다. 최근 조회한 경로의 결과는 기억해 둡니다.
+
+        Args:
+            path: 요청 경로
+
+        Returns:
+            가장 구체적으로 일치하는 경로 템플릿 (예: ``/api/v1/documents/{document_id}``),
+            일치하는 라우트가 없으면 None
+        """
+        try:
+            return self._template_cache[path]
+        except KeyError:
+            pass
+        matches = self._templates.match(path)
+        template = max(matches)[1] if matches else None
+        if len(self._template_cache) >= _TEMPLATE_CACHE_SIZE:
+            self._template_cache.clear()
+        self._template_cache[path] = template
+        return template
+
+    def rate_limit_policies(self) -> List[Dict[str, Any]]:
+        """라우트별 요청 제한을 요청 제한 정책 표 형식으로 반환합니다.
+
+        Returns:
+            ``RateLimitPolicy`` 형식의 딕셔너리 목록
+        """
+        if self._trie is None:
+            self.compile()
+        return [
+            {
+                **policy.rate_limit,
+                "name": f"route:{','.join(policy.methods) or '*'}:{policy.route}",
+                "route": policy.route,
+                "methods": policy.methods,
+            }
+            for policy in [*self._decorated, *self._policies]
+            if policy.rate_limit
+        ]
+
+
+# 애플리케이션 전체에서 공유하는 경로 정책 등록부
+route_registry = RouteRegistry()
@@ -0,0 +1,115 @@
+"""검증된 JWT 클레임을 재사용하는 캐시 모듈입니다.
+
+같은 토큰으로 들어오는 요청마다 서명 검증과 JSON 파싱을 반복하지 않도록, 검증에
+성공한 토큰의 클레임을 토큰 다이제스트를 키로 하는 LRU에 보관합니다. 항목은
+토큰의 ``exp`` 시각(최대 ``max_ttl``)에 만료되며, 다이제스트는 서명 키와
+알고리즘을 함께 사용하므로 다른 키로 발급된 토큰이 캐시를 통해 통과하지 않습니다.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from jose import jwt
+
+from ..core.settings import get_settings
+
+settings = get_settings()
+
+
+class VerifiedTokenCache:
+    """검증된 JWT 클레임의 LRU 캐시입니다."""
+
+    def __init__(
+        self, max_entries: Optional[int] = None, max_ttl: Optional[float] = None
+    ):
+        """캐시를 초기화합니다.
+
+        Args:
+            max_entries: 최대 항목 수
+            max_ttl: 토큰 만료 시각과 관계없이 항목을 유지하는 최대 시간(초)
+        """
+        self.max_entries = max_entries or settings.AUTH_TOKEN_CACHE_MAX_ENTRIES
+        self.max_ttl = max_ttl or settings.AUTH_TOKEN_CACHE_TTL
+        self._entries: "OrderedDict[bytes, Tuple[Dict[str, Any], float]]" = (
+            OrderedDict()
+        )
+        self._keys: Dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        """캐시된 토큰 수를 반환합니다."""
+        return len(self._entries)
+
+    def decode(
+        self,
+        token: str,
+        secret_key: Optional[str] = None,
+        algorithm: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """토큰을 검증하고 클레임을 반환합니다. 캐시에 있으면 검증을 생략합니다.
+
+        Args:
+            token: JWT 토큰
+            secret_key: 서명 키 (없으면 ``SECRET_KEY`` 설정)
+            algorithm: 서명 알고리즘 (없으면 ``ALGORITHM`` 설정)
+
+        Returns:
+            클레임 (호출자가 수정해도 캐시에 영향이 없는 복사본)
+
+        Raises:
+            JWTError: 토큰이 유효하지 않은 경우
+        """
+        secret_key = secret_key or settings.SECRET_KEY
+        algorithm = algorithm or settings.ALGORITHM
+        digest = self._digest(token, secret_key, algorithm)
+        now = time.time()
+
+        entry = self._entries.get(digest)
+        if entry is not None:
+            claims, expires_at = entry
+            if expires_at > now:
+                self._entries.move_to_end(digest)
+                return dict(claims)
+            del self._entries[digest]
+
+        claims = jwt.decode(token, secret_key, algorithms=[algorithm])
+        expires_at = now + self.max_ttl
+        exp = claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, exp)
+        if expires_at > now:
+            self._entries[digest] = (claims, expires_at)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return dict(claims)
+
+    def clear(self) -> None:
+        """모든 항목을 지웁니다."""
+        self._entries.clear()
+
+    def _digest(self, token: str, secret_key: str, algorithm: str) -> bytes:
+        """서명 키와 알고리즘에 묶인 토큰 다이제스트를 계산합니다.
+
+        Args:
+            token: JWT 토큰
+            secret_key: 서명 키
+            algorithm: 서명 알고리즘
+
+        Returns:
+            다이제스트
+        """
+        key = self._keys.get(secret_key)
+        if key is None:
+            # blake2b 키는 64바이트까지만 허용되므로 서명 키를 해시하여 사용합니다.
+            key = self._keys[secret_key] = hashlib.sha256(secret_key.encode()).digest()
+        return hashlib.blake2b(
+            token.encode(),
+            key=key,
+            person=algorithm.encode()[:16],
+            digest_size=32,
+        ).digest()
+
+
+# 애플리케이션 전체에서 공유하는 캐시
+token_cache = VerifiedTokenCache()
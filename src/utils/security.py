@@ -8,7 +8,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 import jwt
-from passlib.context import CryptContext
+
+from ..security.password import pwd_context
 
 
 def generate_salt(length: int = 32) -> str:
@@ -36,7 +37,6 @@ def hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
     if salt is None:
         salt = generate_salt()
 
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     hashed = pwd_context.hash(password + salt)
     return hashed, salt
 
@@ -52,7 +52,6 @@ def verify_password(password: str, hashed: str, salt: str) -> bool:
     Returns:
         검증 성공 여부
     """
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
     return pwd_context.verify(password + salt, hashed)
 
 
@@ -0,0 +1,17 @@
+"""테스트 공용 픽스처를 정의합니다."""
+
+from typing import AsyncIterator
+
+import fakeredis
+import pytest
+
+
+@pytest.fixture
+async def redis_client() -> AsyncIterator[fakeredis.FakeAsyncRedis]:
+    """Lua 스크립트를 실행할 수 있는 메모리 Redis 클라이언트를 제공합니다."""
+    client = fakeredis.FakeAsyncRedis()
+    try:
+        yield client
+    finally:
+        await client.flushall()
+        await client.aclose()
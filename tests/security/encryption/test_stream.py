@@ -0,0 +1,118 @@
+"""스트리밍 AEAD의 복호화와 변조 감지를 검증합니다."""
+
+import os
+import struct
+from typing import AsyncIterable, List
+
+import pytest
+
+from src.security.encryption.stream import (
+    MAX_CHUNK_SIZE,
+    decrypt_stream,
+    encrypt_stream,
+)
+
+KEY = os.urandom(32)
+CHUNK_SIZE = 16
+PLAINTEXT = bytes(range(256)) * 2
+
+
+async def collect(stream: AsyncIterable[bytes]) -> List[bytes]:
+    """비동기 스트림의 조각을 모두 모읍니다."""
+    return [chunk async for chunk in stream]
+
+
+async def encrypt(plaintext: bytes = PLAINTEXT) -> List[bytes]:
+    """평문을 암호화하여 헤더와 조각 목록을 반환합니다."""
+    return await collect(encrypt_stream(KEY, [plaintext], CHUNK_SIZE))
+
+
+async def decrypt(parts: List[bytes]) -> bytes:
+    """암호화된 조각 목록을 복호화합니다."""
+    return b"".join(await collect(decrypt_stream(KEY, parts)))
+
+
+@pytest.mark.parametrize(
+    "plaintext",
+    [b"", b"x", b"y" * CHUNK_SIZE, b"z" * (CHUNK_SIZE * 3 + 5), PLAINTEXT],
+)
+async def test_round_trip(plaintext):
+    """조각 크기와 무관하게 원래 평문을 복원합니다."""
+    assert await decrypt(await encrypt(plaintext)) == plaintext
+
+
+async def test_input_boundaries_do_not_matter():
+    """암호문을 임의 크기로 나누어 넣어도 복호화됩니다."""
+    data = b"".join(await encrypt())
+    pieces = [data[i : i + 7] for i in range(0, len(data), 7)]
+    assert await decrypt(pieces) == PLAINTEXT
+
+
+async def test_dropping_last_chunk_is_detected():
+    """조각 경계에서 잘린 스트림을 감지합니다."""
+    parts = await encrypt()
+    with pytest.raises(ValueError):
+        await decrypt(parts[:-1])
+
+
+async def test_truncation_inside_chunk_is_detected():
+    """조각 중간에서 잘린 스트림을 감지합니다."""
+    data = b"".join(await encrypt())
+    with pytest.raises(ValueError):
+        await decrypt([data[:-5]])
+
+
+async def test_header_only_is_detected():
+    """조각이 하나도 없는 스트림을 감지합니다."""
+    parts = await encrypt()
+    with pytest.raises(ValueError):
+        await decrypt(parts[:1])
+
+
+async def test_reordered_chunks_are_detected():
+    """조각의 순서가 바뀐 스트림을 감지합니다."""
+    parts = await encrypt()
+    parts[1], parts[2] = parts[2], parts[1]
+    with pytest.raises(ValueError):
+        await decrypt(parts)
+
+
+async def test_chunks_from_another_stream_are_detected():
+    """다른 스트림의 조각을 섞으면 감지합니다."""
+    parts, other = await encrypt(), await encrypt()
+    parts[2] = other[2]
+    with pytest.raises(ValueError):
+        await decrypt(parts)
+
+
+async def test_tampered_chunk_is_detected():
+    """조각의 비트가 바뀌면 감지합니다."""
+    parts = await encrypt()
+    tampered = bytearray(parts[1])
+    tampered[0] ^= 1
+    parts[1] = bytes(tampered)
+    with pytest.raises(ValueError):
+        await decrypt(parts)
+
+
+async def test_wrong_key_is_detected():
+    """다른 키로는 복호화할 수 없습니다."""
+    parts = await encrypt()
+    with pytest.raises(ValueError):
+        await collect(decrypt_stream(os.urandom(32), parts))
+
+
+async def test_oversized_chunk_header_is_rejected():
+    """헤더의 조각 크기가 한도를 넘으면 메모리를 잡기 전에 거부합니다."""
+    parts = await encrypt()
+    header = bytearray(parts[0])
+    header[-4:] = struct.pack(">I", MAX_CHUNK_SIZE + 1)
+    with pytest.raises(ValueError):
+        await decrypt([bytes(header)] + parts[1:])
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1, MAX_CHUNK_SIZE + 1])
+async def test_invalid_chunk_size_is_rejected(chunk_size):
+    """허용 범위를 벗어난 조각 크기로는 암호화하지 않습니다."""
+    with pytest.raises(ValueError):
+        await collect(encrypt_stream(KEY, [b"data"], chunk_size))
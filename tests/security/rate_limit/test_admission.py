@@ -0,0 +1,153 @@
+"""요청 수락 제어기를 검증합니다."""
+
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from src.security.rate_limit.admission import AdmissionController, AdmissionRejected
+
+
+def make_controller(**overrides) -> AdmissionController:
+    """슬롯 하나와 넉넉한 대기열을 가진 수락 제어기를 만듭니다."""
+    options = {
+        "max_concurrency": 1,
+        "max_per_user": 10,
+        "max_queue": 10,
+        "queue_timeout": 10,
+    }
+    options.update(overrides)
+    return AdmissionController(**options)
+
+
+async def settle() -> None:
+    """대기 중인 태스크가 한 단계씩 진행되도록 이벤트 루프를 양보합니다."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def start_waiter(
+    controller: AdmissionController,
+    order: List[str],
+    name: str,
+    identity: Optional[str] = None,
+) -> asyncio.Task:
+    """슬롯을 얻으면 이름을 기록하는 태스크를 시작합니다."""
+
+    async def wait() -> None:
+        await controller.acquire(identity)
+        order.append(name)
+
+    return asyncio.create_task(wait())
+
+
+async def test_slots_are_handed_off_in_fifo_order():
+    """반납된 슬롯은 대기열 순서대로 넘겨집니다."""
+    controller = make_controller()
+    order: List[str] = []
+    await controller.acquire()
+
+    waiters = []
+    for name in ("b", "c", "d"):
+        waiters.append(start_waiter(controller, order, name))
+        await settle()
+    assert controller.queued == 3
+
+    for expected in (["b"], ["b", "c"], ["b", "c", "d"]):
+        controller.release()
+        await settle()
+        assert order == expected
+        # 슬롯은 반납되지 않고 그대로 다음 요청에 넘어갑니다.
+        assert controller.active == 1
+
+    controller.release()
+    assert controller.active == 0
+    await asyncio.gather(*waiters)
+
+
+async def test_cancelled_waiter_leaves_the_queue():
+    """대기 중에 취소된 요청은 대기열과 사용자별 사용 수에서 빠집니다."""
+    controller = make_controller()
+    await controller.acquire()
+    waiter = start_waiter(controller, [], "b", identity="user")
+    await settle()
+    assert controller.queued == 1
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert controller.queued == 0
+    assert controller._per_user == {}
+    controller.release()
+    assert controller.active == 0
+
+
+async def test_cancelled_after_handoff_passes_slot_on():
+    """슬롯을 넘겨받은 직후 취소된 요청은 슬롯을 다음 요청에 넘겨줍니다."""
+    controller = make_controller()
+    order: List[str] = []
+    await controller.acquire()
+    first = start_waiter(controller, order, "b")
+    await settle()
+    second = start_waiter(controller, order, "c")
+    await settle()
+
+    # 슬롯을 넘겨준 뒤, 첫 번째 요청이 깨어나기 전에 취소합니다.
+    controller.release()
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    await second
+
+    assert order == ["c"]
+    assert controller.active == 1
+    controller.release()
+    assert controller.active == 0
+
+
+async def test_per_user_limit_rejects_with_429():
+    """사용자별 한도를 넘으면 다른 사용자와 무관하게 429로 거부합니다."""
+    controller = make_controller(max_concurrency=5, max_per_user=1)
+    await controller.acquire("alice")
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        await controller.acquire("alice")
+    assert excinfo.value.status_code == 429
+    assert excinfo.value.reason == "user_limit"
+    assert excinfo.value.retry_after > 0
+
+    await controller.acquire("bob")
+    assert controller.active == 2
+
+    controller.release("alice")
+    await controller.acquire("alice")
+    assert controller.active == 2
+
+
+async def test_queued_requests_count_toward_user_limit():
+    """대기 중인 요청도 사용자별 한도에 포함됩니다."""
+    controller = make_controller(max_per_user=2)
+    await controller.acquire("alice")
+    waiter = start_waiter(controller, [], "b", identity="alice")
+    await settle()
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        await controller.acquire("alice")
+    assert excinfo.value.status_code == 429
+
+    controller.release("alice")
+    await waiter
+    controller.release("alice")
+    assert controller.active == 0
+
+
+async def test_full_queue_rejects_with_503():
+    """대기열이 가득 차면 기다리지 않고 503으로 거부합니다."""
+    controller = make_controller(max_queue=0)
+    await controller.acquire()
+
+    with pytest.raises(AdmissionRejected) as excinfo:
+        await controller.acquire()
+    assert excinfo.value.status_code == 503
+    assert excinfo.value.reason == "queue_full"
@@ -0,0 +1,93 @@
+"""요청 제한 Lua 스크립트를 검증합니다."""
+
+import pytest
+
+from src.security.rate_limit.algorithms import (
+    RATE_LIMIT_SCRIPTS,
+    register_rate_limit_script,
+    run_rate_limit_script,
+)
+from src.security.rate_limit.base import rate_limit_key
+
+LIMIT = 3
+# 테스트 도중 창이 바뀌지 않도록 기간을 길게 잡습니다.
+PERIOD = 3600
+
+pytestmark = pytest.mark.parametrize("algorithm", sorted(RATE_LIMIT_SCRIPTS))
+
+
+async def test_allows_up_to_limit_then_denies(redis_client, algorithm):
+    """허용 요청 수까지는 허용하고, 그 다음 요청은 재시도 시간과 함께 거부합니다."""
+    script = register_rate_limit_script(redis_client, algorithm)
+    key = rate_limit_key("client", algorithm)
+
+    for expected_remaining in range(LIMIT - 1, -1, -1):
+        result = await run_rate_limit_script(script, key, LIMIT, PERIOD)
+        assert result.allowed
+        assert result.limit == LIMIT
+        assert result.remaining == expected_remaining
+        assert result.retry_after == 0
+        assert 0 < result.reset_after <= PERIOD
+
+    denied = await run_rate_limit_script(script, key, LIMIT, PERIOD)
+    assert not denied.allowed
+    assert denied.remaining == 0
+    # 슬라이딩 창 카운터는 이전 창의 가중치가 줄어들 때까지 다음 창에서도 기다릴 수 있습니다.
+    assert 0 < denied.retry_after <= 2 * PERIOD
+
+
+async def test_cost_zero_peeks_without_debiting(redis_client, algorithm):
+    """비용 0 조회는 남은 요청 수를 바꾸지 않습니다."""
+    script = register_rate_limit_script(redis_client, algorithm)
+    key = rate_limit_key("client", algorithm)
+
+    await run_rate_limit_script(script, key, LIMIT, PERIOD)
+    await run_rate_limit_script(script, key, LIMIT, PERIOD)
+    for _ in range(3):
+        peek = await run_rate_limit_script(script, key, LIMIT, PERIOD, cost=0)
+        assert peek.allowed
+        assert peek.remaining == LIMIT - 2
+
+    last = await run_rate_limit_script(script, key, LIMIT, PERIOD)
+    assert last.allowed
+    assert last.remaining == 0
+
+
+async def test_cost_zero_on_fresh_key_stores_nothing(redis_client, algorithm):
+    """처음 보는 키를 비용 0으로 조회해도 키가 만들어지지 않습니다."""
+    script = register_rate_limit_script(redis_client, algorithm)
+    key = rate_limit_key("client", algorithm)
+
+    peek = await run_rate_limit_script(script, key, LIMIT, PERIOD, cost=0)
+    assert peek.allowed
+    assert peek.remaining == LIMIT
+    assert not await redis_client.exists(key)
+
+
+async def test_denied_request_is_not_recorded(redis_client, algorithm):
+    """거부된 요청의 비용은 기록되지 않습니다."""
+    script = register_rate_limit_script(redis_client, algorithm)
+    key = rate_limit_key("client", algorithm)
+
+    over = await run_rate_limit_script(script, key, LIMIT, PERIOD, cost=LIMIT + 1)
+    assert not over.allowed
+    assert over.retry_after > 0
+
+    result = await run_rate_limit_script(script, key, LIMIT, PERIOD, cost=LIMIT)
+    assert result.allowed
+    assert result.remaining == 0
+
+
+async def test_clients_are_counted_separately(redis_client, algorithm):
+    """클라이언트마다 다른 키로 집계합니다."""
+    script = register_rate_limit_script(redis_client, algorithm)
+
+    for _ in range(LIMIT):
+        await run_rate_limit_script(
+            script, rate_limit_key("a", algorithm), LIMIT, PERIOD
+        )
+    other = await run_rate_limit_script(
+        script, rate_limit_key("b", algorithm), LIMIT, PERIOD
+    )
+    assert other.allowed
+    assert other.remaining == LIMIT - 1
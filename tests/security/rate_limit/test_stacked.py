@@ -0,0 +1,81 @@
+"""여러 제한을 한 번에 검사하는 Lua 스크립트를 검증합니다."""
+
+import pytest
+
+from src.security.rate_limit.algorithms import (
+    RATE_LIMIT_SCRIPTS,
+    register_rate_limit_script,
+    register_stacked_rate_limit_script,
+    run_rate_limit_script,
+    run_stacked_rate_limit_script,
+)
+from src.security.rate_limit.base import rate_limit_key
+
+PERIOD = 3600
+
+
+async def peek(redis_client, key: str, algorithm: str, limit: int) -> int:
+    """상태를 바꾸지 않고 키의 남은 요청 수를 조회합니다."""
+    script = register_rate_limit_script(redis_client, algorithm)
+    result = await run_rate_limit_script(script, key, limit, PERIOD, cost=0)
+    return result.remaining
+
+
+async def test_all_limits_debited_when_allowed(redis_client):
+    """모든 제한을 통과하면 각 제한에 비용이 반영됩니다."""
+    script = register_stacked_rate_limit_script(redis_client)
+    checks = [
+        (rate_limit_key("u", "fixed_window", "minute"), "fixed_window", 5, PERIOD),
+        (rate_limit_key("u", "token_bucket", "burst"), "token_bucket", 3, PERIOD),
+    ]
+
+    allowed, results = await run_stacked_rate_limit_script(script, checks, cost=2)
+
+    assert allowed
+    assert [result.remaining for result in results] == [3, 1]
+    assert await peek(redis_client, checks[0][0], "fixed_window", 5) == 3
+    assert await peek(redis_client, checks[1][0], "token_bucket", 3) == 1
+
+
+@pytest.mark.parametrize("algorithm", sorted(RATE_LIMIT_SCRIPTS))
+async def test_rejection_debits_no_limit(redis_client, algorithm):
+    """한 제한이라도 거부하면 어느 제한에도 비용이 반영되지 않습니다."""
+    script = register_stacked_rate_limit_script(redis_client)
+    loose = (rate_limit_key("u", algorithm, "loose"), algorithm, 10, PERIOD)
+    strict = (rate_limit_key("u", algorithm, "strict"), algorithm, 1, PERIOD)
+
+    allowed, _ = await run_stacked_rate_limit_script(script, [loose, strict])
+    assert allowed
+
+    for _ in range(3):
+        allowed, results = await run_stacked_rate_limit_script(script, [loose, strict])
+        assert not allowed
+        assert results[0].allowed
+        assert not results[1].allowed
+        assert results[1].retry_after > 0
+
+    assert await peek(redis_client, loose[0], algorithm, 10) == 9
+    assert await peek(redis_client, strict[0], algorithm, 1) == 0
+
+
+async def test_cost_zero_peeks_every_limit(redis_client):
+    """비용 0 검사는 어느 제한도 바꾸지 않습니다."""
+    script = register_stacked_rate_limit_script(redis_client)
+    checks = [
+        (rate_limit_key("u", "sliding_log", "a"), "sliding_log", 2, PERIOD),
+        (rate_limit_key("u", "sliding_window", "b"), "sliding_window", 4, PERIOD),
+    ]
+
+    allowed, results = await run_stacked_rate_limit_script(script, checks, cost=0)
+
+    assert allowed
+    assert [result.remaining for result in results] == [2, 4]
+    assert not await redis_client.exists(*(key for key, _, _, _ in checks))
+
+
+async def test_unknown_algorithm_is_rejected(redis_client):
+    """지원하지 않는 알고리즘은 스크립트를 실행하기 전에 거부합니다."""
+    script = register_stacked_rate_limit_script(redis_client)
+
+    with pytest.raises(ValueError):
+        await run_stacked_rate_limit_script(script, [("key", "leaky_bucket", 1, 60)])